@@ -3,9 +3,11 @@ autoparse
 *********
 """
 from ._conv import cast
+from ._conv import cast_array
 #: pattern generators
 from . import pattern
+from . import bpattern
 #: text parsers
 from . import find
 
-__all__ = ['pattern', 'find', 'cast']
+__all__ = ['pattern', 'bpattern', 'find', 'cast', 'cast_array']
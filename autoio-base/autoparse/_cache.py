@@ -0,0 +1,87 @@
+""" size-bounded LRU cache of compiled re patterns
+
+Shared by every function in autoparse.find so that the large composite
+patterns built by the readers are only compiled once per process.
+"""
+
+import re
+from collections import OrderedDict
+
+DEFAULT_MAXSIZE = 2048
+
+
+class PatternCache():
+    """ least-recently-used cache of compiled patterns, keyed by
+        (pattern, flags)
+    """
+
+    def __init__(self, maxsize=DEFAULT_MAXSIZE):
+        self._dct = OrderedDict()
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def compile(self, pattern, flags=0):
+        """ get the compiled pattern, compiling and storing it if needed
+
+        :param pattern: pattern string or pre-compiled pattern
+        :type pattern: str, bytes, or re.Pattern
+        :param flags: re flags to compile the pattern with
+        :type flags: int
+        :rtype: re.Pattern
+        """
+        if isinstance(pattern, re.Pattern):
+            if (pattern.flags & flags) == flags:
+                return pattern
+            flags |= pattern.flags
+            pattern = pattern.pattern
+
+        key = (type(pattern), pattern, flags)
+        cpattern = self._dct.get(key)
+        if cpattern is not None:
+            self.hits += 1
+            self._dct.move_to_end(key)
+        else:
+            self.misses += 1
+            cpattern = re.compile(pattern, flags)
+            if self.maxsize > 0:
+                self._dct[key] = cpattern
+                while len(self._dct) > self.maxsize:
+                    self._dct.popitem(last=False)
+                    self.evictions += 1
+
+        return cpattern
+
+    def resize(self, maxsize):
+        """ change the maximum number of stored patterns, evicting the least
+            recently used ones if the cache is now too large
+        """
+        self.maxsize = maxsize
+        while len(self._dct) > max(maxsize, 0):
+            self._dct.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        """ empty the cache and reset the counters
+        """
+        self._dct.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def info(self):
+        """ usage statistics for the cache
+
+        :rtype: dict[str: int]
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'size': len(self._dct),
+            'maxsize': self.maxsize
+        }
+
+
+PATTERN_CACHE = PatternCache()
@@ -2,6 +2,7 @@
 """
 
 from collections.abc import Sequence as _Sequence
+import numpy
 
 
 def cast(seq):
@@ -17,6 +18,70 @@ def cast(seq):
     return ret
 
 
+def cast_array(seq, dtype=float, keep_ints=False):
+    """ cast a nested sequence of numeric strings to an array in bulk
+
+    The strings are joined into a single buffer, Fortran 'D' exponents are
+    translated once on the whole buffer, and all of the values are converted
+    with one call to numpy. The nesting of the sequence must be regular,
+    and its shape is kept in the returned array. A single string is read as
+    a whitespace-separated series of values.
+
+    :param seq: numeric strings
+    :type seq: str or nested sequence of str
+    :param dtype: the data type of the returned array
+    :type dtype: type
+    :param keep_ints: return an integer array if every value is an integer
+    :type keep_ints: bool
+    :rtype: numpy.ndarray
+    """
+    if _is_string(seq):
+        shape = None
+        buf = _as_str(seq)
+    else:
+        shape = ()
+        obj = seq
+        while _is_sequence(obj) and not _is_string(obj):
+            shape += (len(obj),)
+            obj = obj[0] if obj else None
+        buf = ' '.join(map(_as_str, _flatten(seq)))
+
+    buf = buf.replace('D', 'E').replace('d', 'e')
+    vals = buf.split()
+
+    ret = None
+    if keep_ints and not any(char in buf for char in '.eEnN'):
+        try:
+            ret = numpy.array(vals, dtype=int)
+        except ValueError:
+            pass
+    if ret is None:
+        ret = numpy.array(vals, dtype=dtype)
+
+    if shape is not None:
+        ret = ret.reshape(shape)
+
+    return ret
+
+
+def _flatten(seq):
+    """ flatten a nested sequence of strings
+    """
+    for obj in seq:
+        if _is_string(obj) or not _is_sequence(obj):
+            yield obj
+        else:
+            yield from _flatten(obj)
+
+
+def _as_str(obj):
+    """ decode byte-string captures
+    """
+    if isinstance(obj, (bytes, bytearray)):
+        obj = obj.decode('utf-8', errors='ignore')
+    return obj
+
+
 def _is_string(obj):
     return isinstance(obj, (str, bytes, bytearray))
 
@@ -27,8 +92,14 @@ def _is_sequence(obj):
 
 def _cast_string(string):
     """ cast an individual string to int or float, if possible
+
+    byte-string captures from bytes or mmap buffers are decoded to python
+    strings
     """
 
+    if isinstance(string, (bytes, bytearray)):
+        string = string.decode('utf-8', errors='ignore')
+
     ret = string
     try:
         ret = int(string.replace('D+', 'E+').replace('D-', 'E-'))
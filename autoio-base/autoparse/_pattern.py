@@ -142,3 +142,15 @@ def series(pattern, sep_pattern):
     :rtype: str
     """
     return pattern + zero_or_more(sep_pattern + pattern)
+
+
+def as_bytes(pattern):
+    """ convert a pattern to its byte-string equivalent, for searching
+        bytes or mmap buffers
+
+    :param pattern: an `re` pattern
+    :type pattern: str or bytes
+
+    :rtype: bytes
+    """
+    return pattern.encode('utf-8') if isinstance(pattern, str) else pattern
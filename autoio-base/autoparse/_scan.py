@@ -0,0 +1,169 @@
+""" single-pass search for several named patterns at once
+"""
+
+import re
+import mmap
+from autoparse._cache import PATTERN_CACHE as _PATTERN_CACHE
+from autoparse._pattern import as_bytes as _as_bytes
+
+
+class Scanner():
+    """ Finds the matches of several named patterns in one traversal of a
+        string.
+
+        The patterns are combined into a single alternation, `p1|p2|...`,
+        which is used to jump between the positions where at least one of
+        them matches. At each such position, an expression of the form
+        `(?=(?P<_s0>p1))?(?=(?P<_s1>p2))?...` reads off the match for every
+        pattern at once. Matches for each name are then thinned to be
+        non-overlapping, which gives the same results as running
+        `re.finditer` separately for each pattern.
+
+        Patterns may contain capturing groups, but not numbered
+        backreferences, since group numbers are shifted by the combination.
+    """
+
+    def __init__(self, pattern_dct, case=True):
+        """
+        :param pattern_dct: patterns to search for, keyed by name
+        :type pattern_dct: dict[obj: str]
+        :param case: if capitalization matters
+        :type case: bool
+        """
+        flags = re.MULTILINE
+        if not case:
+            flags |= re.IGNORECASE
+
+        self.names = tuple(pattern_dct.keys())
+        self._ngroups = ()
+        guards = ()
+        lookaheads = ()
+        for idx, name in enumerate(self.names):
+            pattern = pattern_dct[name]
+            if isinstance(pattern, re.Pattern):
+                pattern = pattern.pattern
+            if isinstance(pattern, bytes):
+                pattern = pattern.decode('utf-8')
+            guards += (f'(?:{pattern})',)
+            lookaheads += (f'(?:(?=(?P<_s{idx:d}>{pattern})))?',)
+            self._ngroups += (
+                _PATTERN_CACHE.compile(pattern, flags=flags).groups,)
+
+        self._flags = flags
+        self._guard = '|'.join(guards)
+        self._pattern = ''.join(lookaheads)
+
+        # index of the outer group wrapping each pattern
+        self._group_idxs = ()
+        group_idx = 1
+        for ngroups in self._ngroups:
+            self._group_idxs += (group_idx,)
+            group_idx += ngroups + 1
+
+    def scan(self, string):
+        """ every match of every pattern, with spans
+
+        :param string: string or bytes-like buffer to search
+        :type string: str, bytes, or mmap.mmap
+        :return: (capture, span) pairs for each name, where the capture is
+            the whole match, the single capture, or a tuple of captures,
+            depending on the number of groups in the pattern
+        :rtype: dict[obj: tuple]
+        """
+        match_dct = {name: [] for name in self.names}
+        last_ends = [-1] * len(self.names)
+        last_starts = [-1] * len(self.names)
+        for match in self._matches(string):
+            for idx, name in enumerate(self.names):
+                group_idx = self._group_idxs[idx]
+                start, end = match.span(group_idx)
+                if start < 0:
+                    continue
+                # keep only the matches re.finditer would find on its own
+                if start < last_ends[idx] or (
+                        start == end and start == last_starts[idx]):
+                    continue
+                last_starts[idx] = start
+                last_ends[idx] = end
+
+                ngroups = self._ngroups[idx]
+                if ngroups == 0:
+                    cap = match.group(group_idx)
+                elif ngroups == 1:
+                    cap = match.group(group_idx + 1)
+                else:
+                    cap = match.group(
+                        *range(group_idx + 1, group_idx + ngroups + 1))
+                match_dct[name].append((cap, (start, end)))
+
+        return {name: tuple(lst) for name, lst in match_dct.items()}
+
+    def _matches(self, string):
+        """ combined matches at each position where any pattern matches
+        """
+        guard, pattern = self._guard, self._pattern
+        if isinstance(string, (bytes, bytearray, memoryview, mmap.mmap)):
+            guard, pattern = _as_bytes(guard), _as_bytes(pattern)
+        cguard = _PATTERN_CACHE.compile(guard, flags=self._flags)
+        cpattern = _PATTERN_CACHE.compile(pattern, flags=self._flags)
+
+        pos = 0
+        end = len(string)
+        while pos <= end:
+            guard_match = cguard.search(string, pos)
+            if guard_match is None:
+                break
+            pos = guard_match.start()
+            yield cpattern.match(string, pos)
+            pos += 1
+
+    def has_match(self, string):
+        """ does the string have a match for each pattern?
+
+        :param string: string to search
+        :type string: str
+        :rtype: dict[obj: bool]
+        """
+        return {name: bool(caps) for name, caps in self.scan(string).items()}
+
+    def all_captures(self, string):
+        """ capture(s) for all matches of each pattern; None for patterns
+            with no matches, as in `autoparse.find.all_captures`
+
+        :param string: string to search
+        :type string: str
+        :rtype: dict[obj: tuple]
+        """
+        return {name: (tuple(cap for cap, _ in caps) if caps else None)
+                for name, caps in self.scan(string).items()}
+
+    def first_capture(self, string):
+        """ capture(s) from the first match of each pattern
+
+        :param string: string to search
+        :type string: str
+        :rtype: dict[obj: str]
+        """
+        return {name: (caps[0][0] if caps else None)
+                for name, caps in self.scan(string).items()}
+
+    def last_capture(self, string):
+        """ capture(s) from the last match of each pattern
+
+        :param string: string to search
+        :type string: str
+        :rtype: dict[obj: str]
+        """
+        return {name: (caps[-1][0] if caps else None)
+                for name, caps in self.scan(string).items()}
+
+    def first_matching_name(self, string):
+        """ the first name, in the order the patterns were given, whose
+            pattern matches the string
+
+        :param string: string to search
+        :type string: str
+        :rtype: obj
+        """
+        match_dct = self.has_match(string)
+        return next((name for name in self.names if match_dct[name]), None)
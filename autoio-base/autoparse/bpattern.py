@@ -0,0 +1,89 @@
+"""
+autoparse.bpattern
+******************
+
+Byte-string equivalents of the autoparse.pattern constants, for searching
+bytes and mmap buffers.
+"""
+from autoparse._pattern import as_bytes
+from autoparse import _lib
+
+STRING_START = as_bytes(_lib.STRING_START)
+STRING_END = as_bytes(_lib.STRING_END)
+LINE_START = as_bytes(_lib.LINE_START)
+LINE_END = as_bytes(_lib.LINE_END)
+WILDCARD = as_bytes(_lib.WILDCARD)
+WILDCARD2 = as_bytes(_lib.WILDCARD2)
+NEWLINE = as_bytes(_lib.NEWLINE)
+NONNEWLINE = as_bytes(_lib.NONNEWLINE)
+LINE_FILL = as_bytes(_lib.LINE_FILL)
+LINE = as_bytes(_lib.LINE)
+SPACE = as_bytes(_lib.SPACE)
+SPACES = as_bytes(_lib.SPACES)
+ZSPACES = as_bytes(_lib.ZSPACES)
+LINESPACE = as_bytes(_lib.LINESPACE)
+LINESPACES = as_bytes(_lib.LINESPACES)
+PADDING = as_bytes(_lib.PADDING)
+NONSPACE = as_bytes(_lib.NONSPACE)
+UPPERCASE_LETTER = as_bytes(_lib.UPPERCASE_LETTER)
+LOWERCASE_LETTER = as_bytes(_lib.LOWERCASE_LETTER)
+PLUS = as_bytes(_lib.PLUS)
+MINUS = as_bytes(_lib.MINUS)
+PERIOD = as_bytes(_lib.PERIOD)
+UNDERSCORE = as_bytes(_lib.UNDERSCORE)
+LETTER = as_bytes(_lib.LETTER)
+DIGIT = as_bytes(_lib.DIGIT)
+URLSAFE_CHAR = as_bytes(_lib.URLSAFE_CHAR)
+SIGN = as_bytes(_lib.SIGN)
+UNSIGNED_INTEGER = as_bytes(_lib.UNSIGNED_INTEGER)
+UNSIGNED_FLOAT = as_bytes(_lib.UNSIGNED_FLOAT)
+INTEGER = as_bytes(_lib.INTEGER)
+FLOAT = as_bytes(_lib.FLOAT)
+EXPONENTIAL_INTEGER = as_bytes(_lib.EXPONENTIAL_INTEGER)
+EXPONENTIAL_FLOAT = as_bytes(_lib.EXPONENTIAL_FLOAT)
+NUMBER = as_bytes(_lib.NUMBER)
+EXPONENTIAL_INTEGER_D = as_bytes(_lib.EXPONENTIAL_INTEGER_D)
+EXPONENTIAL_FLOAT_D = as_bytes(_lib.EXPONENTIAL_FLOAT_D)
+VARIABLE_STRING = as_bytes(_lib.VARIABLE_STRING)
+VARIABLE_NAME = as_bytes(_lib.VARIABLE_NAME)
+
+__all__ = [
+    'STRING_START',
+    'STRING_END',
+    'LINE_START',
+    'LINE_END',
+    'WILDCARD',
+    'WILDCARD2',
+    'NEWLINE',
+    'NONNEWLINE',
+    'LINE_FILL',
+    'LINE',
+    'SPACE',
+    'SPACES',
+    'ZSPACES',
+    'LINESPACE',
+    'LINESPACES',
+    'PADDING',
+    'NONSPACE',
+    'UPPERCASE_LETTER',
+    'LOWERCASE_LETTER',
+    'PLUS',
+    'MINUS',
+    'PERIOD',
+    'UNDERSCORE',
+    'LETTER',
+    'DIGIT',
+    'URLSAFE_CHAR',
+    'SIGN',
+    'UNSIGNED_INTEGER',
+    'UNSIGNED_FLOAT',
+    'INTEGER',
+    'FLOAT',
+    'EXPONENTIAL_INTEGER',
+    'EXPONENTIAL_FLOAT',
+    'NUMBER',
+    'EXPONENTIAL_INTEGER_D',
+    'EXPONENTIAL_FLOAT_D',
+    'VARIABLE_STRING',
+    'VARIABLE_NAME',
+]
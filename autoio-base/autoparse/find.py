@@ -2,8 +2,13 @@
 **************
 
 Extract information from a file using re patterns.
+
+Strings may also be given as bytes-like buffers, such as the read-only
+mmap returned by `ioformat.pathtools.map_file`, in which case captures are
+returned as byte strings.
 """
 import re
+import mmap
 from functools import partial
 import numpy as np
 from autoparse._lib import STRING_START as _STRING_START
@@ -14,13 +19,17 @@ from autoparse._lib import SPACES as _SPACES
 from autoparse._lib import LINESPACES as _LINESPACES
 from autoparse._lib import NUMBER as _NUMBER
 from autoparse._pattern import maybe as _maybe
+from autoparse._pattern import as_bytes as _as_bytes
+from autoparse._cache import PATTERN_CACHE as _PATTERN_CACHE
+# Re-exported, for use as autoparse.find.Scanner
+from autoparse._scan import Scanner  # pylint: disable=unused-import # noqa
 
 
 def has_match(pattern, string, case=True):
     """ does this string have a pattern match?
 
     :param pattern: pattern to search for
-    :type pattern: str
+    :type pattern: str or re.Pattern
     :param string: string to search
     :type string: str
     :param case: if capitalization matters
@@ -36,7 +45,7 @@ def full_match(pattern, string, case=True):
     """ does this pattern match this *entire* string?
 
     :param pattern: pattern to search for
-    :type pattern: str
+    :type pattern: str or re.Pattern
     :param string: string to search
     :type string: str
     :param case: if capitalization matters
@@ -44,7 +53,7 @@ def full_match(pattern, string, case=True):
     :return: does it fully match
     :rtype: bool
     """
-    pattern_ = _STRING_START + pattern + _STRING_END
+    pattern_ = _wrap(pattern, _STRING_START, _STRING_END)
     return has_match(pattern_, string, case=case)
 
 
@@ -52,7 +61,7 @@ def starts_with(pattern, string, case=True):
     """ does the string start with this pattern
 
     :param pattern: pattern to search for
-    :type pattern: str
+    :type pattern: str or re.Pattern
     :param string: string to search
     :type string: str
     :param case: if capitalization matters
@@ -60,7 +69,7 @@ def starts_with(pattern, string, case=True):
     :return: does it start with the pattern
     :rtype: bool
     """
-    start_pattern = _STRING_START + pattern
+    start_pattern = _wrap(pattern, _STRING_START, '')
     return has_match(start_pattern, string, case=case)
 
 
@@ -68,7 +77,7 @@ def ends_with(pattern, string, case=True):
     """ does the string end with this pattern
 
     :param pattern: pattern to search for
-    :type pattern: str
+    :type pattern: str or re.Pattern
     :param string: string to search
     :type string: str
     :param case: if capitalization matters
@@ -76,7 +85,7 @@ def ends_with(pattern, string, case=True):
     :return: does it end with the pattern
     :rtype: bool
     """
-    end_pattern = pattern + _STRING_END
+    end_pattern = _wrap(pattern, '', _STRING_END)
     return has_match(end_pattern, string, case=case)
 
 
@@ -90,7 +99,7 @@ def all_captures(pattern, string, case=True):
     """ capture(s) for all matches of a capturing pattern
 
     :param pattern: pattern to search for
-    :type pattern: str
+    :type pattern: str or re.Pattern
     :param string: string to search
     :type string: str
     :param case: if capitalization matters
@@ -111,7 +120,7 @@ def all_captures_with_spans(pattern, string, case=True):
         the start and end of the match
 
     :param pattern: pattern to search for
-    :type pattern: str
+    :type pattern: str or re.Pattern
     :param string: string to search
     :type string: str
     :param case: if capitalization matters
@@ -139,7 +148,7 @@ def first_capture(pattern, string, case=True):
     """ capture(s) from first match for a capturing pattern
 
     :param pattern: pattern to search for
-    :type pattern: str
+    :type pattern: str or re.Pattern
     :param string: string to search
     :type string: str
     :param case: if capitalization matters
@@ -156,7 +165,7 @@ def last_capture(pattern, string, case=True):
     """ capture(s) from first match for a capturing pattern
 
     :param pattern: pattern to search for
-    :type pattern: str
+    :type pattern: str or re.Pattern
     :param string: string to search
     :type string: str
     :param case: if capitalization matters
@@ -263,15 +272,104 @@ def first_matching_pattern_last_capture(patterns, string, case=True):
     return last_capture(pattern, string, case=case)
 
 
+def compile_pattern(pattern, case=True, binary=False):
+    """ compile a pattern with the flags used by the autoparse.find functions
+
+    The compiled pattern is stored in a size-bounded LRU cache shared by all
+    of the functions in this module, so it can be passed directly to any of
+    them without being recompiled. Pre-compiled patterns are given the same
+    flags as pattern strings, so `^` and `$` match at every line.
+
+    :param pattern: pattern to compile
+    :type pattern: str or re.Pattern
+    :param case: if capitalization matters
+    :type case: bool
+    :param binary: compile a byte-string pattern, for searching bytes or
+        mmap buffers
+    :type binary: bool
+    :rtype: re.Pattern
+    """
+    if binary:
+        pattern = _binary_pattern(pattern)
+
+    return _PATTERN_CACHE.compile(pattern, flags=_re_flags(case=case))
+
+
+def pattern_cache_info():
+    """ hit, miss, and eviction counts for the compiled pattern cache
+
+    :rtype: dict[str: int]
+    """
+    return _PATTERN_CACHE.info()
+
+
+def clear_pattern_cache():
+    """ empty the compiled pattern cache and reset its counters
+    """
+    _PATTERN_CACHE.clear()
+
+
+def set_pattern_cache_size(maxsize):
+    """ set the maximum number of compiled patterns kept in the cache
+
+    :param maxsize: the cache size; 0 disables caching
+    :type maxsize: int
+    """
+    _PATTERN_CACHE.resize(maxsize)
+
+
+def is_binary(string):
+    """ is this a bytes-like buffer, such as bytes or an mmap, rather than a
+        python string?
+
+    Patterns and replacement strings given as python strings are
+    converted to byte strings before searching these buffers.
+    """
+    return isinstance(string, (bytes, bytearray, memoryview, mmap.mmap))
+
+
+def _binary_pattern(pattern):
+    """ the byte-string equivalent of a pattern string or compiled pattern
+    """
+    if isinstance(pattern, re.Pattern) and isinstance(pattern.pattern, str):
+        ret = _PATTERN_CACHE.compile(
+            _as_bytes(pattern.pattern), flags=pattern.flags & ~re.UNICODE)
+    elif isinstance(pattern, str):
+        ret = _as_bytes(pattern)
+    else:
+        ret = pattern
+    return ret
+
+
+def _wrap(pattern, prefix, suffix):
+    """ add a prefix and suffix to a pattern string or compiled pattern
+    """
+    if isinstance(pattern, re.Pattern):
+        ptt = pattern.pattern
+        if isinstance(ptt, bytes):
+            prefix, suffix = _as_bytes(prefix), _as_bytes(suffix)
+        ret = _PATTERN_CACHE.compile(prefix + ptt + suffix,
+                                     flags=pattern.flags)
+    elif isinstance(pattern, bytes):
+        ret = _as_bytes(prefix) + pattern + _as_bytes(suffix)
+    else:
+        ret = prefix + pattern + suffix
+    return ret
+
+
+def _compile_for(pattern, string, case=True):
+    """ compile a pattern to search this string or buffer with
+    """
+    return compile_pattern(pattern, case=case, binary=is_binary(string))
+
+
 def _re_search(pattern, string, case=True):
-    flags = _re_flags(case=case)
-    return re.search(pattern, string, flags=flags)
+    return _compile_for(pattern, string, case=case).search(string)
 
 
 def _re_findall(pattern, string, case=True):
     if pattern and string is not None:
-        flags = _re_flags(case=case)
-        ptt = re.findall(pattern, string, flags=flags)
+        ptt = _compile_for(pattern, string, case=case).findall(string)
         if ptt:
             ret = ptt
         else:
@@ -283,21 +381,21 @@ def _re_findall(pattern, string, case=True):
 
 def _re_finditer(pattern, string, case=True):
     if pattern and string is not None:
-        flags = _re_flags(case=case)
-        match_iter = re.finditer(pattern, string, flags=flags)
+        match_iter = _compile_for(pattern, string, case=case).finditer(
+            string)
     else:
         match_iter = iter([])
     return match_iter
 
 
 def _re_split(pattern, string, case=True):
-    flags = _re_flags(case=case)
-    return re.split(pattern, string, maxsplit=0, flags=flags)
+    return _compile_for(pattern, string, case=case).split(string, maxsplit=0)
 
 
 def _re_sub(pattern, repl, string, case=True):
-    flags = _re_flags(case=case)
-    return re.sub(pattern, repl, string, count=0, flags=flags)
+    if is_binary(string) and isinstance(repl, str):
+        repl = _as_bytes(repl)
+    return _compile_for(pattern, string, case=case).sub(repl, string, count=0)
 
 
 def _re_flags(case=True):
@@ -359,3 +457,96 @@ def where_is(word, lines):
         np.array([line == word for line in lines], dtype=int) == 1)[0]
 
     return where_array
+
+
+def iter_where_in(word, lines, max_hits=None, stop=None):
+    """ Lazily finds where word is in lines, yielding each hit as it
+        is found. For multiple words: all words must be found in the line.
+        Lines may be given as any iterable, including an open file, and
+        trailing newline characters are removed before they are checked.
+        :param word: word/s to look for
+        :type word: str/list for multiple words
+        :param lines: lines to scan
+        :type lines: iterable(str)
+        :param max_hits: stop after this many hits
+        :type max_hits: int
+        :param stop: stop at the first line containing this word
+        :type stop: str
+        :return: line index and line for each hit
+        :rtype: generator(tuple(int, str))
+    """
+    if isinstance(word, str):
+        word = [word]
+
+    def _is_hit(line):
+        return all(word_i in line for word_i in word)
+
+    return _iter_where(_is_hit, lines, max_hits=max_hits, stop=stop)
+
+
+def iter_where_in_any(word, lines, max_hits=None, stop=None):
+    """ Lazily finds where word is in lines, yielding each hit as it
+        is found. For multiple words: any of the listed words may be found
+        in the line. Lines may be given as any iterable, including an open
+        file, and trailing newline characters are removed before they are
+        checked.
+        :param word: word/s to look for
+        :type word: str/list for multiple words
+        :param lines: lines to scan
+        :type lines: iterable(str)
+        :param max_hits: stop after this many hits
+        :type max_hits: int
+        :param stop: stop at the first line containing this word
+        :type stop: str
+        :return: line index and line for each hit
+        :rtype: generator(tuple(int, str))
+    """
+    if isinstance(word, str):
+        word = [word]
+
+    def _is_hit(line):
+        return any(word_i in line for word_i in word)
+
+    return _iter_where(_is_hit, lines, max_hits=max_hits, stop=stop)
+
+
+def iter_where_is(word, lines, max_hits=None, stop=None):
+    """ Lazily finds the lines that correspond to the required word,
+        yielding each hit as it is found. Lines may be given as any
+        iterable, including an open file, and trailing newline characters
+        are removed before they are checked.
+        :param word: word to look for
+        :type word: str
+        :param lines: lines to scan
+        :type lines: iterable(str)
+        :param max_hits: stop after this many hits
+        :type max_hits: int
+        :param stop: stop at the first line containing this word
+        :type stop: str
+        :return: line index and line for each hit
+        :rtype: generator(tuple(int, str))
+    """
+
+    def _is_hit(line):
+        return line == word
+
+    return _iter_where(_is_hit, lines, max_hits=max_hits, stop=stop)
+
+
+def _iter_where(is_hit, lines, max_hits=None, stop=None):
+    """ yield (index, line) for the lines satisfying is_hit
+    """
+    if max_hits is not None and max_hits <= 0:
+        return
+
+    nhits = 0
+    for idx, line in enumerate(lines):
+        line = line.rstrip('\r\n')
+        if stop is not None and stop in line:
+            return
+        if is_hit(line):
+            yield idx, line
+            # stop without reading another line, which may come from a file
+            nhits += 1
+            if max_hits is not None and nhits >= max_hits:
+                return
@@ -1,6 +1,9 @@
 """ test autoparse
 """
 
+import re
+import mmap
+import tempfile
 import numpy as np
 import autoparse
 
@@ -285,3 +288,164 @@ def test__where_in_any():
     lines = ['End', 'RRHO']
     assert (autoparse.find.where_in_any(lines, STRING_TESTWHERE)
             == np.array([1, 15, 22, 29, 42])).all()
+
+
+def test__pattern_cache():
+    """ test find.compile_pattern
+        test find.pattern_cache_info
+        test find.set_pattern_cache_size
+    """
+    autoparse.find.clear_pattern_cache()
+
+    pattern = autoparse.pattern.capturing(autoparse.pattern.FLOAT)
+    caps1 = autoparse.find.all_captures(pattern, XYZ_STRING)
+    caps2 = autoparse.find.all_captures(pattern, XYZ_STRING)
+    assert caps1 == caps2
+    info = autoparse.find.pattern_cache_info()
+    assert info['misses'] == 1 and info['hits'] == 1 and info['size'] == 1
+
+    # pre-compiled patterns are passed straight through
+    cpattern = autoparse.find.compile_pattern(pattern)
+    assert autoparse.find.all_captures(cpattern, XYZ_STRING) == caps1
+    assert autoparse.find.first_capture(
+        autoparse.find.compile_pattern('(cl)'), XYZ_STRING) is None
+    assert autoparse.find.first_capture(
+        autoparse.find.compile_pattern('(cl)'), XYZ_STRING,
+        case=False) == 'Cl'
+    assert autoparse.find.starts_with(
+        autoparse.find.compile_pattern('6'), XYZ_STRING)
+
+    # pre-compiled patterns match at the start of every line, like strings
+    cpattern = autoparse.find.compile_pattern(re.compile('^(Cl) '))
+    assert cpattern.flags & re.MULTILINE
+    assert autoparse.find.first_capture(cpattern, XYZ_STRING) == 'Cl'
+    assert autoparse.find.first_capture(
+        re.compile('^(Cl) '), XYZ_STRING) == 'Cl'
+
+    autoparse.find.set_pattern_cache_size(2)
+    for ptt in PATTERNS:
+        autoparse.find.has_match(ptt, STRING)
+    info = autoparse.find.pattern_cache_info()
+    assert info['size'] == 2 and info['evictions'] > 0
+
+    autoparse.find.set_pattern_cache_size(2048)
+    autoparse.find.clear_pattern_cache()
+
+
+def test__scanner():
+    """ test find.Scanner
+    """
+    pattern_dct = {
+        'lower': autoparse.pattern.capturing(
+            autoparse.pattern.LOWERCASE_LETTER),
+        'upper': autoparse.pattern.UPPERCASE_LETTER,
+        'letter': autoparse.pattern.LETTER,
+        'xyz': XYZ_LINE_PATTERN,
+        'bad': BAD_XYZ_LINE_PATTERN,
+    }
+    scanner = autoparse.find.Scanner(pattern_dct)
+
+    for string in (STRING, XYZ_STRING):
+        caps_dct = scanner.all_captures(string)
+        for name, pattern in pattern_dct.items():
+            assert caps_dct[name] == autoparse.find.all_captures(
+                pattern, string)
+
+        first_dct = scanner.first_capture(string)
+        last_dct = scanner.last_capture(string)
+        for name in ('lower', 'xyz', 'bad'):
+            pattern = pattern_dct[name]
+            assert first_dct[name] == autoparse.find.first_capture(
+                pattern, string)
+            assert last_dct[name] == autoparse.find.last_capture(
+                pattern, string)
+
+    assert scanner.has_match('5') == {
+        'lower': False, 'upper': False, 'letter': False,
+        'xyz': False, 'bad': False}
+    assert scanner.first_matching_name('A') == 'upper'
+
+    pattern_dct = {'word': 'ab', 'overlap': 'ba'}
+    scanner = autoparse.find.Scanner(pattern_dct, case=False)
+    assert scanner.scan('abAB') == {
+        'word': (('ab', (0, 2)), ('AB', (2, 4))),
+        'overlap': (('bA', (1, 3)),)}
+
+
+def test__binary():
+    """ test find functions on bytes and mmap buffers
+    """
+    bxyz_string = XYZ_STRING.encode('utf-8')
+
+    mcaps = autoparse.find.all_captures(XYZ_LINE_PATTERN, bxyz_string)
+    assert mcaps[0] == (b'F', b'1.584823', b'-0.748487', b'-0.427122')
+    assert autoparse.cast(mcaps) == autoparse.cast(
+        autoparse.find.all_captures(XYZ_LINE_PATTERN, XYZ_STRING))
+    assert autoparse.find.first_capture('(cl)', bxyz_string,
+                                        case=False) == b'Cl'
+    assert autoparse.find.starts_with(
+        autoparse.find.compile_pattern('6'), bxyz_string)
+    assert autoparse.find.has_match(
+        autoparse.pattern.as_bytes('charge') + autoparse.bpattern.SPACES,
+        bxyz_string) is False
+    assert autoparse.find.split_lines(STRING2.encode('utf-8')) == (
+        b'A*_ 1 a z>', b'B$- 2 b y~', b'C%+ 3 c x,')
+    assert autoparse.find.replace('F', 'Cl', bxyz_string).count(b'Cl') == 2
+
+    bscanner = autoparse.find.Scanner({'xyz': XYZ_LINE_PATTERN})
+    assert bscanner.all_captures(bxyz_string)['xyz'] == mcaps
+
+    with tempfile.TemporaryFile() as fobj:
+        fobj.write(bxyz_string)
+        fobj.flush()
+        buf = mmap.mmap(fobj.fileno(), 0, access=mmap.ACCESS_READ)
+        assert autoparse.find.all_captures(XYZ_LINE_PATTERN, buf) == mcaps
+        buf.close()
+
+
+def test__iter_where():
+    """ test find.iter_where_in
+        test find.iter_where_in_any
+        test find.iter_where_is
+    """
+    hits = autoparse.find.iter_where_in('End', STRING_TESTWHERE)
+    assert [idx for idx, _ in hits] == [15, 22, 29, 42]
+    hits = autoparse.find.iter_where_in('End', STRING_TESTWHERE, max_hits=2)
+    assert [idx for idx, _ in hits] == [15, 22]
+    hits = autoparse.find.iter_where_in(
+        'End', STRING_TESTWHERE, stop='Frequencies')
+    assert [idx for idx, _ in hits] == [15, 22, 29]
+
+    hits = autoparse.find.iter_where_in_any(['End', 'RRHO'], STRING_TESTWHERE)
+    assert [idx for idx, _ in hits] == [1, 15, 22, 29, 42]
+
+    line = '                0.00  0.06  0.18  0.47  0.15  0.04'
+    hits = autoparse.find.iter_where_is(line, STRING_TESTWHERE)
+    assert list(hits) == [(21, line), (28, line)]
+
+    # lines streamed from an open file
+    with tempfile.TemporaryFile(mode='w+') as fobj:
+        fobj.write('\n'.join(STRING_TESTWHERE))
+        fobj.seek(0)
+        hits = autoparse.find.iter_where_is(line, fobj, max_hits=1)
+        assert list(hits) == [(21, line)]
+        # no line past the last hit is read from the file
+        assert fobj.readline().rstrip('\n') == STRING_TESTWHERE[22]
+
+
+def test__cast_array():
+    """ test autoparse.cast_array
+    """
+    mcaps = autoparse.find.all_captures(XYZ_LINE_PATTERN, XYZ_STRING)
+    xyzs = autoparse.cast_array([cap[1:] for cap in mcaps])
+    assert xyzs.shape == (6, 3)
+    assert np.allclose(
+        xyzs, [cap[1:] for cap in autoparse.cast(mcaps)])
+
+    vals = autoparse.cast_array(('1.5D+02', '-2.0d-01', '3E0'))
+    assert np.allclose(vals, (150., -0.2, 3.))
+
+    ints = autoparse.cast_array('1 2 3\n4 5 6', keep_ints=True)
+    assert ints.dtype == int and tuple(ints) == (1, 2, 3, 4, 5, 6)
+    vals = autoparse.cast_array('1 2 3.0', keep_ints=True)
+    assert vals.dtype == float
@@ -1,7 +1,9 @@
 """ geometry parsers
 """
 
+import numpy
 from autoparse import cast as _cast
+from autoparse import cast_array as _cast_array
 import autoparse.find as apf
 import autoparse.pattern as app
 from autoread import par
@@ -51,8 +53,9 @@ def read(string,
 
     caps = apf.all_captures(line_ptt_, block_str)
     if caps is not None:
-        symbs, xcomps, ycomps, zcomps = zip(*_cast(caps))
-        xyzs = tuple(zip(xcomps, ycomps, zcomps))
+        symbs = _cast(tuple(cap[0] for cap in caps))
+        xyzs = tuple(map(tuple, _cast_array(
+            [cap[1:] for cap in caps]).tolist()))
     else:
         symbs, xyzs = None, None
 
@@ -84,6 +87,101 @@ def read_xyz(string, symb_ptt=par.Pattern.ATOM_SYMBOL,
     return symbs, xyzs
 
 
+def read_all(string, start_ptt, skip=0, symb_col=0, xyz_cols=(-3, -2, -1),
+             case=False):
+    """ Read every Cartesian molecular geometry block in a string by
+        splitting the lines that follow each match of the start pattern into
+        columns, rather than capturing them with a regex.
+
+        The block starts on the line after the start pattern match (or on
+        the line where the match ends, if it ends at a line start), after
+        skipping `skip` lines. It runs until the first line with a different
+        number of columns than the first, or whose coordinates are not
+        numbers. All of the blocks are found in a single pass over the string.
+
+        :param start_ptt: pattern before the start of each geometry block
+        :type start_ptt: str
+        :param skip: number of header lines between the start pattern and
+            the geometry lines
+        :type skip: int
+        :param symb_col: column of the atom symbols
+        :type symb_col: int
+        :param xyz_cols: columns of the x, y, and z coordinates
+        :type xyz_cols: tuple(int)
+        :param case: make the match case-sensitive?
+        :type case: bool
+        :return: atom symbols and (N, 3) coordinates for each block
+        :rtype: tuple((numpy.ndarray, numpy.ndarray))
+    """
+
+    geos = ()
+    for _, (_, end) in apf.all_captures_with_spans(start_ptt, string,
+                                                   case=case):
+        if end > 0 and string[end-1] != '\n':
+            end = _next_line_start(string, end)
+        for _ in range(skip):
+            end = _next_line_start(string, end)
+
+        rows = []
+        ncols = None
+        while end < len(string):
+            line_end = _next_line_start(string, end)
+            fields = string[end:line_end].split()
+            if ncols is None:
+                ncols = len(fields)
+            if not fields or len(fields) != ncols or not all(
+                    map(_is_float, (fields[col] for col in xyz_cols))):
+                break
+            rows.append(fields)
+            end = line_end
+
+        if rows:
+            cols = numpy.array(rows)
+            symbs = cols[:, symb_col]
+            xyzs = _cast_array(cols[:, list(xyz_cols)].tolist())
+            geos += ((symbs, xyzs),)
+
+    return geos
+
+
+def read_columns(string, start_ptt, skip=0, symb_col=0, xyz_cols=(-3, -2, -1),
+                 last=True, case=False):
+    """ Read a Cartesian molecular geometry from a string by splitting the
+        lines following the start pattern into columns. See `read_all`.
+
+        :param last: read the last block, instead of the first?
+        :type last: bool
+        :rtype: (numpy.ndarray, numpy.ndarray)
+    """
+
+    geos = read_all(string, start_ptt, skip=skip, symb_col=symb_col,
+                    xyz_cols=xyz_cols, case=case)
+    if geos:
+        symbs, xyzs = geos[-1] if last else geos[0]
+    else:
+        symbs, xyzs = None, None
+
+    return symbs, xyzs
+
+
+def _is_float(field):
+    """ Can this field be read as a number?
+    """
+    try:
+        float(field.replace('D', 'E').replace('d', 'e'))
+        ret = True
+    except ValueError:
+        ret = False
+    return ret
+
+
+def _next_line_start(string, pos):
+    """ Position of the start of the line after the one containing pos
+    """
+    idx = string.find('\n', pos)
+    return len(string) if idx < 0 else idx + 1
+
+
 def block_pattern(symb_ptt=par.Pattern.ATOM_SYMBOL,
                   val_ptt=par.Pattern.NUMERIC_VALUE,
                   line_sep_ptt=None,
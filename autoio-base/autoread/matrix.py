@@ -3,6 +3,7 @@
 
 import numpy
 from autoparse import cast as _cast
+from autoparse import cast_array as _cast_array
 import autoparse.find as apf
 import autoparse.pattern as app
 
@@ -17,7 +18,9 @@ def read(string,
          line_start_ptt=None,
          last=True,
          tril=False,
-         case=False):
+         case=False,
+         fast=False,
+         as_array=False):
     """ Read
     """
 
@@ -27,7 +30,9 @@ def read(string,
                     block_start_ptt=block_start_ptt,
                     line_start_ptt=line_start_ptt,
                     tril=tril,
-                    case=case)
+                    case=case,
+                    fast=fast,
+                    as_array=as_array)
     if mats is not None:
         mat = mats[-1] if last else mats[0]
     else:
@@ -42,7 +47,9 @@ def read_all(string,
              block_start_ptt=None,
              line_start_ptt=None,
              tril=False,
-             case=False):
+             case=False,
+             fast=False,
+             as_array=False):
     """ Reads an M x N matrix from a string by capturing the matrix values,
         which can be rectangular or lower-triangular, and
         may or may not be broken into multiple blocks.
@@ -61,7 +68,14 @@ def read_all(string,
         :type last: bool
         :param case: make the match case-sensitive?
         :type case: bool
-        :rtype: tuple(tuple(float))
+        :param fast: split the values of each block on whitespace and fill
+            the matrix with numpy, rather than capturing each row's values
+            with a regex
+        :type fast: bool
+        :param as_array: return numpy arrays instead of tuples-of-tuples
+            (implies fast)
+        :type as_array: bool
+        :rtype: tuple(tuple(float)) or numpy.ndarray
     """
 
     line_ptt_ = line_pattern(val_ptt=val_ptt, start_ptt=line_start_ptt,
@@ -80,11 +94,20 @@ def read_all(string,
     #     apf.last_capture(blocks_ptt_, string, case=case) if last else
     #     apf.first_capture(blocks_ptt_, string, case=case))
 
+    fast = fast or as_array
+
     mats = ()
     for blocks_str in blocks_str_lst:
         block_strs = apf.all_captures(block_ptt_, blocks_str, case=case)
 
-        if block_strs is not None:
+        if block_strs is not None and fast:
+            block_rows_lst = [
+                apf.all_captures(line_ptt_, block_str, case=case)
+                for block_str in block_strs]
+            mat = (_tril_array(block_rows_lst) if tril else
+                   _rect_array(block_rows_lst))
+            mats += ((mat if as_array else tuple(map(tuple, mat.tolist()))),)
+        elif block_strs is not None:
             if not tril:
                 rows = numpy.concatenate(
                     [_block_rows(block_str, val_ptt, line_ptt_, case=case)
@@ -147,6 +170,58 @@ def _symmetric_matrix_from_lower_triangle(tril_rows):
     return tuple(map(tuple, mat))
 
 
+def _rect_array(block_rows_lst):
+    """ Build a matrix array from the rows of its column blocks, in one
+        conversion per block.
+
+        :param block_rows_lst: value strings for each row of each block
+        :type block_rows_lst: list(tuple(str))
+        :rtype: numpy.ndarray
+    """
+
+    mat = numpy.concatenate(
+        [_cast_array(' '.join(block_rows)).reshape(len(block_rows), -1)
+         for block_rows in block_rows_lst], axis=1)
+    assert mat.ndim == 2
+
+    return mat
+
+
+def _tril_array(block_rows_lst):
+    """ Build a full M x M symmetric matrix array from the rows of the blocks
+        of its lower triangle, filling it by index arithmetic.
+
+        The rows of each block are the last rows of the matrix, and the
+        values of each row start from the diagonal element of the block's
+        first row.
+
+        :param block_rows_lst: value strings for each row of each block
+        :type block_rows_lst: list(tuple(str))
+        :rtype: numpy.ndarray
+    """
+
+    nrows = len(block_rows_lst[0])
+
+    row_idxs, col_idxs, vals = [], [], []
+    for block_rows in block_rows_lst:
+        nblock_rows = len(block_rows)
+        offset = nrows - nblock_rows
+        counts = numpy.array([len(row.split()) for row in block_rows])
+        starts = numpy.cumsum(counts) - counts
+
+        row_idxs.append(numpy.repeat(numpy.arange(offset, nrows), counts))
+        col_idxs.append(offset + numpy.arange(counts.sum()) -
+                        numpy.repeat(starts, counts))
+        vals.append(_cast_array(' '.join(block_rows)))
+
+    mat = numpy.zeros((nrows, nrows))
+    mat[numpy.concatenate(row_idxs), numpy.concatenate(col_idxs)] = (
+        numpy.concatenate(vals))
+    mat = numpy.tril(mat) + numpy.tril(mat, -1).T
+
+    return mat
+
+
 def _block_rows(block_str, val_ptt, line_ptt_, case=False):
     """ Reads th rows of a blokc of text.
 
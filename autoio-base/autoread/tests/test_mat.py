@@ -208,6 +208,30 @@ def test__geom():
     with pytest.raises(ValueError):
         symbs, xyzs = autoread.geom.read_xyz(BAD_XYZ_STR)
 
+    # Column-splitting readers
+    nums, xyzs = autoread.geom.read_columns(
+        GEO1_STR, app.escape('Standard orientation:'), skip=4, symb_col=1)
+    assert tuple(nums.astype(int)) == (8, 8, 1, 1)
+    assert xyzs.shape == (4, 3)
+    assert numpy.allclose(xyzs, ((-0.0, 0.723527, -0.046053),
+                                 (0.0, -0.723527, -0.046053),
+                                 (0.876174, 0.838634, 0.368421),
+                                 (-0.876174, -0.838634, 0.368421)))
+
+    geos = autoread.geom.read_all(
+        GEO2_STR + GEO1_STR + GEO2_STR,
+        app.escape('Cartesian Geometry (in Angstrom)'))
+    assert len(geos) == 2
+    for symbs, xyzs in geos:
+        assert tuple(symbs) == ('O', 'O', 'H', 'H')
+        assert numpy.allclose(xyzs, ((0.0, 0.7028389815, 0.0245676525),
+                                     (0.0, -0.7028389815, 0.0245676525),
+                                     (-0.8761735478, 0.8179459165,
+                                      -0.389906474),
+                                     (0.8761735478, -0.8179459165,
+                                      -0.389906474)))
+    assert autoread.geom.read_all(GEO3_STR, app.escape('Standard')) == ()
+
     # Search for string missing requested header (in start_ptt)
     start_ptt = (
         app.padded(app.NEWLINE).join([
@@ -281,6 +305,16 @@ def test__matrix():
          (0., -0.20421, 0.19654, 0., 0.12066, -0.05792, 0., 0.08354,
           -0.13862)))
 
+    fmat = autoread.matrix.read(
+        HESS1_STR,
+        start_ptt=start_ptt,
+        block_start_ptt=block_start_ptt,
+        line_start_ptt=comp_ptt,
+        tril=True,
+        fast=True)
+    assert isinstance(fmat, tuple)
+    assert numpy.allclose(fmat, mat)
+
     start_ptt = (
         app.padded(app.NEWLINE).join([
             app.escape('## Hessian (Symmetry 0) ##'), app.LINE, '']))
@@ -305,6 +339,36 @@ def test__matrix():
          (0.0, -0.479, -0.279, 0.0, -0.003, -0.263, 0.0, 0.494, 0.279),
          (0.0, -0.251, -0.185, 0.0, 0.025, 0.947, 0.0, 0.292, 0.137)))
 
+    # Fast path, returning arrays
+    fmat = autoread.matrix.read(
+        HESS2_STR,
+        start_ptt=start_ptt,
+        block_start_ptt=block_start_ptt,
+        line_start_ptt=app.UNSIGNED_INTEGER,
+        as_array=True)
+    assert isinstance(fmat, numpy.ndarray) and fmat.shape == (9, 9)
+    assert numpy.allclose(fmat, mat)
+
+    # Integer values are kept as integers
+    start_ptt = app.escape('Matrix:') + app.lpadded(app.NEWLINE)
+    mat = autoread.matrix.read(
+        'Matrix:\n  1   1   2\n  2   2   3\nEnd\n',
+        val_ptt=app.NUMBER,
+        start_ptt=start_ptt,
+        line_start_ptt=app.UNSIGNED_INTEGER)
+    assert mat == ((1, 2), (2, 3))
+    assert all(numpy.issubdtype(type(val), numpy.integer)
+               for row in mat for val in row)
+
+    mat = autoread.matrix.read(
+        'Matrix:\n  1   1\n  2   2   0.5\nEnd\n',
+        val_ptt=app.NUMBER,
+        start_ptt=start_ptt,
+        line_start_ptt=app.UNSIGNED_INTEGER,
+        tril=True)
+    assert mat == ((1, 2), (2, 0.5))
+    assert isinstance(mat[0][0], int) and isinstance(mat[1][1], float)
+
     # Test finding nothing
     mat = autoread.matrix.read(
         '',
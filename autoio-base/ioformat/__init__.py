@@ -3,6 +3,11 @@
 """
 
 from ioformat._format import build_mako_str
+from ioformat._format import ChunkWriter
+from ioformat._format import template_cache_info
+from ioformat._format import invalidate_template_cache
+from ioformat._format import set_template_module_directory
+from ioformat._format import precompile_templates
 from ioformat._format import indent
 from ioformat._format import add_line
 from ioformat._format import change_line
@@ -13,6 +18,7 @@ from ioformat._format import remove_trail_whitespace
 from ioformat._format import remove_comment_lines
 from ioformat._format import remove_empty_lines
 from ioformat._string import hash_string
+from ioformat._proc import set_nprocs
 from ioformat import pathtools
 from ioformat import phycon
 from ioformat import ptt
@@ -21,6 +27,11 @@ from ioformat import ptt
 __all__ = [
     # format functions
     'build_mako_str',
+    'ChunkWriter',
+    'template_cache_info',
+    'invalidate_template_cache',
+    'set_template_module_directory',
+    'precompile_templates',
     'indent',
     'add_line',
     'change_line',
@@ -33,6 +44,8 @@ __all__ = [
     'addchar',
     # string
     'hash_string',
+    # processes
+    'set_nprocs',
     # libs
     'pathtools',
     'phycon',
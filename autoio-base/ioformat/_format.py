@@ -2,37 +2,152 @@
 """
 
 import os
-from mako.template import Template
 import more_itertools as mit
+from mako.runtime import Context
 import autoparse.pattern as app
 import autoparse.find as apf
+from ioformat._template import TEMPLATE_CACHE as _TEMPLATE_CACHE
+from ioformat._template import precompile_templates as _precompile_templates
 
 
 # Build formatted strings
 def build_mako_str(template_file_name, template_src_path, template_keys,
-                   remove_whitespace=True):
+                   remove_whitespace=True, out=None):
     """ Uses an input dictionary to fill in Mako template file containing the
         keys of the dictionary, then writes a string corresponding to the
         filled-in Mako template.
 
+        Compiled templates are kept in an in-process cache, and are only
+        recompiled if the template file is modified.
+
+        If an output is given, the template is rendered straight into it
+        through a ChunkWriter, with the whitespace removed as it is written,
+        and nothing is returned.
+
         :param template_file_name: Name of the Mako template file
         :type template_file_name: str
         :param template_src_path: Path where Mako template file resides
         :type template_str_path: str
         :param template_keys: keys and values used to fill Mako template
         :type template_keys: dict[template key: template value]
+        :param out: file handle or list of chunks to write the string to
+        :type out: file object, list(str), or ChunkWriter
         :rtype: str
     """
 
     template_file_path = os.path.join(template_src_path, template_file_name)
-    mako_str = Template(filename=template_file_path).render(**template_keys)
+    template = _TEMPLATE_CACHE.get(template_file_path)
 
-    if remove_whitespace:
-        mako_str = remove_trail_whitespace(mako_str)
+    if out is not None:
+        with ChunkWriter(out, remove_whitespace=remove_whitespace) as writer:
+            template.render_context(Context(writer, **template_keys))
+        mako_str = None
+    else:
+        mako_str = template.render(**template_keys)
+        if remove_whitespace:
+            mako_str = remove_trail_whitespace(mako_str)
 
     return mako_str
 
 
+class ChunkWriter():
+    """ Writes strings chunk by chunk to a file handle or a list of chunks,
+        optionally removing trailing spaces and empty lines from them as
+        remove_trail_whitespace does, so that a large string can be written
+        out without first being assembled in full.
+
+        Whitespace is removed from whole lines: the last, incomplete line of
+        a chunk is held back until the rest of it is written or the writer
+        is closed.
+    """
+
+    def __init__(self, out, remove_whitespace=False):
+        """
+        :param out: file handle or list of chunks to write to
+        :type out: file object, list(str), or ChunkWriter
+        :param remove_whitespace: remove trailing spaces and empty lines
+        :type remove_whitespace: bool
+        """
+        self._write = out.append if isinstance(out, list) else out.write
+        self.remove_whitespace = remove_whitespace
+        self._tail = ''
+
+    def write(self, chunk):
+        """ write a chunk of the string
+
+        :param chunk: part of the string
+        :type chunk: str
+        """
+        if self.remove_whitespace:
+            chunk = self._tail + chunk
+            idx = chunk.rfind('\n') + 1
+            self._tail = chunk[idx:]
+            chunk = remove_trail_whitespace(chunk[:idx]) if idx else ''
+        if chunk:
+            self._write(chunk)
+
+    def close(self):
+        """ write out the last line, if it is being held back
+        """
+        if self._tail:
+            tail = remove_trail_whitespace(self._tail)
+            self._tail = ''
+            if tail:
+                self._write(tail)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def template_cache_info():
+    """ Hit, miss, and eviction counts for the compiled template cache.
+
+        :rtype: dict[str: int]
+    """
+    return _TEMPLATE_CACHE.info()
+
+
+def invalidate_template_cache(template_file_path=None):
+    """ Remove a compiled template from the cache, so that it is recompiled
+        from the file on its next use. Clears every template if no path is
+        given.
+
+        :param template_file_path: path to the Mako template file
+        :type template_file_path: str
+    """
+    _TEMPLATE_CACHE.invalidate(template_file_path)
+
+
+def set_template_module_directory(module_directory):
+    """ Have Mako write the Python modules compiled from templates to a
+        directory, so they can be reused by other processes. Already cached
+        templates are cleared so that they are reloaded from it.
+
+        :param module_directory: directory for the compiled modules, or None
+            to compile templates in memory only
+        :type module_directory: str
+    """
+    _TEMPLATE_CACHE.module_directory = module_directory
+    _TEMPLATE_CACHE.invalidate()
+
+
+def precompile_templates(root_dir):
+    """ Compile every Mako template under a directory into a Python module,
+        stored in a __makocache__ directory next to the template, which
+        build_mako_str imports instead of compiling the template. Used to
+        bundle the compiled templates of a package when it is installed.
+
+        :param root_dir: directory to search for .mako files
+        :type root_dir: str
+        :return: paths of the written modules
+        :rtype: tuple(str)
+    """
+    return _precompile_templates(root_dir)
+
+
 def indent(string, nspaces):
     """ Indents each of the lines of a multiline string.
 
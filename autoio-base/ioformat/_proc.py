@@ -0,0 +1,32 @@
+""" Settings for running tasks over several processes
+"""
+
+import os
+
+
+def set_nprocs(nobjs, nprocs='auto'):
+    """ Set the number of processors to use for some task
+
+        The number is never more than the number of objects to spread over
+        the processors, nor less than one.
+
+    :param nobjs: number of objects the task is run over
+    :type nobjs: int
+    :param nprocs: number of processors; 'auto' uses all but one of the
+        available processors
+    :type nprocs: int or str
+    :rtype: int
+    """
+
+    if nprocs == 'auto':
+        _nprocs = len(os.sched_getaffinity(0)) - 1
+    elif isinstance(nprocs, int) and not isinstance(nprocs, bool):
+        _nprocs = nprocs
+    else:
+        raise ValueError(
+            f"nprocs must be 'auto' or an integer, not {nprocs!r}")
+
+    # Set number of processors equal to obj number if more available
+    _nprocs = max(min(_nprocs, nobjs), 1)
+
+    return _nprocs
@@ -0,0 +1,155 @@
+""" In-process cache of compiled Mako templates, so that a template file
+    is only parsed and compiled once per process, rather than on every
+    call to build_mako_str.
+
+    Templates can also be precompiled into Python modules stored in a
+    __makocache__ directory next to the template files (done for the
+    packaged templates at install time), which are imported instead of
+    compiling the template in a new process.
+"""
+
+import os
+import importlib.util
+from collections import OrderedDict
+from mako import codegen
+from mako.template import Template
+from mako.template import ModuleTemplate
+
+DEFAULT_MAXSIZE = 256
+COMPILED_DIR_NAME = '__makocache__'
+
+
+class TemplateCache():
+    """ least-recently-used cache of compiled templates, keyed by the
+        absolute path of the template file and checked against its
+        modification time
+    """
+
+    def __init__(self, maxsize=DEFAULT_MAXSIZE, module_directory=None):
+        self._dct = OrderedDict()
+        self.maxsize = maxsize
+        self.module_directory = module_directory
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.precompiled_loads = 0
+
+    def get(self, template_file_path):
+        """ get the compiled template for a file, compiling it if it is not
+            stored or if the file has been modified since it was compiled
+
+        :param template_file_path: path to the Mako template file
+        :type template_file_path: str
+        :rtype: mako.template.Template
+        """
+        path = os.path.abspath(template_file_path)
+        mtime = os.stat(path).st_mtime_ns
+
+        stored = self._dct.get(path)
+        if stored is not None and stored[0] == mtime:
+            self.hits += 1
+            self._dct.move_to_end(path)
+            template = stored[1]
+        else:
+            self.misses += 1
+            template = _load_precompiled(path, mtime)
+            if template is not None:
+                self.precompiled_loads += 1
+            else:
+                template = Template(filename=path,
+                                    module_directory=self.module_directory)
+            if self.maxsize > 0:
+                self._dct[path] = (mtime, template)
+                self._dct.move_to_end(path)
+                while len(self._dct) > self.maxsize:
+                    self._dct.popitem(last=False)
+                    self.evictions += 1
+
+        return template
+
+    def invalidate(self, template_file_path=None):
+        """ remove a template from the cache, or all of them if no path is
+            given; the counters are kept
+        """
+        if template_file_path is None:
+            self._dct.clear()
+        else:
+            self._dct.pop(os.path.abspath(template_file_path), None)
+
+    def info(self):
+        """ usage statistics for the cache
+
+        :rtype: dict[str: int]
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'precompiled_loads': self.precompiled_loads,
+            'size': len(self._dct),
+            'maxsize': self.maxsize
+        }
+
+
+def precompiled_template_path(template_file_path):
+    """ path of the Python module precompiled from a template file
+
+    :param template_file_path: path to the Mako template file
+    :type template_file_path: str
+    :rtype: str
+    """
+    dir_name, file_name = os.path.split(os.path.abspath(template_file_path))
+    return os.path.join(dir_name, COMPILED_DIR_NAME, file_name + '.py')
+
+
+def precompile_templates(root_dir):
+    """ compile every Mako template under a directory into a Python module
+        in a __makocache__ directory next to it
+
+    :param root_dir: directory to search for .mako files
+    :type root_dir: str
+    :return: paths of the written modules
+    :rtype: tuple(str)
+    """
+    mod_paths = ()
+    for dir_path, dir_names, file_names in os.walk(root_dir):
+        dir_names[:] = [name for name in dir_names
+                        if name != COMPILED_DIR_NAME]
+        for file_name in sorted(file_names):
+            if file_name.endswith('.mako'):
+                path = os.path.join(dir_path, file_name)
+                mod_path = precompiled_template_path(path)
+                os.makedirs(os.path.dirname(mod_path), exist_ok=True)
+                with open(mod_path, mode='w', encoding='utf-8') as fobj:
+                    fobj.write(Template(filename=path).code)
+                mod_paths += (mod_path,)
+
+    return mod_paths
+
+
+def _load_precompiled(template_file_path, mtime):
+    """ load the template from its precompiled module, if there is one that
+        is at least as new as the template file and was written by this
+        version of Mako
+    """
+    mod_path = precompiled_template_path(template_file_path)
+    if (os.path.exists(mod_path) and
+            os.stat(mod_path).st_mtime_ns >= mtime):
+        spec = importlib.util.spec_from_file_location(
+            '_mako_' + os.path.basename(template_file_path).replace('.', '_'),
+            mod_path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        # Modules written by another version of Mako are compiled again
+        if getattr(module, '_magic_number', None) == codegen.MAGIC_NUMBER:
+            template = ModuleTemplate(module, module_filename=mod_path,
+                                      template_filename=template_file_path)
+        else:
+            template = None
+    else:
+        template = None
+
+    return template
+
+
+TEMPLATE_CACHE = TemplateCache()
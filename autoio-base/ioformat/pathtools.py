@@ -4,6 +4,7 @@
 """
 
 import os
+import mmap
 from io import StringIO as _StringIO
 import errno
 import json
@@ -106,6 +107,57 @@ def read_file(path, file_name,
     return file_str
 
 
+def map_file(path, file_name, print_debug=False):
+    """ Map a file with specified prefix path and name into memory
+        as a read-only buffer, without reading or decoding it.
+
+        The buffer can be searched directly with the autoparse.find
+        functions and should be closed when no longer needed. Empty files
+        cannot be mapped, so an empty buffer with the same close and
+        context manager methods is returned for them.
+
+        :param path: path of directory where file will be read
+        :type path: str
+        :param file_name: name of file to be read
+        :type file_name: str
+        :rtype: mmap.mmap
+    """
+
+    fname = os.path.join(path, file_name)
+    if os.path.exists(fname):
+        if os.path.getsize(fname) > 0:
+            with open(fname, mode='rb') as fobj:
+                file_map = mmap.mmap(fobj.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            file_map = _EmptyFileMap()
+    else:
+        file_map = None
+        if print_debug:
+            print('WARNING: FILE NOT FOUND\n'
+                  'NAME:', file_name, '\n'
+                  'PREFIX PATH:', path)
+
+    return file_map
+
+
+class _EmptyFileMap(bytes):
+    """ empty, read-only buffer standing in for the map of an empty file
+    """
+
+    closed = False
+
+    def close(self):
+        """ close the buffer, as for an mmap.mmap
+        """
+        self.closed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
 def write_numpy_file(np_arr, path, file_name):
     """ Save some numpy array to a file using the numpy interface.
 
@@ -3,6 +3,9 @@
 """
 
 import os
+import re
+import shutil
+import tempfile
 import ioformat
 
 
@@ -56,6 +59,86 @@ def test__string_build():
     assert ioformat.addchar(ini_string, ' +++', side='post') == 'molecule +++'
 
 
+def test__string_stream():
+    """ test ioformat.build_mako_str with an output
+        test ioformat.ChunkWriter
+    """
+
+    mako_keys = {'param1': 'molecule   ', 'param2': 'atom', 'param3': 2}
+    ref_str = ioformat.build_mako_str('test.mako', MAKO_PATH, mako_keys)
+
+    chunks = []
+    assert ioformat.build_mako_str(
+        'test.mako', MAKO_PATH, mako_keys, out=chunks) is None
+    assert ''.join(chunks) == ref_str
+
+    # Whitespace is removed the same way when lines span several chunks
+    chunks = []
+    with ioformat.ChunkWriter(chunks, remove_whitespace=True) as writer:
+        for chunk in ('A + B', ' = C  ', '\n  \n\n', 'D \nE', '  '):
+            writer.write(chunk)
+    assert ''.join(chunks) == ioformat.remove_trail_whitespace(
+        'A + B = C  \n  \n\nD \nE  ')
+
+
+def test__template_cache():
+    """ test ioformat.template_cache_info
+        test ioformat.invalidate_template_cache
+        test ioformat.set_template_module_directory
+    """
+
+    mako_keys = {'param1': 'molecule', 'param2': 'atom', 'param3': 1}
+    ioformat.invalidate_template_cache()
+    info1 = ioformat.template_cache_info()
+    mako_str1 = ioformat.build_mako_str('test.mako', MAKO_PATH, mako_keys)
+    mako_str2 = ioformat.build_mako_str('test.mako', MAKO_PATH, mako_keys)
+    info2 = ioformat.template_cache_info()
+    assert mako_str1 == mako_str2
+    assert info2['misses'] - info1['misses'] == 1
+    assert info2['hits'] - info1['hits'] == 1
+    assert info2['size'] == 1
+
+    ioformat.invalidate_template_cache(os.path.join(MAKO_PATH, 'test.mako'))
+    assert ioformat.template_cache_info()['size'] == 0
+
+    mod_dir = tempfile.mkdtemp()
+    ioformat.set_template_module_directory(mod_dir)
+    mako_str3 = ioformat.build_mako_str('test.mako', MAKO_PATH, mako_keys)
+    ioformat.set_template_module_directory(None)
+    assert mako_str3 == mako_str1
+    assert os.listdir(mod_dir)
+
+
+def test__precompiled_templates():
+    """ test ioformat.precompile_templates
+    """
+
+    mako_keys = {'param1': 'molecule', 'param2': 'atom', 'param3': 2}
+    ref_str = ioformat.build_mako_str('test.mako', MAKO_PATH, mako_keys)
+
+    tmp_path = tempfile.mkdtemp()
+    shutil.copy(os.path.join(MAKO_PATH, 'test.mako'), tmp_path)
+    mod_paths = ioformat.precompile_templates(tmp_path)
+    assert len(mod_paths) == 1 and os.path.exists(mod_paths[0])
+
+    nloads = ioformat.template_cache_info()['precompiled_loads']
+    mako_str = ioformat.build_mako_str('test.mako', tmp_path, mako_keys)
+    assert mako_str == ref_str
+    assert ioformat.template_cache_info()['precompiled_loads'] == nloads + 1
+
+    # a module written by another version of Mako is not used
+    with open(mod_paths[0], mode='r', encoding='utf-8') as fobj:
+        mod_str = fobj.read()
+    assert '_magic_number = ' in mod_str
+    mod_str = re.sub(r'_magic_number = \d+', '_magic_number = -1', mod_str)
+    with open(mod_paths[0], mode='w', encoding='utf-8') as fobj:
+        fobj.write(mod_str)
+    ioformat.invalidate_template_cache(os.path.join(tmp_path, 'test.mako'))
+    mako_str = ioformat.build_mako_str('test.mako', tmp_path, mako_keys)
+    assert mako_str == ref_str
+    assert ioformat.template_cache_info()['precompiled_loads'] == nloads + 1
+
+
 def test__string_alter():
     """ test ioformat.headlined_sections
     """
@@ -53,6 +53,7 @@ JSON_DCT = {
 }
 
 NONEXIST_FILE_NAME = 'nofile.dat'
+EMPTY_FILE_NAME = 'empty_file.dat'
 
 
 def test__go_to():
@@ -93,6 +94,27 @@ def test__pathtools():
     assert file3_str is None
 
 
+def test__map_file():
+    """ test ioformat.pathtools.map_file
+    """
+
+    ioformat.pathtools.write_file(FILE_STR, TMP_DIR, FILE_NAME)
+    file_map = ioformat.pathtools.map_file(TMP_DIR, FILE_NAME)
+    assert file_map[:] == FILE_STR.encode('utf-8')
+    file_map.close()
+
+    # Map an empty file, which gives an empty buffer that can be closed
+    ioformat.pathtools.write_file('', TMP_DIR, EMPTY_FILE_NAME)
+    with ioformat.pathtools.map_file(TMP_DIR, EMPTY_FILE_NAME) as file_map:
+        assert file_map[:] == b''
+        assert not file_map.closed
+    assert file_map.closed
+
+    # Map a file from a path that does not exist
+    file_map2 = ioformat.pathtools.map_file(TMP_DIR, NONEXIST_FILE_NAME)
+    assert file_map2 is None
+
+
 def test__numpy_file():
     """ test ioformat.pathtools.write_numpy_file
         test ioformat.pathtools.read_numpy_file
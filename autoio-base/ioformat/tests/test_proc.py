@@ -0,0 +1,25 @@
+""" test ioformat.set_nprocs
+"""
+
+import os
+import pytest
+import ioformat
+
+
+def test__set_nprocs():
+    """ test ioformat.set_nprocs
+    """
+
+    assert ioformat.set_nprocs(10, nprocs=4) == 4
+    assert ioformat.set_nprocs(2, nprocs=4) == 2
+    assert ioformat.set_nprocs(0, nprocs=4) == 1
+    assert ioformat.set_nprocs(100, nprocs='auto') == max(
+        len(os.sched_getaffinity(0)) - 1, 1)
+
+    for nprocs in ('all', 2.0, None, True):
+        with pytest.raises(ValueError):
+            ioformat.set_nprocs(10, nprocs=nprocs)
+
+
+if __name__ == '__main__':
+    test__set_nprocs()
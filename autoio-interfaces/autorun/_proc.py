@@ -9,6 +9,7 @@ import signal
 import multiprocessing
 from functools import wraps
 import numpy
+from ioformat import set_nprocs
 
 
 def utc_time():
@@ -20,23 +21,6 @@ def utc_time():
     return datetime.datetime.utcnow()
 
 
-def set_nprocs(nobjs, nprocs='auto'):
-    """ Set the number of processors to use for some task
-    """
-
-    if nprocs == 'auto':
-        _nprocs = len(os.sched_getaffinity(0)) - 1
-    elif isinstance(nprocs, int):
-        _nprocs = nprocs
-    else:
-        raise NotImplementedError
-
-    # Set number of processors equal to obj number if more available
-    _nprocs = min(_nprocs, nobjs)
-
-    return _nprocs
-
-
 def execute_function_in_parallel(fxn, objs, args, nprocs='auto'):
     """ MultiProcessing wrapper function that can execute some
         function using a set of arguments across multiple processors.
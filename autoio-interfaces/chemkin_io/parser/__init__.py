@@ -6,6 +6,7 @@ from chemkin_io.parser import mechanism
 from chemkin_io.parser import reaction
 from chemkin_io.parser import species
 from chemkin_io.parser import thermo
+from chemkin_io.parser import cache
 
 
 __all__ = [
@@ -13,4 +14,5 @@ __all__ = [
     'reaction',
     'species',
     'thermo',
+    'cache',
 ]
@@ -0,0 +1,386 @@
+""" On-disk cache of parsed Chemkin mechanisms, so that a mechanism string
+    is only parsed once, rather than every time it is loaded.
+
+    Each mechanism is stored under the SHA-256 hash of its contents as two
+    files: a NumPy .npz file holding every number that was read, and a
+    small JSON index holding the species and reaction names, the layout
+    of the reaction parameters, and the offsets of their values in the
+    .npz arrays.
+
+    The reactions are stored as the RxnParams keyword arguments read for
+    each reaction, in the order of the file and before duplicates are
+    combined, and the thermo entries as the fields of a Nasa7Table.
+"""
+
+import os
+import json
+import hashlib
+import zipfile
+import tempfile
+import numpy as np
+from chemkin_io.parser import mechanism
+from chemkin_io.parser import reaction
+from chemkin_io.parser import species
+from chemkin_io.parser import thermo
+
+# Increase if the stored layout, or what the parsers read, changes
+CACHE_VERSION = 1
+
+
+class MechanismCache():
+    """ cache of parsed mechanisms in a directory, keyed by a hash of the
+        mechanism string
+    """
+
+    def __init__(self, cache_dir, nprocs=1):
+        """
+        :param cache_dir: directory for the cache files; made if needed
+        :type cache_dir: str
+        :param nprocs: number of processes used to parse the reactions
+            of mechanisms that are not in the cache
+        :type nprocs: int or str
+        """
+        self.cache_dir = os.path.abspath(cache_dir)
+        self.nprocs = nprocs
+        self.hits = 0
+        self.misses = 0
+
+    def paths(self, mech_str):
+        """ paths of the .npz file and index for a mechanism
+
+        :param mech_str: string of mechanism input file
+        :type mech_str: str
+        :rtype: (str, str)
+        """
+        key = mechanism_key(mech_str)
+        return (os.path.join(self.cache_dir, key + '.npz'),
+                os.path.join(self.cache_dir, key + '.json'))
+
+    def get(self, mech_str):
+        """ the parsed mechanism, read from the cache if it is stored and
+            parsed and stored otherwise
+
+        :param mech_str: string of mechanism input file
+        :type mech_str: str
+        :return: species names, {rxn: RxnParams}, and NASA-7 table; each
+            is None if its block is missing from the mechanism
+        :rtype: (tuple(str), dict, thermo.Nasa7Table)
+        """
+        npz_path, idx_path = self.paths(mech_str)
+
+        data = _load(npz_path, idx_path)
+        if data is not None:
+            self.hits += 1
+        else:
+            self.misses += 1
+            data = _read(mech_str, nprocs=self.nprocs)
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # A mechanism with values that cannot be stored is not cached
+            try:
+                _store(data, npz_path, idx_path)
+            except TypeError:
+                pass
+
+        return _build(data)
+
+    def invalidate(self, mech_str=None):
+        """ remove a mechanism from the cache, or all of them if no
+            mechanism is given; the counters are kept
+
+        :param mech_str: string of mechanism input file
+        :type mech_str: str
+        """
+        if mech_str is None:
+            paths = ()
+            if os.path.isdir(self.cache_dir):
+                paths = tuple(
+                    os.path.join(self.cache_dir, name)
+                    for name in os.listdir(self.cache_dir)
+                    if name.endswith(('.npz', '.json')))
+        else:
+            paths = self.paths(mech_str)
+
+        for path in paths:
+            if os.path.exists(path):
+                os.remove(path)
+
+    def info(self):
+        """ usage statistics for the cache
+
+        :rtype: dict[str: int]
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+        }
+
+
+def mechanism_key(mech_str):
+    """ hash of a mechanism string, used as the name of its cache files
+
+    :param mech_str: string of mechanism input file
+    :type mech_str: str
+    :rtype: str
+    """
+    hasher = hashlib.sha256(f'v{CACHE_VERSION:d}\n'.encode('utf-8'))
+    hasher.update(mech_str.encode('utf-8'))
+    return hasher.hexdigest()
+
+
+def parse_mechanism(mech_str, cache_dir=None, nprocs=1):
+    """ Parses the species, reactions, and thermo of a mechanism string,
+        reading them from a cache directory if the same string was parsed
+        before
+
+        :param mech_str: string of mechanism input file
+        :type mech_str: str
+        :param cache_dir: directory for the cache files; nothing is cached
+            if None
+        :type cache_dir: str
+        :param nprocs: number of processes used to parse the reactions
+        :type nprocs: int or str
+        :return: species names, {rxn: RxnParams}, and NASA-7 table; each
+            is None if its block is missing from the mechanism
+        :rtype: (tuple(str), dict, thermo.Nasa7Table)
+    """
+
+    if cache_dir is not None:
+        parsed = MechanismCache(cache_dir, nprocs=nprocs).get(mech_str)
+    else:
+        parsed = _build(_read(mech_str, nprocs=nprocs))
+
+    return parsed
+
+
+# Parse, store, and load the data for a mechanism
+def _read(mech_str, nprocs=1):
+    """ Parse a mechanism string into the data that is stored
+    """
+
+    spc_block_str = mechanism.species_block(mech_str)
+    spc_names = species.names(spc_block_str)
+
+    rxn_block_str = mechanism.reaction_block(mech_str)
+    rxn_inputs = None
+    if rxn_block_str is not None:
+        ea_units, a_units = mechanism.reaction_units(mech_str)
+        rxn_inputs = reaction.get_rxn_param_inputs(
+            rxn_block_str, ea_units, a_units, nprocs=nprocs)
+
+    therm_block_str = mechanism.thermo_block(mech_str)
+    therm_table = None
+    if therm_block_str is not None:
+        therm_table = thermo.read_nasa7_table(therm_block_str)
+
+    return spc_names, rxn_inputs, therm_table
+
+
+def _build(data):
+    """ Create the parsed objects from the stored data
+    """
+
+    spc_names, rxn_inputs, therm_table = data
+    rxn_param_dct = None
+    if rxn_inputs is not None:
+        rxn_param_dct = reaction.build_rxn_param_dct(*rxn_inputs)
+
+    return spc_names, rxn_param_dct, therm_table
+
+
+def _store(data, npz_path, idx_path):
+    """ Write the data for a mechanism; the index is written last, so a
+        mechanism is only read back once both files are complete
+    """
+
+    spc_names, rxn_inputs, therm_table = data
+
+    values = []
+    index = {'version': CACHE_VERSION, 'species': spc_names}
+    arrays = {}
+    if rxn_inputs is not None:
+        index['reactions'] = _pack(rxn_inputs, values)
+    if therm_table is not None:
+        index['thermo'] = {
+            'names': therm_table.names,
+            'notes': therm_table.notes,
+            'phases': therm_table.phases,
+            'comp_strs': therm_table.comp_strs,
+        }
+        arrays['temps'] = therm_table.temps
+        arrays['coeffs'] = therm_table.coeffs
+    arrays['values'] = np.array(values, dtype=float)
+
+    _write_atomic(npz_path, lambda fobj: np.savez(fobj, **arrays), mode='wb')
+    _write_atomic(idx_path, lambda fobj: json.dump(index, fobj), mode='w')
+
+
+def _load(npz_path, idx_path):
+    """ Read the data for a mechanism; None if it is not stored, or was
+        stored by another version or not completely
+    """
+
+    data = None
+    if os.path.exists(idx_path) and os.path.exists(npz_path):
+        try:
+            with open(idx_path, mode='r', encoding='utf-8') as fobj:
+                index = json.load(fobj)
+            if index.get('version') == CACHE_VERSION:
+                with np.load(npz_path, allow_pickle=False) as arrays:
+                    values = arrays['values']
+                    spc_names = index['species']
+                    if spc_names is not None:
+                        spc_names = tuple(spc_names)
+                    rxn_inputs = None
+                    if 'reactions' in index:
+                        rxn_inputs = _unpack(index['reactions'], values)
+                    therm_table = None
+                    if 'thermo' in index:
+                        therm_idx = index['thermo']
+                        therm_table = thermo.Nasa7Table(
+                            therm_idx['names'], therm_idx['notes'],
+                            therm_idx['phases'], therm_idx['comp_strs'],
+                            arrays['temps'], arrays['coeffs'])
+                data = (spc_names, rxn_inputs, therm_table)
+        except (OSError, EOFError, ValueError, KeyError, TypeError,
+                IndexError, zipfile.BadZipFile):
+            data = None
+
+    return data
+
+
+def _write_atomic(path, writer, mode):
+    """ Write a file through a temporary file in the same directory, so
+        that a partly written file is never read
+    """
+    dir_name = os.path.dirname(path)
+    fdesc, tmp_path = tempfile.mkstemp(dir=dir_name, suffix='.tmp')
+    try:
+        encoding = None if 'b' in mode else 'utf-8'
+        with os.fdopen(fdesc, mode=mode, encoding=encoding) as fobj:
+            writer(fobj)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+# Store nested Python data as JSON, with the numbers moved to an array
+def _pack(obj, values):
+    """ JSON-compatible description of an object, with the numbers of
+        numeric lists, tuples, and arrays appended to `values`
+
+        Scalars are kept as they are, and other objects are described by
+        a dictionary with a single key giving their type; a TypeError is
+        raised for objects of any other type.
+    """
+
+    if obj is None or isinstance(obj, (bool, str, int, float)):
+        desc = obj
+    elif isinstance(obj, np.ndarray):
+        desc = {'array': _pack_values(obj.astype(float), values)}
+    elif isinstance(obj, (list, tuple)):
+        seq_name = 'list' if isinstance(obj, list) else 'tuple'
+        if _numeric_shape(obj) is not None:
+            arr = np.array(obj, dtype=float)
+            desc = {seq_name: _pack_values(arr, values)}
+            int_idxs = [idx for idx, val in enumerate(_flatten(obj))
+                        if isinstance(val, int)]
+            if int_idxs:
+                desc['ints'] = int_idxs
+        else:
+            desc = {seq_name + 's': [
+                _pack(item, values) for item in obj]}
+    elif isinstance(obj, dict):
+        desc = {'dict': [
+            [_pack(key, values), _pack(val, values)]
+            for key, val in obj.items()]}
+    else:
+        raise TypeError(
+            f'Cannot cache object of type {type(obj).__name__}')
+
+    return desc
+
+
+def _unpack(desc, values):
+    """ Recreate an object from its description and the stored values
+    """
+
+    if not isinstance(desc, dict):
+        obj = desc
+    elif 'array' in desc:
+        obj = _unpack_values(desc['array'], values).copy()
+    elif 'list' in desc or 'tuple' in desc:
+        seq_type = list if 'list' in desc else tuple
+        arr = _unpack_values(desc[seq_type.__name__], values)
+        obj = arr.tolist()
+        for idx in desc.get('ints', ()):
+            pos = np.unravel_index(idx, arr.shape)
+            inner = obj
+            for sub_idx in pos[:-1]:
+                inner = inner[sub_idx]
+            inner[pos[-1]] = int(inner[pos[-1]])
+        obj = seq_type(obj)
+    elif 'lists' in desc:
+        obj = [_unpack(item, values) for item in desc['lists']]
+    elif 'tuples' in desc:
+        obj = tuple(_unpack(item, values) for item in desc['tuples'])
+    else:
+        obj = {_unpack(key, values): _unpack(val, values)
+               for key, val in desc['dict']}
+
+    return obj
+
+
+def _pack_values(arr, values):
+    """ Append the values of an array, returning their offset and shape
+    """
+    offset = len(values)
+    values.extend(arr.ravel().tolist())
+    return [offset, list(arr.shape)]
+
+
+def _unpack_values(loc, values):
+    """ The array stored at an offset, with a shape
+    """
+    offset, shape = loc
+    size = int(np.prod(shape, dtype=int))
+    return values[offset:offset+size].reshape(shape)
+
+
+def _numeric_shape(obj):
+    """ Shape of a non-empty, rectangular list of lists (or tuple) of
+        numbers that are exact as floats; None for anything else
+    """
+
+    if isinstance(obj, bool):
+        shape = None
+    elif isinstance(obj, float):
+        shape = ()
+    elif isinstance(obj, int):
+        shape = () if abs(obj) < 2**53 else None
+    elif isinstance(obj, (list, tuple)) and obj:
+        shapes = set()
+        for item in obj:
+            if isinstance(item, tuple) or (
+                    isinstance(item, list) and not isinstance(obj, list)):
+                shapes.add(None)
+                break
+            shapes.add(_numeric_shape(item))
+        if len(shapes) == 1 and None not in shapes:
+            shape = (len(obj),) + shapes.pop()
+        else:
+            shape = None
+    else:
+        shape = None
+
+    return shape
+
+
+def _flatten(obj):
+    """ The items of a nested list, in order
+    """
+    for item in obj:
+        if isinstance(item, list):
+            yield from _flatten(item)
+        else:
+            yield item
@@ -1,14 +1,15 @@
 """ functions operating on the reactions block string
 """
 
-import sys
-import collections
+import functools
 import itertools
+import multiprocessing
 import numpy as np
 import autoparse.pattern as app
 import autoparse.find as apf
 from autoparse import cast as ap_cast
 from ioformat import headlined_sections
+from ioformat import set_nprocs
 from phydat import phycon
 from autoreact.params import RxnParams
 
@@ -39,48 +40,204 @@ COEFF_PATTERN = (app.NUMBER + app.LINESPACES + app.NUMBER +
 COMMENTS_PATTERN = app.escape(
     '!') + app.capturing(app.one_or_more(app.WILDCARD2))
 
+LOW_PATTERN = (
+    'LOW' +
+    app.zero_or_more(app.SPACE) + app.escape('/') +
+    app.zero_or_more(app.SPACE) + app.capturing(app.NUMBER) +
+    app.one_or_more(app.SPACE) + app.capturing(app.NUMBER) +
+    app.one_or_more(app.SPACE) + app.capturing(app.NUMBER) +
+    app.zero_or_more(app.SPACE) + app.escape('/'))
+TROE_PATTERN = (
+    'TROE' +
+    app.zero_or_more(app.SPACE) + app.escape('/') +
+    app.zero_or_more(app.SPACE) + app.capturing(app.NUMBER) +
+    app.one_or_more(app.SPACE) + app.capturing(app.NUMBER) +
+    app.one_or_more(app.SPACE) + app.capturing(app.NUMBER) +
+    app.maybe(app.one_or_more(app.SPACE) + app.capturing(app.NUMBER)) +
+    app.zero_or_more(app.SPACE) + app.escape('/'))
+PLOG_PATTERN = (
+    'PLOG' +
+    app.zero_or_more(app.SPACE) + app.escape('/') +
+    app.zero_or_more(app.SPACE) + app.capturing(app.NUMBER) +
+    app.one_or_more(app.SPACE) + app.capturing(app.NUMBER) +
+    app.one_or_more(app.SPACE) + app.capturing(app.NUMBER) +
+    app.one_or_more(app.SPACE) + app.capturing(app.NUMBER) +
+    app.zero_or_more(app.SPACE) + app.escape('/'))
+TCHEB_PATTERN = (
+    'TCHEB' + app.zero_or_more(app.SPACE) + app.escape('/') +
+    app.zero_or_more(app.SPACE) + app.capturing(app.NUMBER) +
+    app.one_or_more(app.SPACE) + app.capturing(app.NUMBER) +
+    app.zero_or_more(app.SPACE) + app.escape('/'))
+PCHEB_PATTERN = (
+    'PCHEB' + app.zero_or_more(app.SPACE) + app.escape('/') +
+    app.zero_or_more(app.SPACE) + app.capturing(app.NUMBER) +
+    app.one_or_more(app.SPACE) + app.capturing(app.NUMBER) +
+    app.zero_or_more(app.SPACE) + app.escape('/'))
+CHEB_PATTERN = (
+    app.not_preceded_by(app.one_of_these(['T', 'P'])) +
+    'CHEB' + app.zero_or_more(app.SPACE) +
+    app.escape('/') + app.capturing(app.one_or_more(app.WILDCARD2)) +
+    app.escape('/'))
+COLLIDER_PATTERN = (
+    app.capturing(app.one_or_more(app.one_of_these([
+        app.LETTER, app.DIGIT,
+        app.escape('('), app.escape(')'),
+        app.UNDERSCORE]))) +
+    app.zero_or_more(app.SPACE) +
+    app.escape('/') + app.zero_or_more(app.SPACE) +
+    app.capturing(app.NUMBER) + app.zero_or_more(app.SPACE) +
+    app.escape('/') + app.zero_or_more(app.SPACE))
+# Keywords of lines that do not hold collider efficiencies
+AUX_KEYWORDS = ('DUP', 'LOW', 'TROE', 'CHEB', 'PLOG', '=')
+# Keywords of the blocks of values closed by a '/', which may be continued
+# onto the following lines
+BLOCK_KEYWORDS = ('LOW', 'TROE', 'CHEB', 'PLOG')
+
 BAD_STRS = ['inf', 'INF', 'nan']
 
 
-def get_rxn_param_dct(block_str, ea_units, a_units):
+def get_rxn_param_dct(block_str, ea_units, a_units, nprocs=1,
+                      executor=None):
     """ Parses all of the chemical equations and corresponding fitting
         parameters in the reactions block of the mechanism input file
         and subsequently pulls all of the species names and fitting
         parameters from the data string; this information is stored in a list.
 
+        The reaction strings can be parsed in several processes: they are
+        split into contiguous chunks, and the parsed chunks are joined back
+        in the order of the block before duplicates are combined, so the
+        result does not depend on the number of processes.
+
         :param block_str: raw string for the entire reactions block
         :type block_str: str
         :param ea_units: units of activation energy
         :type ea_units: str
         :param a_units: units of rate constants; either 'moles' or 'molecules'
         :type a_units: str
+        :param nprocs: number of processes; 'auto' uses all but one of the
+            available processors, and 1 parses the block in this process
+        :type nprocs: int or str
+        :param executor: object with a `map` method that returns results in
+            order, such as a concurrent.futures executor or a
+            multiprocessing pool, used instead of starting a new pool
+        :type executor: obj
         :return rxn_param_dct: dct {rxn1: params1, rxn2: ...}
         :rtype: dict
     """
 
+    rxn_inputs = get_rxn_param_inputs(
+        block_str, ea_units, a_units, nprocs=nprocs, executor=executor)
+
+    if rxn_inputs is not None:
+        rxn_param_dct = build_rxn_param_dct(*rxn_inputs)
+    else:
+        rxn_param_dct = None
+
+    return rxn_param_dct
+
+
+def get_rxn_param_inputs(block_str, ea_units, a_units, nprocs=1,
+                         executor=None):
+    """ Parses the chemical equations and fitting parameters in the
+        reactions block into the reactions and the keyword arguments for
+        the RxnParams object of each, before any duplicates are combined.
+
+        These are plain Python and numpy data, so they can be sent between
+        processes or stored, and turned into RxnParams objects later with
+        `build_rxn_param_dct`.
+
+        :param block_str: raw string for the entire reactions block
+        :type block_str: str
+        :param ea_units: units of activation energy
+        :type ea_units: str
+        :param a_units: units of rate constants; either 'moles' or 'molecules'
+        :type a_units: str
+        :param nprocs: number of processes; 'auto' uses all but one of the
+            available processors, and 1 parses the block in this process
+        :type nprocs: int or str
+        :param executor: object with a `map` method that returns results in
+            order, used instead of starting a new pool
+        :type executor: obj
+        :return: reactions and RxnParams keyword arguments, in block order
+        :rtype: (list, list(dict))
+    """
+
     rxn_strs = get_rxn_strs(block_str)
 
     if rxn_strs is not None:
-        # Loop over each reaction string, creating a RxnParams object for each
-        rxns = []
-        params_lst = []
-        for rxn_str in rxn_strs:
-            rxn = get_rxn_name(rxn_str)
-            params = get_params(rxn_str, ea_units, a_units)
-            rxns.append(rxn)
-            params_lst.append(params)
-
-        # Fix any duplicates
-        rxns, params_lst = fix_duplicates(rxns, params_lst)
-        # Zip into a dictionary
-        rxn_param_dct = dict(zip(rxns, params_lst))
+        # Parse chunks of reaction strings, then join the chunks back in order
+        fxn = functools.partial(
+            _parse_rxn_strs, ea_units=ea_units, a_units=a_units)
+        _nprocs = set_nprocs(len(rxn_strs), nprocs=nprocs)
+        if executor is not None:
+            chunks = _chunk_rxn_strs(rxn_strs, _nprocs)
+            outputs = tuple(executor.map(fxn, chunks))
+        elif _nprocs > 1:
+            chunks = _chunk_rxn_strs(rxn_strs, _nprocs)
+            with multiprocessing.Pool(processes=_nprocs) as pool:
+                outputs = tuple(pool.imap(fxn, chunks))
+        else:
+            outputs = (fxn(rxn_strs),)
+
+        rxns = [rxn for output in outputs for rxn in output[0]]
+        inputs_lst = [inputs for output in outputs for inputs in output[1]]
+        rxn_inputs = (rxns, inputs_lst)
 
     else:
-        rxn_param_dct = None
+        rxn_inputs = None
+
+    return rxn_inputs
+
+
+def build_rxn_param_dct(rxns, inputs_lst):
+    """ Creates the RxnParams object for each reaction from its keyword
+        arguments and combines those of any duplicate reactions
+
+        :param rxns: all reaction keys
+        :type rxns: list
+        :param inputs_lst: RxnParams keyword arguments for each reaction
+        :type inputs_lst: list(dict)
+        :return rxn_param_dct: dct {rxn1: params1, rxn2: ...}
+        :rtype: dict
+    """
+
+    params_lst = [RxnParams(**inputs) for inputs in inputs_lst]
+
+    # Fix any duplicates
+    rxns, params_lst = fix_duplicates(rxns, params_lst)
+    # Zip into a dictionary
+    rxn_param_dct = dict(zip(rxns, params_lst))
 
     return rxn_param_dct
 
 
+def _parse_rxn_strs(rxn_strs, ea_units, a_units):
+    """ Parse a chunk of reaction strings into reactions and RxnParams
+        keyword arguments, in order
+    """
+
+    rxns = []
+    inputs_lst = []
+    for rxn_str in rxn_strs:
+        rxn_toks = tokenize_rxn_str(rxn_str)
+        rxns.append(rxn_toks['rxn'])
+        inputs_lst.append(
+            _param_inputs(rxn_toks, ea_units, a_units, rxn_str))
+
+    return rxns, inputs_lst
+
+
+def _chunk_rxn_strs(rxn_strs, nprocs):
+    """ Split the reaction strings into contiguous chunks, a few per process
+    """
+
+    chunksize, extra = divmod(len(rxn_strs), nprocs * 4)
+    chunksize = max(chunksize + (1 if extra else 0), 1)
+
+    return tuple(rxn_strs[idx:idx+chunksize]
+                 for idx in range(0, len(rxn_strs), chunksize))
+
+
 def get_pes_dct(block_str):
     """ Parses all of the chemical equations
         and uses special comment line to parse them into PESs
@@ -129,14 +286,7 @@ def get_rxn_name(rxn_str):
         :return rxn: tuple describing the reactants, products, and third body
         :rtype: tuple ((rct1, rct2, ...), (prd1, prd2, ...), (third_bod1, ...))
     """
-
-    rcts = rct_names(rxn_str)
-    prds = prd_names(rxn_str)
-    thd_bod = third_body(rxn_str)
-
-    rxn = (rcts, prds, thd_bod)
-
-    return rxn
+    return tokenize_rxn_str(rxn_str)['rxn']
 
 
 def get_params(rxn_str, ea_units, a_units):
@@ -151,24 +301,36 @@ def get_params(rxn_str, ea_units, a_units):
         :return params: object describing the rate parameters
         :rtype: autoreact.RxnParams object
     """
+    return _params(tokenize_rxn_str(rxn_str), ea_units, a_units, rxn_str)
+
+
+def _params(rxn_toks, ea_units, a_units, rxn_str):
+    """ Builds a RxnParams object from the tokens of a rxn
+    """
+    return RxnParams(**_param_inputs(rxn_toks, ea_units, a_units, rxn_str))
+
 
-    rxn = get_rxn_name(rxn_str)
+def _param_inputs(rxn_toks, ea_units, a_units, rxn_str):
+    """ Builds the RxnParams keyword arguments from the tokens of a rxn
+    """
+
+    rxn = rxn_toks['rxn']
     param_tuple = (
-        high_p(rxn_str, ea_units, a_units),
-        low_p(rxn_str, ea_units, a_units),
-        troe(rxn_str),
-        cheb(rxn_str),
-        plog(rxn_str, ea_units, a_units),
-        colliders(rxn_str))
+        _high_p(rxn_toks, ea_units, a_units),
+        _low_p(rxn_toks, ea_units, a_units),
+        _troe(rxn_toks),
+        _cheb(rxn_toks, rxn_str),
+        _plog(rxn_toks, ea_units, a_units),
+        rxn_toks['collid'])
 
     if param_tuple[3] is not None:  # Chebyshev
         cheb_dct = param_tuple[3]
         cheb_dct['one_atm_arr'] = param_tuple[0]  # might be None
-        params = RxnParams(cheb_dct=cheb_dct)
+        inputs = {'cheb_dct': cheb_dct}
 
     elif param_tuple[4] is not None:  # PLOG
         plog_dct = param_tuple[4]
-        params = RxnParams(plog_dct=plog_dct)
+        inputs = {'plog_dct': plog_dct}
 
     elif param_tuple[2] is not None:  # Troe
         assert param_tuple[0] is not None, (
@@ -183,7 +345,7 @@ def get_params(rxn_str, ea_units, a_units):
         troe_dct['lowp_arr'] = param_tuple[1]
         troe_dct['troe_params'] = param_tuple[2]
         troe_dct['collid'] = param_tuple[5]
-        params = RxnParams(troe_dct=troe_dct)
+        inputs = {'troe_dct': troe_dct}
 
     elif param_tuple[1] is not None:  # Lindemann
         assert param_tuple[0] is not None, (
@@ -194,7 +356,7 @@ def get_params(rxn_str, ea_units, a_units):
         lind_dct['highp_arr'] = param_tuple[0]
         lind_dct['lowp_arr'] = param_tuple[1]
         lind_dct['collid'] = param_tuple[5]
-        params = RxnParams(lind_dct=lind_dct)
+        inputs = {'lind_dct': lind_dct}
 
     else:  # simple Arrhenius
         assert param_tuple[0] is not None, (
@@ -202,9 +364,115 @@ def get_params(rxn_str, ea_units, a_units):
         arr_dct = {}
         arr_dct['arr_tuples'] = param_tuple[0]
         arr_dct['arr_collid'] = param_tuple[5]
-        params = RxnParams(arr_dct=arr_dct)
+        inputs = {'arr_dct': arr_dct}
 
-    return params
+    return inputs
+
+
+def tokenize_rxn_str(rxn_str):
+    """ Walks the lines of a reaction string once, sorting them into the
+        chemical equation and the LOW, TROE, PLOG, TCHEB, PCHEB, CHEB, DUP,
+        and collider efficiency lines, and reads the raw values of each.
+
+        Each line is only searched with the pattern for its own keywords,
+        rather than the whole string being searched once per keyword.
+
+        :param rxn_str: raw Chemkin string for a single reaction
+        :type rxn_str: str
+        :return rxn_toks: the reaction key, the strings captured for each
+            keyword (None or empty if absent), and the collider efficiencies
+        :rtype: dict[str: obj]
+    """
+
+    lines = rxn_str.splitlines()
+
+    # The chemical equation and high-P parameters are on the first line;
+    # any other layout falls back to searching the whole string
+    eqn_caps = apf.first_capture(EQUATION_PATTERN, lines[0]) if lines else None
+    if eqn_caps is None or eqn_caps[2] is None:
+        trd_caps = apf.first_capture(EQUATION_PATTERN, rxn_str)
+        eqn_caps = apf.first_capture(_first_line_pattern(
+            rct_ptt=app.capturing(SPECIES_NAMES_PATTERN),
+            prd_ptt=app.capturing(SPECIES_NAMES_PATTERN),
+            param_ptt=app.capturing(COEFF_PATTERN)), rxn_str)
+        trd_str = trd_caps[0] if trd_caps is not None else None
+        if eqn_caps is None:
+            raise ValueError(_bad_rxn_line_message(rxn_str))
+    else:
+        trd_str = eqn_caps[0]
+    rct_str, prd_str, highp_str = eqn_caps
+
+    # Collider efficiencies are only read for reactions with third bodies
+    read_collid = ('LOW' in rxn_str or 'TROE' in rxn_str
+                   or 'M=' in rxn_str or 'M =' in rxn_str)
+
+    low_caps, troe_caps, tcheb_caps, pcheb_caps = None, None, None, None
+    plog_caps, cheb_caps = [], []
+    collid = {}
+    dup = False
+    for line in _join_block_lines(lines):
+        if 'DUP' in line:
+            dup = True
+        if 'LOW' in line and low_caps is None:
+            low_caps = apf.first_capture(LOW_PATTERN, line)
+        if 'TROE' in line and troe_caps is None:
+            troe_caps = apf.first_capture(TROE_PATTERN, line)
+        if 'PLOG' in line:
+            plog_caps.extend(apf.all_captures(PLOG_PATTERN, line) or ())
+        if 'CHEB' in line:
+            code = apf.remove(COMMENTS_PATTERN, line)
+            if 'TCHEB' in code and tcheb_caps is None:
+                tcheb_caps = apf.first_capture(TCHEB_PATTERN, code)
+            if 'PCHEB' in code and pcheb_caps is None:
+                pcheb_caps = apf.first_capture(PCHEB_PATTERN, code)
+            cheb_caps.extend(apf.all_captures(CHEB_PATTERN, code) or ())
+        if read_collid and '/' in line and not any(
+                string in line for string in AUX_KEYWORDS):
+            for bath in apf.all_captures(COLLIDER_PATTERN, line) or ():
+                collid[bath[0]] = float(bath[1])
+
+    rxn_toks = {
+        'rxn': (_reagent_names(rct_str, rxn_str),
+                _reagent_names(prd_str, rxn_str),
+                _third_body(trd_str)),
+        'highp': highp_str,
+        'low': low_caps,
+        'troe': troe_caps,
+        'plog': tuple(plog_caps),
+        'tcheb': tcheb_caps,
+        'pcheb': pcheb_caps,
+        'cheb': tuple(cheb_caps),
+        'dup': dup,
+        # If nothing was put into the dictionary, set it to None
+        'collid': collid if collid else None,
+    }
+
+    return rxn_toks
+
+
+def _join_block_lines(lines):
+    """ Join each line with a LOW, TROE, PLOG, TCHEB, PCHEB, or CHEB block
+        that is not closed on that line to the lines that follow it, up to
+        the closing '/', so that the block is matched as a whole
+    """
+
+    joined_lines = []
+    for line in lines:
+        if joined_lines and _has_open_block(joined_lines[-1]):
+            joined_lines[-1] += '\n' + line
+        else:
+            joined_lines.append(line)
+
+    return joined_lines
+
+
+def _has_open_block(line):
+    """ Does the last keyword block on a line, outside of any comment,
+        lack its closing '/'?
+    """
+    code = line.split('!')[0]
+    idx = max(code.rfind(keyword) for keyword in BLOCK_KEYWORDS)
+    return idx >= 0 and code.count('/', idx) < 2
 
 
 def get_pes_info(rxn_str):
@@ -259,6 +527,10 @@ def fix_duplicates(rxns, params_lst):
     """ This function finds any duplicates within the list of rxns. If any are
         found, combines the corresponding RxnParams objects
 
+        The unique rxns are returned in the order they first appear, and the
+        params of each duplicate are combined, in order, into the params of
+        the first occurrence.
+
         :param rxns: all reaction keys
         :type rxns: list
         :param params: all reaction parameters
@@ -269,34 +541,17 @@ def fix_duplicates(rxns, params_lst):
         :rtype: list
     """
 
-    # Get the unique rxns and number of occurrences
-    unique_rxns = list(set(rxns))
-    dup_counts = collections.Counter(rxns)
-    unique_params = []
-
-    # Loop through each unique item, looking for duplicates
-    for unique_rxn in unique_rxns:
-        # Get the index of the first occurrence in the original list
-        prev_match_idx = rxns.index(unique_rxn)
-        # Get the params for the first occurence
-        params = params_lst[prev_match_idx]
-        # Get the number of occurrences of the rxn
-        dup_count = dup_counts[unique_rxn]
-
-        # Loop over each duplicate of the reaction; the 1 in range skips the
-        # first loop and thus won't do any loops if dup_count == 1
-        for _ in range(1, dup_count):
-            # Get the current match index by looking just past the previous one
-            match_idx = rxns.index(unique_rxn, prev_match_idx + 1)
-            # Get the new params to be added to the existing ones
-            new_params = params_lst[match_idx]
-            # Combine the params with the existing ones
-            params.combine_objects(new_params)
-            # Update the search index
-            prev_match_idx = match_idx
-
-        # Append the combined params to the unique params
-        unique_params.append(params)
+    # Loop over the rxns once, combining the params of each duplicate with
+    # those of the first occurrence
+    unique_param_dct = {}
+    for rxn, params in zip(rxns, params_lst):
+        if rxn in unique_param_dct:
+            unique_param_dct[rxn].combine_objects(params)
+        else:
+            unique_param_dct[rxn] = params
+
+    unique_rxns = list(unique_param_dct.keys())
+    unique_params = list(unique_param_dct.values())
 
     return unique_rxns, unique_params
 
@@ -311,20 +566,7 @@ def rct_names(rxn_str):
         :return names: names of the reactants
         :rtype: tuple(str)
     """
-
-    pattern = _first_line_pattern(
-        rct_ptt=app.capturing(SPECIES_NAMES_PATTERN),
-        prd_ptt=SPECIES_NAMES_PATTERN,
-        param_ptt=COEFF_PATTERN)
-    string = apf.first_capture(pattern, rxn_str)
-    try:
-        names = _split_reagent_string(string)
-    except TypeError:
-        print('Reaction line not formatted correctly:\n', rxn_str)
-        print('Check that there are three numbers after the rxn equation')
-        sys.exit()
-
-    return names
+    return tokenize_rxn_str(rxn_str)['rxn'][0]
 
 
 def prd_names(rxn_str):
@@ -337,20 +579,7 @@ def prd_names(rxn_str):
         :return names: names of the products
         :rtype: tuple(str)
     """
-
-    pattern = _first_line_pattern(
-        rct_ptt=SPECIES_NAMES_PATTERN,
-        prd_ptt=app.capturing(SPECIES_NAMES_PATTERN),
-        param_ptt=COEFF_PATTERN)
-    string = apf.first_capture(pattern, rxn_str)
-    try:
-        names = _split_reagent_string(string)
-    except TypeError:
-        print('Reaction line not formatted correctly:\n', rxn_str)
-        print('Check that there are three numbers after the rxn equation')
-        sys.exit()
-
-    return names
+    return tokenize_rxn_str(rxn_str)['rxn'][1]
 
 
 def third_body(rxn_str):
@@ -363,29 +592,7 @@ def third_body(rxn_str):
         :return trd_body: names of the colliders and corresponding fraction
         :rtype: tuple(str)
     """
-
-    pattern = _first_line_pattern(
-        rct_ptt=app.capturing(SPECIES_NAMES_PATTERN),
-        prd_ptt=SPECIES_NAMES_PATTERN,
-        param_ptt=app.maybe(COEFF_PATTERN))
-    rgt_str = apf.first_capture(pattern, rxn_str)
-    rgt_str = apf.remove(app.LINESPACES, rgt_str)
-    rgt_split_paren = apf.split(CHEMKIN_PAREN_PLUS, rgt_str)
-    rgt_split_plus = apf.split(app.PLUS, rgt_str)
-
-    if len(rgt_split_paren) > 1:
-        trd_body = '(+' + apf.split(CHEMKIN_PAREN_CLOSE,
-                                    rgt_split_paren[1])[0] + ')'
-
-    elif 'M' in rgt_split_plus:
-        trd_body = '+M'
-
-    else:
-        trd_body = None
-
-    trd_body = (trd_body,)
-
-    return trd_body
+    return tokenize_rxn_str(rxn_str)['rxn'][2]
 
 
 def high_p(rxn_str, ea_units, a_units):
@@ -402,28 +609,7 @@ def high_p(rxn_str, ea_units, a_units):
         :return params: Arrhenius fitting parameters for high-P rates
         :rtype: list(list(float))
     """
-
-    pattern = _first_line_pattern(
-        rct_ptt=SPECIES_NAMES_PATTERN,
-        prd_ptt=SPECIES_NAMES_PATTERN,
-        param_ptt=app.capturing(COEFF_PATTERN))
-    string_lst = apf.all_captures(pattern, rxn_str)
-    if string_lst:
-        fake_params = []
-        for string in string_lst:
-            fake_params.append(list(ap_cast(string.split())))
-            params = fake_params[0]
-
-        # Convert the units of Ea and A
-        ea_conv_factor = get_ea_conv_factor(ea_units)
-        a_conv_factor = get_a_conv_factor(rxn_str, a_units)
-        params[2] = params[2] * ea_conv_factor
-        params[0] = params[0] * a_conv_factor
-        params = [params]  # convert to list inside a list
-    else:
-        params = None
-
-    return params
+    return _high_p(tokenize_rxn_str(rxn_str), ea_units, a_units)
 
 
 def low_p(rxn_str, ea_units, a_units):
@@ -440,57 +626,113 @@ def low_p(rxn_str, ea_units, a_units):
         :return params: Arrhenius fitting parameters for low-P rates
         :rtype: list(list(float))
     """
+    return _low_p(tokenize_rxn_str(rxn_str), ea_units, a_units)
+
+
+def troe(rxn_str):
+    """ Parses the data string for a reaction in the reactions block
+        for a line containing the Troe fitting parameters,
+        then reads the parameters from this line.
+
+        Only gets the 4 Troe-specific parameters: alpha, T***, T*, and T**
+
+        :param rxn_str: raw Chemkin string for a single reaction
+        :type rxn_str: str
+        :return params: Troe fitting parameters
+        :rtype: list(float)
+    """
+    return _troe(tokenize_rxn_str(rxn_str))
+
+
+def cheb(rxn_str):
+    """ Parses the data string for a reaction in the reactions block
+        for the lines containing the Chebyshevs fitting parameters,
+        then reads the parameters from these lines.
+
+        :param rxn_str: raw Chemkin string for a single reaction
+        :type rxn_str: str
+        :return params: Chebyshev fitting parameters
+        :rtype: dict[param: value]
+    """
+    return _cheb(tokenize_rxn_str(rxn_str), rxn_str)
+
+
+def plog(rxn_str, ea_units, a_units):
+    """ Parses the data string for a reaction in the reactions block
+        for the lines containing the PLOG fitting parameters,
+        then reads the parameters from these lines.
+
+        :param rxn_str: raw Chemkin string for a single reaction
+        :type rxn_str: str
+        :param ea_units: units of activation energies
+        :type ea_units: string
+        :param a_units: units of rate constants; either 'moles' or 'molecules'
+        :type a_units: str
+        :return params: PLOG fitting parameters
+        :rtype: dict[pressure: params]
+    """
+    return _plog(tokenize_rxn_str(rxn_str), ea_units, a_units)
 
-    pattern = (
-        'LOW' +
-        app.zero_or_more(app.SPACE) + app.escape('/') +
-        app.zero_or_more(app.SPACE) + app.capturing(app.NUMBER) +
-        app.one_or_more(app.SPACE) + app.capturing(app.NUMBER) +
-        app.one_or_more(app.SPACE) + app.capturing(app.NUMBER) +
-        app.zero_or_more(app.SPACE) + app.escape('/'))
-    cap1 = apf.first_capture(pattern, rxn_str)
-    if cap1 is not None:
-        params = [float(val) for val in cap1]
+
+def colliders(rxn_str):
+    """ Parses the data string for a reaction in the reactions block
+        for the line containing the names of several bath gases and
+        their corresponding collider efficiencies
+
+        :param rxn_str: raw Chemkin string for a single reaction
+        :type rxn_str: str
+        :return params: collider efficiencies for each bath gas
+        :rtype: dict {spc1: eff1, spc2: ...}
+    """
+    return tokenize_rxn_str(rxn_str)['collid']
+
+
+def _high_p(rxn_toks, ea_units, a_units):
+    """ Arrhenius parameters from the chemical equation line
+    """
+
+    if rxn_toks['highp'] is not None:
+        params = list(ap_cast(rxn_toks['highp'].split()))
 
         # Convert the units of Ea and A
         ea_conv_factor = get_ea_conv_factor(ea_units)
-        a_conv_factor = get_a_conv_factor(rxn_str, a_units)
+        a_conv_factor = _a_conv_factor(rxn_toks['rxn'], a_units)
         params[2] = params[2] * ea_conv_factor
         params[0] = params[0] * a_conv_factor
         params = [params]  # convert to list inside a list
-
     else:
         params = None
 
     return params
 
 
-def troe(rxn_str):
-    """ Parses the data string for a reaction in the reactions block
-        for a line containing the Troe fitting parameters,
-        then reads the parameters from this line.
+def _low_p(rxn_toks, ea_units, a_units):
+    """ Arrhenius parameters from the LOW line
+    """
 
-        Only gets the 4 Troe-specific parameters: alpha, T***, T*, and T**
+    if rxn_toks['low'] is not None:
+        params = [float(val) for val in rxn_toks['low']]
 
-        :param rxn_str: raw Chemkin string for a single reaction
-        :type rxn_str: str
-        :return params: Troe fitting parameters
-        :rtype: list(float)
-    """
+        # Convert the units of Ea and A
+        ea_conv_factor = get_ea_conv_factor(ea_units)
+        a_conv_factor = _a_conv_factor(rxn_toks['rxn'], a_units)
+        params[2] = params[2] * ea_conv_factor
+        params[0] = params[0] * a_conv_factor
+        params = [params]  # convert to list inside a list
 
-    pattern = (
-        'TROE' +
-        app.zero_or_more(app.SPACE) + app.escape('/') +
-        app.zero_or_more(app.SPACE) + app.capturing(app.NUMBER) +
-        app.one_or_more(app.SPACE) + app.capturing(app.NUMBER) +
-        app.one_or_more(app.SPACE) + app.capturing(app.NUMBER) +
-        app.maybe(app.one_or_more(app.SPACE) + app.capturing(app.NUMBER)) +
-        app.zero_or_more(app.SPACE) + app.escape('/'))
-    cap1 = apf.first_capture(pattern, rxn_str)
+    else:
+        params = None
+
+    return params
 
-    if cap1 is not None:
+
+def _troe(rxn_toks):
+    """ Troe parameters from the TROE line
+    """
+
+    if rxn_toks['troe'] is not None:
         params = []
-        for val in cap1:
+        for val in rxn_toks['troe']:
             if val is not None:
                 params.append(float(val))
             else:
@@ -501,55 +743,29 @@ def troe(rxn_str):
     return params
 
 
-def cheb(rxn_str):
-    """ Parses the data string for a reaction in the reactions block
-        for the lines containing the Chebyshevs fitting parameters,
-        then reads the parameters from these lines.
-
-        :param rxn_str: raw Chemkin string for a single reaction
-        :type rxn_str: str
-        :return params: Chebyshev fitting parameters
-        :rtype: dict[param: value]
+def _cheb(rxn_toks, rxn_str):
+    """ Chebyshev parameters from the TCHEB, PCHEB, and CHEB lines
     """
 
-    original_rxn_str = rxn_str
-    rxn_str = apf.remove(COMMENTS_PATTERN, rxn_str)
-
-    tcheb_pattern = (
-        'TCHEB' + app.zero_or_more(app.SPACE) + app.escape('/') +
-        app.zero_or_more(app.SPACE) + app.capturing(app.NUMBER) +
-        app.one_or_more(app.SPACE) + app.capturing(app.NUMBER) +
-        app.zero_or_more(app.SPACE) + app.escape('/'))
-    pcheb_pattern = (
-        'PCHEB' + app.zero_or_more(app.SPACE) + app.escape('/') +
-        app.zero_or_more(app.SPACE) + app.capturing(app.NUMBER) +
-        app.one_or_more(app.SPACE) + app.capturing(app.NUMBER) +
-        app.zero_or_more(app.SPACE) + app.escape('/'))
-    cheb_pattern = (
-        app.not_preceded_by(app.one_of_these(['T', 'P'])) +
-        'CHEB' + app.zero_or_more(app.SPACE) +
-        app.escape('/') + app.capturing(app.one_or_more(app.WILDCARD2)) +
-        app.escape('/'))
-
-    cheb_params_raw = apf.all_captures(cheb_pattern, rxn_str)
+    cheb_params_raw = rxn_toks['cheb']
 
     if cheb_params_raw:
         params = {}
         # Get temp and pressure limits or use Chemkin defaults if non-existent
-        cheb_temps = apf.first_capture(tcheb_pattern, rxn_str)
-        cheb_pressures = apf.first_capture(pcheb_pattern, rxn_str)
+        cheb_temps = rxn_toks['tcheb']
+        cheb_pressures = rxn_toks['pcheb']
         if cheb_temps is None:
             cheb_temps = ('300.00', '2500.00')
             print(
                 'No Chebyshev temperature limits specified' +
                 ' for the below reaction.' +
-                f' Assuming 300 and 2500 K. \n \n {original_rxn_str}\n')
+                f' Assuming 300 and 2500 K. \n \n {rxn_str}\n')
         if cheb_pressures is None:
             cheb_pressures = ('0.001', '100.00')
             print(
                 'No Chebyshev pressure limits specified' +
                 ' for the below reaction.' +
-                f' Assuming 0.001 and 100 atm. \n \n {original_rxn_str}\n')
+                f' Assuming 0.001 and 100 atm. \n \n {rxn_str}\n')
 
         # Get all the numbers from the CHEB parameters
         cheb_params = []
@@ -561,17 +777,13 @@ def cheb(rxn_str):
         cheb_m = int(float(cheb_params[1]))
 
         # Start on third value (after N and M) and get all polynomial coeffs
-        coeffs = []
-        for idx, coeff in enumerate(cheb_params[2:]):
-            # extra coefficients are allowed but ignored
-            if idx+1 > (cheb_n*cheb_m):
-                break
-            coeffs.append(coeff)
+        # (extra coefficients are allowed but ignored)
+        coeffs = cheb_params[2:2+cheb_n*cheb_m]
         assert len(coeffs) == (cheb_n*cheb_m), (
             f'For the below reaction, there should be {cheb_n*cheb_m}' +
             ' Chebyshev polynomial' +
             f' coefficients, but there are only {len(coeffs)}.' +
-            f' \n \n {original_rxn_str}\n')
+            f' \n \n {rxn_str}\n')
         alpha = np.array(list(map(float, coeffs)))
 
         params['tlim'] = tuple(float(val) for val in cheb_temps)
@@ -584,37 +796,18 @@ def cheb(rxn_str):
     return params
 
 
-def plog(rxn_str, ea_units, a_units):
-    """ Parses the data string for a reaction in the reactions block
-        for the lines containing the PLOG fitting parameters,
-        then reads the parameters from these lines.
-
-        :param rxn_str: raw Chemkin string for a single reaction
-        :type rxn_str: str
-        :param ea_units: units of activation energies
-        :type ea_units: string
-        :param a_units: units of rate constants; either 'moles' or 'molecules'
-        :type a_units: str
-        :return params: PLOG fitting parameters
-        :rtype: dict[pressure: params]
+def _plog(rxn_toks, ea_units, a_units):
+    """ Arrhenius parameters at each pressure from the PLOG lines
     """
 
-    pattern = (
-        'PLOG' +
-        app.zero_or_more(app.SPACE) + app.escape('/') +
-        app.zero_or_more(app.SPACE) + app.capturing(app.NUMBER) +
-        app.one_or_more(app.SPACE) + app.capturing(app.NUMBER) +
-        app.one_or_more(app.SPACE) + app.capturing(app.NUMBER) +
-        app.one_or_more(app.SPACE) + app.capturing(app.NUMBER) +
-        app.zero_or_more(app.SPACE) + app.escape('/'))
-    params_lst = apf.all_captures(pattern, rxn_str)
+    params_lst = rxn_toks['plog']
 
     # Build dictionary of parameters, indexed by parameter
     if params_lst:
 
         # Get the Ea and A conversion factors
         ea_conv_factor = get_ea_conv_factor(ea_units)
-        a_conv_factor = get_a_conv_factor(rxn_str, a_units)
+        a_conv_factor = _a_conv_factor(rxn_toks['rxn'], a_units)
         params = {}
         for param in params_lst:
             pressure = float(param[0])
@@ -632,48 +825,6 @@ def plog(rxn_str, ea_units, a_units):
     return params
 
 
-def colliders(rxn_str):
-    """ Parses the data string for a reaction in the reactions block
-        for the line containing the names of several bath gases and
-        their corresponding collider efficiencies
-
-        :param rxn_str: raw Chemkin string for a single reaction
-        :type rxn_str: str
-        :return params: collider efficiencies for each bath gas
-        :rtype: dict {spc1: eff1, spc2: ...}
-    """
-
-    bad_strings = ('DUP', 'LOW', 'TROE', 'CHEB', 'PLOG', CHEMKIN_ARROW)
-    species_char = app.one_of_these([
-        app.LETTER, app.DIGIT,
-        app.escape('('), app.escape(')'),
-        app.UNDERSCORE])
-    species_name = app.one_or_more(species_char)
-
-    # Loop over the lines and search for string with collider facts
-    if ('LOW' in rxn_str or 'TROE' in rxn_str
-            or 'M=' in rxn_str or 'M =' in rxn_str):
-        params = {}
-        for line in rxn_str.splitlines():
-            if not any(apf.has_match(string, line) for string in bad_strings):
-                factor_pattern = (
-                    app.capturing(species_name) + app.zero_or_more(app.SPACE) +
-                    app.escape('/') + app.zero_or_more(app.SPACE) +
-                    app.capturing(app.NUMBER) + app.zero_or_more(app.SPACE) +
-                    app.escape('/') + app.zero_or_more(app.SPACE))
-                baths = apf.all_captures(factor_pattern, line)
-                if baths:
-                    for bath in baths:
-                        params[bath[0]] = float(bath[1])
-        # If nothing was put into the dictionary, set it to None
-        if not params:
-            params = None
-    else:
-        params = None
-
-    return params
-
-
 def _first_line_pattern(rct_ptt, prd_ptt, param_ptt):
     """ Defines the pattern for the first line in a reaction data
         string that contains the chemical equation and high-pressure
@@ -691,6 +842,55 @@ def _first_line_pattern(rct_ptt, prd_ptt, param_ptt):
             app.LINESPACES + param_ptt)
 
 
+EQUATION_PATTERN = _first_line_pattern(
+    rct_ptt=app.capturing(SPECIES_NAMES_PATTERN),
+    prd_ptt=app.capturing(SPECIES_NAMES_PATTERN),
+    param_ptt=app.maybe(app.capturing(COEFF_PATTERN)))
+
+
+def _reagent_names(rgt_str, rxn_str):
+    """ Names of the species on one side of the chemical equation
+    """
+    try:
+        names = _split_reagent_string(rgt_str)
+    except TypeError as err:
+        raise ValueError(_bad_rxn_line_message(rxn_str)) from err
+
+    return names
+
+
+def _bad_rxn_line_message(rxn_str):
+    """ Error message for a reaction whose chemical equation line cannot
+        be read
+    """
+    return ('Reaction line not formatted correctly:\n' + rxn_str +
+            '\nCheck that there are three numbers after the rxn equation')
+
+
+def _third_body(rgt_str):
+    """ Third body of the reaction, from the reactant side of the
+        chemical equation
+    """
+
+    rgt_str = apf.remove(app.LINESPACES, rgt_str)
+    rgt_split_paren = apf.split(CHEMKIN_PAREN_PLUS, rgt_str)
+    rgt_split_plus = apf.split(app.PLUS, rgt_str)
+
+    if len(rgt_split_paren) > 1:
+        trd_body = '(+' + apf.split(CHEMKIN_PAREN_CLOSE,
+                                    rgt_split_paren[1])[0] + ')'
+
+    elif 'M' in rgt_split_plus:
+        trd_body = '+M'
+
+    else:
+        trd_body = None
+
+    trd_body = (trd_body,)
+
+    return trd_body
+
+
 def _split_reagent_string(rgt_str):
     """ Parses out the names of all the species given in a string with
         the chemical equation within the reactions block.
@@ -776,14 +976,22 @@ def get_a_conv_factor(rxn_str, a_units):
         :rtype: float
     """
 
+    return _a_conv_factor(get_rxn_name(rxn_str), a_units)
+
+
+def _a_conv_factor(rxn, a_units):
+    """ Get the factor for converting A to the desired basis of moles,
+        from the reaction key
+    """
+
     # Get the molecularity
-    rcts = rct_names(rxn_str)
+    rcts = rxn[0]
     if not isinstance(rcts, tuple):  # convert to list to avoid mistake
         rcts = [rcts]
     molecularity = len(rcts)
 
     # Find out whether there is a third body
-    trd_body = third_body(rxn_str)[0]
+    trd_body = rxn[2][0]
     # if 3rd body has '(', no effect on units
     if trd_body is not None and '(+' not in trd_body:
         molecularity += 1
@@ -1,7 +1,6 @@
 """ functions operating on the thermo block string
 """
 
-import itertools
 import numpy as np
 import autoparse.pattern as app
 import autoparse.find as apf
@@ -19,34 +18,184 @@ def create_spc_nasa7_dct(block_str):
                 as keys and NASA-7 info as values
 
     """
-    # Get the list of entries; at least four lines each
-    # (possibly more for comment lines)
-    entry_lst = create_entry_list(block_str)
-
-    # Get the default midpoint temp
-    default_temp_limits = get_default_temp_limits(block_str)
-    default_midpoint = default_temp_limits[1]
-    many_default_midpoints = list(
-        itertools.repeat(default_midpoint, times=len(entry_lst)))
-    # creates an iterator
-
-    # Get the spc names, which will be the keys of the dictionary
-    spc_names = list(map(get_spc_name, entry_lst))
-
-    # Get the NASA-7 parameters, which will be the values of the dictionary
-    nasa7_params = list(
-        zip(
-            map(get_notes, entry_lst),
-            map(get_composition, entry_lst),
-            map(get_phase, entry_lst),
-            map(get_temp_limits, entry_lst, many_default_midpoints),
-            map(get_coeffs, entry_lst)
+    return read_nasa7_table(block_str).spc_nasa7_dct()
+
+
+def read_nasa7_table(block_str):
+    """ Reads the entries of a thermo block as fixed-width records, with
+        the coefficients of all species converted to an array at once
+
+        Coefficient lines that lost their leading space are padded back
+        to 80 columns, as in `fix_lines`, before the fields are sliced.
+
+        :param block_str: string for thermo block
+        :type block_str: str
+        :return: table with one row per entry, in the order of the block
+        :rtype: Nasa7Table
+    """
+
+    line_lst = _block_lines(block_str)
+    entry_lst = _entry_list(line_lst)
+    default_midpoint = _default_temp_limits(line_lst)[1]
+
+    names, notes, phases, comp_strs, temps = [], [], [], [], []
+    fields = []
+    for entry in entry_lst:
+        first_line = entry[0]
+        names.append(get_spc_name(entry))
+        notes.append(first_line[18:24])
+        comp_strs.append(first_line[24:44] + first_line[73:78])
+        phases.append(first_line[44])
+
+        # Read the temperatures in place, leaving the fallbacks for missing
+        # or badly formatted fields to get_temp_limits
+        try:
+            temps.append((float(first_line[45:55]), float(first_line[55:65]),
+                          float(first_line[65:73])))
+        except ValueError:
+            temps.append(tuple(get_temp_limits(entry, default_midpoint)))
+
+        # Coefficients are in the first three full-width lines after the
+        # header: 5, 5, and 4 fields of 15 characters
+        coeff_lines = [line for line in entry[1:] if len(line) >= 80][:3]
+        assert len(coeff_lines) == 3, (
+            'Less than three lines of coefficients were read' +
+            f' for the following entry:\n{reform_entry(entry)}'
         )
-    )
+        line2, line3, line4 = coeff_lines
+        fields.extend(line2[start:start+15] for start in range(0, 75, 15))
+        fields.extend(line3[start:start+15] for start in range(0, 75, 15))
+        fields.extend(line4[start:start+15] for start in range(0, 60, 15))
+
+    try:
+        coeffs = np.array(fields, dtype=float).reshape(-1, 14)
+    except ValueError:
+        coeffs = _read_coeff_fields(fields, entry_lst)
+
+    return Nasa7Table(names, notes, phases, comp_strs,
+                      np.array(temps, dtype=float), coeffs)
+
+
+class Nasa7Table():
+    """ NASA-7 entries of a thermo block, with one row per entry
+
+        `temps` holds the low, high, and midpoint temperatures of each entry
+        and `coeffs` the 7 high- then 7 low-temperature coefficients.
+        `comps` holds the number of atoms of each of the `elements`.
+    """
+
+    def __init__(self, names, notes, phases, comp_strs, temps, coeffs):
+        """
+        :param names: species names
+        :type names: tuple(str)
+        :param notes: freeform notes from the header lines
+        :type notes: tuple(str)
+        :param phases: phases, 'G', 'L', or 'S'
+        :type phases: tuple(str)
+        :param comp_strs: composition fields of the header lines, four
+            in columns 25-44 and an optional fifth in columns 74-78
+        :type comp_strs: tuple(str)
+        :param temps: temperature limits, shape (nspecies, 3)
+        :type temps: numpy.ndarray
+        :param coeffs: polynomial coefficients, shape (nspecies, 14)
+        :type coeffs: numpy.ndarray
+        """
+        self.names = tuple(names)
+        self.notes = tuple(notes)
+        self.phases = tuple(phases)
+        self.comp_strs = tuple(comp_strs)
+        self.temps = temps
+        self.coeffs = coeffs
+        self.elements, self.comps = _composition_table(self.comp_strs)
+        # Later entries take precedence over earlier ones with the same name
+        self._idx_dct = {name: idx for idx, name in enumerate(self.names)}
+
+    def __len__(self):
+        return len(self.names)
+
+    def index(self, name):
+        """ row of the table for a species
+
+        :param name: species name
+        :type name: str
+        :rtype: int
+        """
+        return self._idx_dct[name]
+
+    def composition(self, name):
+        """ composition of a species
+
+        :param name: species name
+        :type name: str
+        :rtype: dct {element: quantity, ...}
+        """
+        row = self.comps[self.index(name)].tolist()
+        return {elem: count for elem, count in zip(self.elements, row)
+                if count}
+
+    def spc_nasa7_dct(self):
+        """ the table in the form of `create_spc_nasa7_dct`
+
+        :rtype: dct {spc_name: (notes, composition, phase,
+            [low_limit, high_limit, midpoint], ([high_coeffs], [low_coeffs]))}
+        """
+        temps = self.temps.tolist()
+        coeffs = self.coeffs.tolist()
+        return {
+            name: (self.notes[idx], self.comp_strs[idx][:20], self.phases[idx],
+                   temps[idx], (coeffs[idx][:7], coeffs[idx][7:]))
+            for name, idx in self._idx_dct.items()}
+
+
+def _read_coeff_fields(fields, entry_lst):
+    """ Convert the coefficient fields one at a time, printing the entries
+        with fields that cannot be read, which are set to NaN
+    """
+
+    coeffs = np.full((len(entry_lst), 14), np.nan)
+    for idx, entry in enumerate(entry_lst):
+        for fidx, field in enumerate(fields[idx*14:(idx+1)*14]):
+            try:
+                coeffs[idx, fidx] = float(field)
+            except ValueError:
+                print(
+                    f'Error reading coefficient {fidx + 1}' +
+                    f' of the following entry:\n{reform_entry(entry)}')
+
+    return coeffs
+
+
+def _composition_table(comp_strs):
+    """ Read the element and count fields, 2 and 3 characters wide, from
+        the composition strings of each entry
+    """
+
+    elements = {}
+    counts_dct = {}
+    for comp_str in comp_strs:
+        if comp_str in counts_dct:
+            continue
+        counts = {}
+        for start in range(0, len(comp_str), 5):
+            elem = comp_str[start:start+2].strip()
+            count_str = comp_str[start+2:start+5].strip()
+            if not elem or not count_str:
+                continue
+            try:
+                count = float(count_str)
+            except ValueError:
+                continue
+            if count:
+                elements.setdefault(elem, len(elements))
+                counts[elem] = counts.get(elem, 0.0) + count
+        counts_dct[comp_str] = counts
 
-    spc_nasa7_dct = dict(zip(spc_names, nasa7_params))
+    comps = np.zeros((len(comp_strs), len(elements)))
+    for idx, comp_str in enumerate(comp_strs):
+        for elem, count in counts_dct[comp_str].items():
+            comps[idx, elements[elem]] = count
 
-    return spc_nasa7_dct
+    return tuple(elements), comps
 
 
 # def create_entry_list(block_str, add_spaces=True):
@@ -59,8 +208,12 @@ def create_entry_list(block_str):
         :return line_lst: list of strs for each line
 
     """
-    block_str = apf.remove(COMMENTS_PATTERN, block_str)
-    line_lst = list(apf.split_lines(block_str))
+    return _entry_list(_block_lines(block_str))
+
+
+def _entry_list(line_lst):
+    """ Split the comment-free lines of a thermo block into entries
+    """
 
     # Get the indices of the entry header lines
     header_idxs = []
@@ -291,8 +444,13 @@ def get_default_temp_limits(block_str):
     """ Gets the default temperatures from the header of a thermo block str
 
     """
-    block_str = apf.remove(COMMENTS_PATTERN, block_str)
-    line_lst = list(apf.split_lines(block_str))
+    return _default_temp_limits(_block_lines(block_str))
+
+
+def _default_temp_limits(line_lst):
+    """ Gets the default temperatures from the comment-free lines of a
+        thermo block
+    """
 
     # Loop over each line
     for line in line_lst:
@@ -316,6 +474,13 @@ def get_default_temp_limits(block_str):
     return default_temp_limits
 
 
+def _block_lines(block_str):
+    """ Remove the comments from a thermo block and split it into lines
+    """
+    block_str = apf.remove(COMMENTS_PATTERN, block_str)
+    return list(apf.split_lines(block_str))
+
+
 def reform_entry(entry):
     """ Put the entry back together for error printing purposes
 
@@ -0,0 +1,130 @@
+""" Tests the cache of parsed mechanisms
+"""
+
+import os
+import tempfile
+import pytest
+import numpy
+import ioformat
+from chemkin_io.parser import cache
+from chemkin_io.parser import reaction
+from chemkin_io.parser import thermo
+
+
+PATH = os.path.dirname(os.path.realpath(__file__))
+DAT_PATH = os.path.join(PATH, 'data')
+
+THERM_STR = (
+    'THERMO\n'
+    '200.00    1000.00   5000.000\n\n'
+    'O2                RUS 89O   2               G    200.00   6000.00 1000.00      1\n'
+    ' 2.54363697E+00-2.73162486E-05-4.19029520E-09 4.95481845E-12-4.79553694E-16    2\n'
+    ' 2.92260120E+04 4.92229457E+00 3.16826710E+00-3.27931884E-03 6.64306396E-06    3\n'
+    '-6.12806624E-09 2.11265971E-12 2.91222592E+04 2.05193346E+00                   4\n'
+    'END\n\n'
+)
+CHEB_STR = (
+    'REACTIONS\n'
+    'C2H4+OH=PC2H4OH 1.0 0.0 0.0\n'
+    '  TCHEB / 300.00 2500.00 /\n'
+    '  PCHEB / 0.001 100.0 /\n'
+    '  CHEB / 2 3 1.0 2.0 3.0 4.0 5.0 6.0 /\n'
+    'END\n'
+)
+
+
+def test_cache():
+    """ Tests that a mechanism read from the cache matches the one parsed
+        from the string
+    """
+
+    rxn_str = ioformat.pathtools.read_file(DAT_PATH, 'rxn_block.dat')
+    mech_str = ('SPECIES\nC2H3 O2 C2H3OO\nEND\n' + THERM_STR +
+                'REACTIONS CAL/MOLE MOLES\n' + rxn_str + '\nEND\n')
+
+    with tempfile.TemporaryDirectory(dir=PATH) as cache_dir:
+        mech_cache = cache.MechanismCache(cache_dir)
+        spc_names1, rxn_param_dct1, therm_table1 = mech_cache.get(mech_str)
+        spc_names2, rxn_param_dct2, therm_table2 = mech_cache.get(mech_str)
+        assert mech_cache.info() == {'hits': 1, 'misses': 1}
+        assert all(os.path.exists(path)
+                   for path in mech_cache.paths(mech_str))
+
+        assert spc_names1 == spc_names2 == ('C2H3', 'O2', 'C2H3OO')
+
+        ref_dct = reaction.get_rxn_param_dct(rxn_str, 'cal/mole', 'moles')
+        assert tuple(rxn_param_dct1.keys()) == tuple(ref_dct.keys())
+        assert tuple(rxn_param_dct2.keys()) == tuple(ref_dct.keys())
+        for rxn, params in rxn_param_dct2.items():
+            ref_params = ref_dct[rxn]
+            assert len(params.arr) == len(ref_params.arr)
+            for arr_tuple, ref_arr_tuple in zip(params.arr, ref_params.arr):
+                assert numpy.allclose(arr_tuple, ref_arr_tuple)
+
+        ref_nasa7_dct = thermo.create_spc_nasa7_dct(THERM_STR)
+        assert therm_table1.spc_nasa7_dct() == ref_nasa7_dct
+        assert therm_table2.spc_nasa7_dct() == ref_nasa7_dct
+        assert numpy.array_equal(therm_table2.coeffs, therm_table1.coeffs)
+
+        # A changed mechanism is parsed again, and a removed one too
+        mech_cache.get(mech_str.replace('SPECIES\n', 'SPECIES\nCH3 '))
+        mech_cache.invalidate(mech_str)
+        mech_cache.get(mech_str)
+        assert mech_cache.info() == {'hits': 1, 'misses': 3}
+
+
+def test_cache_cheb():
+    """ Tests that Chebyshev arrays and missing blocks are cached
+    """
+
+    with tempfile.TemporaryDirectory(dir=PATH) as cache_dir:
+        spc_names1, rxn_param_dct1, therm_table1 = cache.parse_mechanism(
+            CHEB_STR, cache_dir=cache_dir)
+        spc_names2, rxn_param_dct2, therm_table2 = cache.parse_mechanism(
+            CHEB_STR, cache_dir=cache_dir)
+
+    assert spc_names1 is None and spc_names2 is None
+    assert therm_table1 is None and therm_table2 is None
+    rxn = (('C2H4', 'OH'), ('PC2H4OH',), (None,))
+    for rxn_param_dct in (rxn_param_dct1, rxn_param_dct2):
+        cheb_dct = rxn_param_dct[rxn].cheb
+        assert numpy.allclose(cheb_dct['alpha'], [[1.0, 2.0, 3.0],
+                                                  [4.0, 5.0, 6.0]])
+        assert numpy.allclose(cheb_dct['tlim'], (300.0, 2500.0))
+        assert numpy.allclose(cheb_dct['plim'], (0.001, 100.0))
+
+
+def test_cache_uncacheable(monkeypatch):
+    """ Tests that a mechanism with values that cannot be stored is still
+        returned, without being cached
+    """
+
+    rxn_str = ioformat.pathtools.read_file(DAT_PATH, 'rxn_block.dat')
+    mech_str = 'REACTIONS CAL/MOLE MOLES\n' + rxn_str + '\nEND\n'
+
+    def _read_with_int64(mech_str, nprocs=1):
+        spc_names, (rxns, inputs_lst), therm_table = cache_read(
+            mech_str, nprocs=nprocs)
+        inputs_lst[0]['arr_dct']['arr_tuples'][0][0] = numpy.int64(4)
+        return spc_names, (rxns, inputs_lst), therm_table
+
+    cache_read = cache._read
+    monkeypatch.setattr(cache, '_read', _read_with_int64)
+
+    with pytest.raises(TypeError):
+        cache._pack([numpy.int64(4), 1.0], [])
+
+    with tempfile.TemporaryDirectory(dir=PATH) as cache_dir:
+        mech_cache = cache.MechanismCache(cache_dir)
+        _, rxn_param_dct, _ = mech_cache.get(mech_str)
+        assert not any(os.path.exists(path)
+                       for path in mech_cache.paths(mech_str))
+        assert mech_cache.info() == {'hits': 0, 'misses': 1}
+
+    params = next(iter(rxn_param_dct.values()))
+    assert params.arr[0][0] == 4
+
+
+if __name__ == '__main__':
+    test_cache()
+    test_cache_cheb()
@@ -2,9 +2,12 @@
 """
 
 import os
+import concurrent.futures
+import pytest
 import numpy as np
 import ioformat
 from chemkin_io.parser.reaction import get_rxn_param_dct as parser
+from chemkin_io.parser.reaction import tokenize_rxn_str
 
 
 PATH = os.path.dirname(os.path.realpath(__file__))
@@ -269,6 +272,115 @@ def test_lind():
         assert len(params.lind_dups) == 1
 
 
+def test_tokenize():
+    """ Tests the single-pass reaction string tokenizer
+    """
+
+    rxn_str = (
+        'H+O2(+N2)=OH+O(+N2)     1.000E+12     1.500    50000\n'
+        '    LOW  /              1.000E+12     1.500    50000  /\n'
+        '    TROE /   1.500E+00   8.000E+03   1.000E+02 /\n'
+        '     AR/1.400/   N2/1.700/   \n'
+        'DUP\n')
+    rxn_toks = tokenize_rxn_str(rxn_str)
+    assert rxn_toks['rxn'] == (('H', 'O2'), ('OH', 'O'), ('(+N2)',))
+    assert rxn_toks['highp'].split() == ['1.000E+12', '1.500', '50000']
+    assert rxn_toks['low'] == ('1.000E+12', '1.500', '50000')
+    assert rxn_toks['troe'] == ('1.500E+00', '8.000E+03', '1.000E+02', None)
+    assert rxn_toks['collid'] == {'AR': 1.4, 'N2': 1.7}
+    assert rxn_toks['dup']
+    assert not rxn_toks['plog'] and not rxn_toks['cheb']
+
+    rxn_str = (
+        'H+O2=OH+O     1.000E+15     0.000    25000\n'
+        '    PLOG /1.000E-01   1.000E+15     0.000    25000 /\n'
+        '    PLOG /1.000E+00   1.000E+15     0.000    25000 /\n')
+    rxn_toks = tokenize_rxn_str(rxn_str)
+    assert rxn_toks['rxn'] == (('H', 'O2'), ('OH', 'O'), (None,))
+    assert len(rxn_toks['plog']) == 2
+    assert rxn_toks['collid'] is None
+    assert not rxn_toks['dup']
+
+    # Blocks continued onto the next line
+    rxn_str = (
+        'H+O2(+M)=HO2(+M)     1.000E+12     1.500    50000\n'
+        '    LOW /\n'
+        '      1.0E15 0.0 -500.0 /\n'
+        '    TROE / 0.5 1.0E+02\n'
+        '      2.0E+03 /\n'
+        '     AR/0.7/\n')
+    rxn_toks = tokenize_rxn_str(rxn_str)
+    assert rxn_toks['low'] == ('1.0E15', '0.0', '-500.0')
+    assert rxn_toks['troe'] == ('0.5', '1.0E+02', '2.0E+03', None)
+    assert rxn_toks['collid'] == {'AR': 0.7}
+
+    rxn_str = (
+        'H+O2=OH+O     1.000E+15     0.000    25000\n'
+        '    PLOG / 0.1 1.0E12 0.5\n'
+        '      100.0 /\n'
+        '    PLOG / 1.0 1.0E13 0.5 200.0 /\n')
+    rxn_toks = tokenize_rxn_str(rxn_str)
+    assert rxn_toks['plog'] == (('0.1', '1.0E12', '0.5', '100.0'),
+                                ('1.0', '1.0E13', '0.5', '200.0'))
+
+
+def test_fix_duplicates():
+    """ Tests that duplicate reactions are combined in the order they appear
+    """
+
+    ckin_str = ioformat.pathtools.read_file(DAT_PATH, 'rxn_block.dat')
+    rxn_param_dct = parser(ckin_str, 'cal/mole', 'moles')
+
+    assert tuple(rxn_param_dct.keys()) == (
+        (('C2H3', 'O2'), ('C2H3OO',), (None,)),
+        (('C2H3', 'O2'), ('CHCHO', 'OH'), (None,)),
+        (('C2H3', 'O2'), ('CH2CHO', 'O'), (None,)),
+        (('C2H3', 'O2'), ('C2H2', 'HO2'), (None,)),
+        (('C2H3', 'O2'), ('CHOCHO', 'H'), (None,)),
+        (('C2H3', 'O2'), ('CH2CO', 'OH'), (None,)),
+        (('C2H3', 'O2'), ('CH2O', 'HCO'), (None,)),
+        (('C2H3', 'O2'), ('CO', 'CH3O'), (None,)),
+        (('C2H3', 'O2'), ('CO2', 'CH3'), (None,)),
+    )
+    for params in rxn_param_dct.values():
+        assert len(params.arr) == 2
+
+
+def test_parallel():
+    """ Tests that parsing in several processes, or with an executor, gives
+        the same reactions and parameters as parsing in one process
+    """
+
+    ckin_str = ioformat.pathtools.read_file(DAT_PATH, 'rxn_block.dat')
+    ref_dct = parser(ckin_str, 'cal/mole', 'moles')
+
+    rxn_param_dct1 = parser(ckin_str, 'cal/mole', 'moles', nprocs=2)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        rxn_param_dct2 = parser(ckin_str, 'cal/mole', 'moles',
+                                executor=executor)
+
+    for rxn_param_dct in (rxn_param_dct1, rxn_param_dct2):
+        assert tuple(rxn_param_dct.keys()) == tuple(ref_dct.keys())
+        for rxn, params in rxn_param_dct.items():
+            ref_params = ref_dct[rxn]
+            assert len(params.arr) == len(ref_params.arr)
+            for arr_tuple, ref_arr_tuple in zip(params.arr, ref_params.arr):
+                assert np.allclose(arr_tuple, ref_arr_tuple)
+
+
+def test_bad_rxn():
+    """ Tests that a badly formatted reaction raises an error naming it,
+        including from the worker processes
+    """
+
+    ckin_str = ioformat.pathtools.read_file(DAT_PATH, 'rxn_block.dat')
+    bad_rxn_str = 'C2H3+O2=C2H3OO 1.0E+12'
+    for nprocs in (1, 2):
+        with pytest.raises(ValueError, match='C2H3OO 1.0E'):
+            parser(ckin_str + '\n' + bad_rxn_str + '\n', 'cal/mole', 'moles',
+                   nprocs=nprocs)
+
+
 def test_rxn_names():
     """ test mechanalyzer.parser.reaction
     """
@@ -283,4 +395,8 @@ if __name__ == '__main__':
     test_cheb()
     test_troe()
     test_lind()
+    test_tokenize()
+    test_fix_duplicates()
+    test_parallel()
+    test_bad_rxn()
     test_rxn_names()
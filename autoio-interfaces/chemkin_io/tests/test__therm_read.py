@@ -3,6 +3,7 @@
 
 import numpy
 from chemkin_io.parser.thermo import create_spc_nasa7_dct as parser
+from chemkin_io.parser.thermo import read_nasa7_table
 
 THERM_STR = ( 
     'THERMO\n'
@@ -35,5 +36,34 @@ def test_read():
     assert numpy.allclose(lowt, ref_lowt)
 
 
+def test_table():
+    """ Tests the chemkin_io fixed-width table reader for thermo, including
+        coefficient lines missing their leading space
+    """
+
+    therm_str = THERM_STR.replace(
+        ' 2.92260120E+04 4.92229457E+00', '2.92260120E+04 4.92229457E+00')
+    therm_str = therm_str.replace('END', (
+        'H2O               L 8/89H   2O   1          G    200.00   3500.00 1000.00      1\n'
+        ' 3.03399249E+00 2.17691804E-03-1.64072518E-07-9.70419870E-11 1.68200992E-14    2\n'
+        '-3.00042971E+04 4.96677010E+00 4.19864056E+00-2.03643410E-03 6.52040211E-06    3\n'
+        '-5.48797062E-09 1.77197817E-12-3.02937267E+04-8.49032208E-01                   4\n'
+        'END'))
+
+    table = read_nasa7_table(therm_str)
+    assert table.names == ('O2', 'H2O')
+    assert table.coeffs.shape == (2, 14)
+    assert numpy.allclose(table.temps, [[200.0, 6000.0, 1000.0],
+                                        [200.0, 3500.0, 1000.0]])
+    hight, lowt = parser(THERM_STR)['O2'][4]
+    assert numpy.allclose(table.coeffs[0], hight + lowt)
+    assert numpy.allclose(table.coeffs[1, [0, 7, 13]],
+                          [3.03399249, 4.19864056, -0.849032208])
+    assert table.elements == ('O', 'H')
+    assert numpy.allclose(table.comps, [[2.0, 0.0], [1.0, 2.0]])
+    assert table.composition('H2O') == {'O': 1.0, 'H': 2.0}
+
+
 if __name__ == '__main__':
     test_read()
+    test_table()
@@ -29,11 +29,28 @@ def well_lumped_input_file(inp_str, out_str, aux_str, log_str,
 
 
 # Build the lumping scheme used for the well extension
-def well_lumping_scheme(mess_aux_str, pressure, temp):
+def well_lumping_scheme(mess_aux_str, pressure, temp, nearest=False,
+                        well_table=None):
     """ Parse lumped wells from aux output; write into string for new input
+
+        :param mess_aux_str: string for the auxiliary file
+        :type mess_aux_str: str
+        :param pressure: pressure (atm)
+        :type pressure: float
+        :param temp: temperature (K)
+        :type temp: float
+        :param nearest: use the closest conditions in the aux output
+        :type nearest: bool
+        :param well_table: merged wells already read from the aux output,
+            used instead of reading the string, to probe many conditions
+            without rereading the file
+        :type well_table: mess_io.reader.MergedWellTable
+        :rtype: str
     """
 
-    well_lump_lst = mess_io.reader.merged_wells(mess_aux_str, pressure, temp)
+    if well_table is None:
+        well_table = mess_io.reader.MergedWellTable(mess_aux_str)
+    well_lump_lst = well_table.merged_wells(pressure, temp, nearest=nearest)
     if well_lump_lst is not None:
         well_lump_str = mess_io.writer.well_lump_scheme(well_lump_lst)
     else:
@@ -54,6 +71,7 @@ def well_energies(mess_out_str, mess_log_str, pressure):
     # Get the temps where each well exists
     well_enes = {}
     well_rxns = _get_well_reactions(mess_out_str)
+    rate_out = mess_io.reader.rates.MessRateOutput(mess_out_str)
     for well, rxn_lst in well_rxns.items():
         print('\n***********************************************\n')
         print(f'Obtaining information for well {well} at P={pressure}')
@@ -63,7 +81,7 @@ def well_energies(mess_out_str, mess_log_str, pressure):
             well, prd = rxn[0][0], rxn[1][0]
 
             # Read the rate constants out of the mess outputs
-            ktp_dct = mess_io.reader.rates.ktp_dct(mess_out_str, well, prd)
+            ktp_dct = rate_out.ktp(well, prd)
             rxn_temp = _max_temp_well_exists(ktp_dct, pressure, mess_temps)
 
             if rxn_temp > max_temp:
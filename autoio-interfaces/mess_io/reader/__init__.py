@@ -9,13 +9,17 @@ from mess_io.reader import tors
 from mess_io.reader import ped
 from mess_io.reader import hoten
 from mess_io.reader._pes import pes
+from mess_io.reader._pes import pes_graph
+from mess_io.reader._pes import PesGraph
 from mess_io.reader._pes import get_species
 from mess_io.reader._pes import find_barrier
 from mess_io.reader._pes import dct_species_fragments
 from mess_io.reader._wells import merged_wells
+from mess_io.reader._wells import MergedWellTable
 from mess_io.reader._wells import well_thermal_energy
 from mess_io.reader._label import relabel
 from mess_io.reader._label import name_label_dct
+from mess_io.reader._batch import batch_read
 
 
 __all__ = [
@@ -25,11 +29,15 @@ __all__ = [
     'ped',
     'hoten',
     'pes',
+    'pes_graph',
+    'PesGraph',
     'get_species',
     'find_barrier',
     'dct_species_fragments',
     'merged_wells',
+    'MergedWellTable',
     'well_thermal_energy',
     'relabel',
-    'name_label_dct'
+    'name_label_dct',
+    'batch_read'
 ]
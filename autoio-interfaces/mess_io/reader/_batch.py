@@ -0,0 +1,70 @@
+""" Read many MESS output files at once, in parallel
+"""
+
+import functools
+import multiprocessing
+from ioformat import set_nprocs
+
+
+def batch_read(file_paths, reader, nprocs='auto', chunksize=None,
+               **reader_kwargs):
+    """ Apply a reader to the strings of many MESS output files, spreading
+        the files over a pool of processes.
+
+        The reader is any function that takes the file string as its first
+        argument, e.g., `rates.get_rxn_ktp_dct` or `name_label_dct`; it
+        must be defined at the top level of a module so that it can be sent
+        to the worker processes. Extra keyword arguments are passed to it.
+
+        A file that cannot be read or parsed does not stop the batch: its
+        result is None and the error is reported for its path instead.
+
+        :param file_paths: paths to the MESS output files
+        :type file_paths: tuple(str)
+        :param reader: function to parse each file string
+        :type reader: function
+        :param nprocs: number of processes; 'auto' uses all but one of the
+            available processors, and 1 reads the files in this process
+        :type nprocs: int or str
+        :param chunksize: number of files sent to a process at a time;
+            chosen from the numbers of files and processes by default
+        :type chunksize: int
+        :return: results in the order of the paths; errors by path
+        :rtype: (tuple(obj), dict[str: str])
+    """
+
+    file_paths = tuple(file_paths)
+    nfiles = len(file_paths)
+    _nprocs = set_nprocs(nfiles, nprocs=nprocs)
+
+    fxn = functools.partial(_read_file, reader=reader, kwargs=reader_kwargs)
+    if _nprocs > 1:
+        if chunksize is None:
+            chunksize, extra = divmod(nfiles, _nprocs * 4)
+            chunksize += 1 if extra else 0
+        with multiprocessing.Pool(processes=_nprocs) as pool:
+            outputs = tuple(
+                pool.imap(fxn, file_paths, chunksize=max(chunksize, 1)))
+    else:
+        outputs = tuple(map(fxn, file_paths))
+
+    results = tuple(result for result, _ in outputs)
+    errors = {path: error for path, (_, error) in zip(file_paths, outputs)
+              if error is not None}
+
+    return results, errors
+
+
+def _read_file(file_path, reader, kwargs):
+    """ Read and parse one file, returning the error message rather than
+        raising it if either fails
+    """
+    try:
+        with open(file_path, mode='r', encoding='utf-8') as fobj:
+            file_str = fobj.read()
+        output = (reader(file_str, **kwargs), None)
+    # Some readers call sys.exit on bad input
+    except (Exception, SystemExit) as err:  # pylint: disable=broad-except
+        output = (None, f'{type(err).__name__}: {err}')
+
+    return output
@@ -3,7 +3,6 @@
 """
 
 import numpy as np
-import autoparse.find as apf
 import autoparse.pattern as app
 from ioformat import remove_comment_lines
 
@@ -22,120 +21,209 @@ def pes(input_string, read_fake=False):
         :return conn_lst
         :rtype: lst(str)
     """
+    pes_gra = pes_graph(input_string, read_fake=read_fake)
+    return (pes_gra.energy_dct, pes_gra.conn_lst, pes_gra.conn_lst_dct,
+            pes_gra.pes_label_dct)
+
+
+def pes_graph(input_string, read_fake=False):
+    """ Read a MESS input file string into a PesGraph
+
+        The file is read in a single pass: the energy and fragments of each
+        Well, Bimolecular and Barrier block are taken from the first
+        ZeroEnergy/GroundEnergy/Dummy and Fragment lines after its header.
+
+        :param input_string: string for a MESS (rates) input file
+        :type input_string: str
+        :param read_fake: value to include fake wells and barriers
+        :type read_fake: bool
+        :rtype: PesGraph
+    """
 
     # Initialize energy and connection information
     energy_dct = {}
-    conn_lst = tuple()
+    conn_lst = []
     conn_lst_dct = {}
     pes_label_dct = {}
 
+    # blocks still looking for their energy and fragments:
+    # [label, keywords] and [label, fragments]
+    ene_waits = []
+    frag_waits = []
+
     input_string = remove_comment_lines(
         input_string, delim_pattern=app.escape('!'))
-    input_lines = input_string.splitlines()
-    for idx, line in enumerate(input_lines):
-
-        if 'Well' in line:
-
-            line_lst = line.strip().split()
-            if line_lst[0].strip() == 'Well' and '!' not in line_lst[0]:
-                # Get label
-                label = line_lst[1]
-
-                if ('F' not in label) or ('F' in label and read_fake):
-                    # Get energy
-                    for line2 in input_lines[idx:]:
-                        if 'ZeroEnergy' in line2:
-                            ene = float(line2.split()[-1])
-                            break
-
-                    # Add value to energy dct
-                    energy_dct[label] = ene
-
-                    line_lst2 = line.split('!')
-                    if len(line_lst2) == 1:
-                        line_lst2 = line.split('#')
-                    if len(line_lst2) > 1:
-                        spc = line_lst2[1]
-                        pes_label_dct[spc.strip()] = label
-                    else:
-                        pes_label_dct[label] = label
-                        print('Warning: labeling not found for '
-                              f'species {label}')
-
-        if 'Bimolecular' in line:
-
-            line_lst = line.strip().split()
-
-            if line_lst[0].strip() == 'Bimolecular' and '!' not in line:
-                # Get label
-                label = line_lst[1]
-
-                # Get energy
-                for line2 in input_lines[idx:]:
-                    if 'Dummy' in line2:
-                        ene = -10.0
-                        break
-                    if 'GroundEnergy' in line2:
-                        ene = float(line2.split()[-1])
-                        break
-
-                # Add value to dct
-                energy_dct[label] = ene
-
-                # Add value to PES dct - NB THIS DEPENDS ON THE INPUT FILE.
-                # IF NOT PRESENT, DO NOT GENERATE THE PES LABEL DICTIONARY
-                cnt = 0
-                frags = []
-                for line2 in input_lines[idx:]:
-                    if 'Fragment' in line2:
-                        # Try and grab name from comment line
-                        frag_line_lst = line2.split('!')
-                        if len(frag_line_lst) == 1:
-                            frag_line_lst = line2.split('#')
-                        if len(frag_line_lst) > 1:
-                            frag = frag_line_lst[1]
-                            # strip gets rid of the spaces before and after
-                            frags.append(frag.strip())
-                        else:
-                            frag_line_lst = line2.split()
-                            frag = frag_line_lst[1]
-                            frags.append(frag.strip())
-                            print('Warning: labeling not found for '
-                                  f'bimol fragments for {label}')
-                        cnt += 1
-                    if cnt == 2:
-                        break
-
-                pes_label_dct[' + '.join(frags)] = label
-
-        if 'Barrier' in line:
-
-            line_lst = line.strip().split()
-            if line_lst[0].strip() == 'Barrier' and '!' not in line:
-                # Get label
-                [tslabel, rlabel, plabel] = line_lst[1:4]
-
-                if ('F' not in tslabel) or ('F' in tslabel and read_fake):
-                    # Get energy
-                    for line2 in input_lines[idx:]:
-                        if 'ZeroEnergy' in line2:
-                            ene = float(line2.split()[-1])
-                            break
-
-                    # Add value to dct
-                    energy_dct[tslabel] = ene
-
-                    # Amend fake labels (may be wrong)
-                    if not read_fake:
-                        rlabel = rlabel.replace('F', 'P')
-                        plabel = plabel.replace('F', 'P')
-
-                    # Add the connection to lst
-                    conn_lst += ((rlabel, tslabel),)
-                    conn_lst += ((tslabel, plabel),)
-                    conn_lst_dct[tslabel] = (rlabel, plabel)
-
-    return energy_dct, conn_lst, conn_lst_dct, pes_label_dct
+    for line in input_string.splitlines():
+
+        line_lst = line.strip().split()
+        key = line_lst[0] if line_lst else None
+
+        if key == 'Well':
+            # Get label
+            label = line_lst[1]
+
+            if ('F' not in label) or ('F' in label and read_fake):
+                # Energy is read from the ZeroEnergy line
+                energy_dct[label] = None
+                ene_waits.append((label, ('ZeroEnergy',)))
+
+                line_lst2 = line.split('!')
+                if len(line_lst2) == 1:
+                    line_lst2 = line.split('#')
+                if len(line_lst2) > 1:
+                    spc = line_lst2[1]
+                    pes_label_dct[spc.strip()] = label
+                else:
+                    pes_label_dct[label] = label
+                    print('Warning: labeling not found for '
+                          f'species {label}')
+
+        elif key == 'Bimolecular' and '!' not in line:
+            # Get label
+            label = line_lst[1]
+
+            # Energy is read from the GroundEnergy line, or is -10.0 for
+            # a Dummy
+            energy_dct[label] = None
+            ene_waits.append((label, ('Dummy', 'GroundEnergy')))
+
+            # Add value to PES dct - NB THIS DEPENDS ON THE INPUT FILE.
+            # IF NOT PRESENT, DO NOT GENERATE THE PES LABEL DICTIONARY
+            frag_waits.append((label, []))
+
+        elif key == 'Barrier' and '!' not in line:
+            # Get label
+            [tslabel, rlabel, plabel] = line_lst[1:4]
+
+            if ('F' not in tslabel) or ('F' in tslabel and read_fake):
+                # Energy is read from the ZeroEnergy line
+                energy_dct[tslabel] = None
+                ene_waits.append((tslabel, ('ZeroEnergy',)))
+
+                # Amend fake labels (may be wrong)
+                if not read_fake:
+                    rlabel = rlabel.replace('F', 'P')
+                    plabel = plabel.replace('F', 'P')
+
+                # Add the connection to lst
+                conn_lst.append((rlabel, tslabel))
+                conn_lst.append((tslabel, plabel))
+                conn_lst_dct[tslabel] = (rlabel, plabel)
+
+        # Pass the line to the blocks still waiting for it
+        if ene_waits:
+            ene_waits = [
+                (label, keywords) for label, keywords in ene_waits
+                if not _read_block_energy(line, label, keywords, energy_dct)]
+        if frag_waits and 'Fragment' in line:
+            for label, frags in frag_waits:
+                frags.append(_fragment_name(line, label))
+                if len(frags) == 2:
+                    pes_label_dct[' + '.join(frags)] = label
+            frag_waits = [(label, frags) for label, frags in frag_waits
+                          if len(frags) < 2]
+
+    # Bimolecular blocks with fewer than two fragments are labeled with
+    # the ones found
+    for label, frags in frag_waits:
+        pes_label_dct[' + '.join(frags)] = label
+
+    return PesGraph(energy_dct, tuple(conn_lst), conn_lst_dct, pes_label_dct)
+
+
+def _read_block_energy(line, label, keywords, energy_dct):
+    """ Set the energy of a block if the line has it; return whether it did
+    """
+    for keyword in keywords:
+        if keyword in line:
+            if keyword == 'Dummy':
+                energy_dct[label] = -10.0
+            else:
+                energy_dct[label] = float(line.split()[-1])
+            return True
+    return False
+
+
+def _fragment_name(line, label):
+    """ Name of a bimolecular fragment, from the comment of its line
+    """
+    # Try and grab name from comment line
+    frag_line_lst = line.split('!')
+    if len(frag_line_lst) == 1:
+        frag_line_lst = line.split('#')
+    if len(frag_line_lst) > 1:
+        frag = frag_line_lst[1]
+    else:
+        frag = line.split()[1]
+        print('Warning: labeling not found for '
+              f'bimol fragments for {label}')
+
+    # strip gets rid of the spaces before and after
+    return frag.strip()
+
+
+class PesGraph():
+    """ Energies and connectivity of the species and barriers on a PES
+        read from a MESS input, with adjacency maps for constant-time
+        barrier and connectivity lookups
+    """
+
+    def __init__(self, energy_dct, conn_lst, conn_lst_dct, pes_label_dct):
+        """
+        :param energy_dct: energy of each species and barrier
+        :type energy_dct: dict[label: energy]
+        :param conn_lst: (reac, barrier) and (barrier, prod) pairs
+        :type conn_lst: tuple((str, str))
+        :param conn_lst_dct: defines the wells connected by each barrier
+        :type conn_lst_dct: dict[barrier: (reac, prod)] all str
+        :param pes_label_dct: MESS label of each species name
+        :type pes_label_dct: dict[str: str]
+        """
+        self.energy_dct = energy_dct
+        self.conn_lst = conn_lst
+        self.conn_lst_dct = conn_lst_dct
+        self.pes_label_dct = pes_label_dct
+
+        # first barrier given for each (reac, prod), and the species
+        # connected to each species with the barrier between them
+        self.barrier_dct = {}
+        self.neighbor_dct = {}
+        for bar, (reac, prod) in conn_lst_dct.items():
+            self.barrier_dct.setdefault((reac, prod), bar)
+            self.neighbor_dct.setdefault(reac, {}).setdefault(prod, bar)
+            self.neighbor_dct.setdefault(prod, {}).setdefault(reac, bar)
+
+    def find_barrier(self, reac, prod):
+        """ finds the barrier that connects reac to prod
+            returns None if the barrier is not found
+
+            :param reac, prod: connected species
+            :type reac, prod: str
+            :return barriername: name of the barrier
+            :rtype: str
+        """
+        _bar = self.barrier_dct.get((reac, prod))
+        if _bar is None:
+            _bar = self.barrier_dct.get((prod, reac))
+        return _bar
+
+    def neighbors(self, spc):
+        """ the species connected to a species by a single barrier
+
+            :param spc: species label
+            :type spc: str
+            :rtype: tuple(str)
+        """
+        return tuple(self.neighbor_dct.get(spc, {}))
+
+    def connected(self, spc1, spc2):
+        """ whether two species are connected by a single barrier
+
+            :param spc1, spc2: species labels
+            :type spc1, spc2: str
+            :rtype: bool
+        """
+        return spc2 in self.neighbor_dct.get(spc1, {})
 
 
 def find_barrier(conn_lst_dct, reac, prod):
@@ -143,26 +231,19 @@ def find_barrier(conn_lst_dct, reac, prod):
         returns None if the barrier is not found
         future implementation: should find lowest energy path from reac to prod
 
-        :param conn_lst_dct: defines the wells connected by each barrier
-        :type conn_lst_dct: dict[barrier: (reac, prod)] all str
+        :param conn_lst_dct: defines the wells connected by each barrier,
+            or a PesGraph, which looks the barrier up in its adjacency map
+        :type conn_lst_dct: dict[barrier: (reac, prod)] all str, or PesGraph
         :param reac, prod: connected species
         :type reac, prod: str
         :return barriername: name of the barrier
         :rtype: str
     """
 
-    bar1 = (reac, prod)
-    bar2 = (prod, reac)
-    ls_keys = list(conn_lst_dct.keys())
-    ls_vals = list(conn_lst_dct.values())
-    bar1_find = apf.where_is(bar1, ls_vals)
-    bar2_find = apf.where_is(bar2, ls_vals)
-    if len(bar1_find) > 0:
-        _bar = ls_keys[bar1_find[0]]
-    elif len(bar2_find) > 0:
-        _bar = ls_keys[bar2_find[0]]
+    if isinstance(conn_lst_dct, PesGraph):
+        _bar = conn_lst_dct.find_barrier(reac, prod)
     else:
-        _bar = None
+        _bar = PesGraph({}, (), conn_lst_dct, {}).find_barrier(reac, prod)
 
     return _bar
 
@@ -6,51 +6,114 @@ from phydat import phycon
 import autoparse.pattern as app
 import autoparse.find as apf
 
+# Significant figures of the conditions that key a MergedWellTable: those
+# of the temperatures written by MESS, and fewer for the pressures, which
+# MESS writes in bar after converting them with a slightly different factor
+TEMP_SIG_FIGS = 6
+PRESSURE_SIG_FIGS = 4
+
 
 def merged_wells(mess_aux_str, pressure, temp):
     """ Parse the auxiliary MESS output file string for all of the groups
         of wells which merged at a given pressure and temperature
         from a Master Equation simulation
 
+        To look up several conditions, build a MergedWellTable once instead.
+
         :param mess_aux_str: string for the auxiliary file
         :type mess_aux_str: str
         :rtype: tuple(tuple(str))
     """
+    return MergedWellTable(mess_aux_str).merged_wells(pressure, temp)
+
+
+class MergedWellTable():
+    """ The groups of wells which merged at every pressure and temperature
+        of a Master Equation simulation, read from a single pass over the
+        auxiliary MESS output file
+    """
 
-    # Convert input pressure to bar for reading
-    pressure *= phycon.ATM2BAR
-
-    # Get the lines
-    mess_lines = mess_aux_str.splitlines()
-
-    # Parses number of wells and lines they appear on for second loop
-    # Done for each set of wells at each T and P
-    merged_well_lines = []
-    for i, line in enumerate(mess_lines):
-        if 'number of species =' in line:
-            cond_line = mess_lines[i-1].strip().split()
-            well_pressure = float(cond_line[2])
-            well_temp = float(cond_line[-2])
-            if (
-                numpy.isclose(pressure, well_pressure) and
-                numpy.isclose(temp, well_temp)
-            ):
-                nspc = int(line.strip().split()[-1])
-                merged_well_lines.append((nspc, i))
-
-    # Find all the lines in the block to grab the wells
-    merged_well_lst = ()
-    for nspc, line_idx in merged_well_lines:
-        for idx in range(nspc):
-            well_line = mess_lines[line_idx+1+idx*2]
-            well_names = well_line.strip().split()
-            if len(well_names) > 1:
-                merged_well_lst += (tuple(well_names),)
-  
-    if not merged_well_lst:
-        merged_well_lst = None
-
-    return merged_well_lst
+    def __init__(self, mess_aux_str):
+        """
+        :param mess_aux_str: string for the auxiliary file
+        :type mess_aux_str: str
+        """
+        # merged-well groups, keyed by the rounded (pressure [atm],
+        # temperature) conditions of each block in the order of the file
+        self._table = {}
+        self._index(mess_aux_str.splitlines())
+
+    def _index(self, mess_lines):
+        """ Read every 'number of species =' block: the line above it gives
+            the conditions, and the wells are listed every other line below
+        """
+        prev_line = ''
+        cond = None
+        nlines = 0
+        for line in mess_lines:
+            if nlines > 0:
+                if nlines % 2 == 0:
+                    well_names = line.strip().split()
+                    if len(well_names) > 1:
+                        self._table[cond] += (tuple(well_names),)
+                nlines -= 1
+            elif 'number of species =' in line:
+                cond_line = prev_line.strip().split()
+                cond = _condition_key(
+                    float(cond_line[2]) / phycon.ATM2BAR,
+                    float(cond_line[-2]))
+                self._table.setdefault(cond, ())
+                nlines = 2 * int(line.strip().split()[-1])
+            prev_line = line
+
+    def conditions(self):
+        """ The (pressure, temperature) conditions in the file, with the
+            pressures in atm, rounded as they are stored
+
+            :rtype: tuple((float, float))
+        """
+        return tuple(self._table)
+
+    def merged_wells(self, pressure, temp, nearest=False):
+        """ The groups of wells which merged at a pressure and temperature
+
+            The conditions are rounded to the precision of the file and
+            looked up directly.
+
+            :param pressure: pressure (atm)
+            :type pressure: float
+            :param temp: temperature (K)
+            :type temp: float
+            :param nearest: use the closest conditions in the file, rather
+                than only those that match: first the closest pressure, on
+                a log scale, then the closest temperature at that pressure
+            :type nearest: bool
+            :return: the groups, or None if no wells merged
+            :rtype: tuple(tuple(str))
+        """
+
+        if nearest and self._table:
+            pressure = min(
+                (cond[0] for cond in self._table),
+                key=lambda pres: abs(numpy.log(pres / pressure)))
+            temp = min(
+                (cond[1] for cond in self._table
+                 if cond[0] == pressure),
+                key=lambda tmp: abs(tmp - temp))
+
+        merged_well_lst = self._table.get(_condition_key(pressure, temp))
+
+        if not merged_well_lst:
+            merged_well_lst = None
+
+        return merged_well_lst
+
+
+def _condition_key(pressure, temp):
+    """ The pressure and temperature, rounded to key a MergedWellTable
+    """
+    return (float(f'{pressure:.{PRESSURE_SIG_FIGS}g}'),
+            float(f'{temp:.{TEMP_SIG_FIGS}g}'))
 
 
 def well_thermal_energy(log_str, well, temp):
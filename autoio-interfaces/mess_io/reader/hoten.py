@@ -25,14 +25,15 @@ def get_hot_species(input_str):
     energy_dct, _, _, _ = pes(input_str)
     mess_lines = input_str.splitlines()
     try:
-        hotsp_i = apf.where_in('HotEnergies', mess_lines)[0]
+        hotsp_i, _ = next(
+            apf.iter_where_in('HotEnergies', mess_lines, max_hits=1))
         num_hotsp = int(mess_lines[hotsp_i].strip().split()[1])
         #hotspecies = [None]*num_hotsp
         hotspecies_en = {}
         for line in mess_lines[hotsp_i+1:hotsp_i+1+num_hotsp]:
             hotname = line.strip().split()[0]
             hotspecies_en[hotname] = energy_dct[hotname]
-    except IndexError:
+    except (IndexError, StopIteration):
         print('*Error: no hotspecies - why did you call this function?')
         print('returning empty dictionary \n')
         hotspecies_en = {}
@@ -41,7 +42,7 @@ def get_hot_species(input_str):
 
 
 def extract_hot_branching(hot_log_str, hotspecies_en, species_lst,
-                          sp_labels='auto'):
+                          sp_labels='auto', multiindex=False):
     """ Extract hot branching fractions for a single species
         :param hot_log_str: string of mess log file
         :type hot_log_str: str
@@ -53,36 +54,41 @@ def extract_hot_branching(hot_log_str, hotspecies_en, species_lst,
                 in mess input, 'out' is how they are labeled in the output;
                 'auto' decides 'inp' if it finds the lbl dct
         :type sp_labels: str
+        :param multiindex: return a single dataframe for each hotspecies,
+                indexed by (P, T, energy), instead of a dataframe of
+                dataframes
+        :type multiindex: bool
         :return hoten_dct: hot branching fractions for hotspecies
         :rtype hoten_dct: dct{hotspecies: df[P][T]:df[allspecies][energies]}
+            or dct{hotspecies: df[allspecies][(P, T, energies)]}
     """
     # get label dictionary
     lbl_dct = name_label_dct(hot_log_str)
     if lbl_dct:
         inv_lbl_dct = invert(lbl_dct)
-        
+
     if sp_labels == 'auto':
         sp_labels = 'inp'*(not not lbl_dct) + 'out'*(not lbl_dct)
-        
+    if sp_labels not in ('inp', 'out'):
+        print('*Error: sp_labels must be "inp" (as in mess input) \
+            or "out" (as in mess output)')
+        sys.exit()
+
     lines = hot_log_str.splitlines()
     # for each species: dataframe of dataframes BF[Ti][pi]
     # each of them has BF[energy][species]
     # preallocations
     hotspecies_lst = list(hotspecies_en.keys())
 
-    # 1. extract P, T and preallocate dictionary
+    # 1. extract P, T
     pt_i_array = apf.where_in(['Pressure', 'Temperature'], lines)
     pt_list = []
     for pt_i in pt_i_array:
         pt_list.append([
             float(var)
             for var in lines[pt_i].strip().split()[2:7:4]])
-    pressures = list(set([pt[0] for pt in pt_list]))
-    temps = list(set([pt[1] for pt in pt_list]))
-    pressures.sort(), temps.sort()
-
-    hoten_dct = {s: pd.DataFrame(index=temps, columns=pressures)
-                 for s in hotspecies_lst}
+    pressures = sorted(set(pt[0] for pt in pt_list))
+    temps = sorted(set(pt[1] for pt in pt_list))
 
     # variables limiting the blocks
     hot_i_array = apf.where_in(['Hot distribution branching ratios'], lines)
@@ -93,93 +99,114 @@ def extract_hot_branching(hot_log_str, hotspecies_en, species_lst,
         ['prompt', 'isomerization', 'dissociation'], lines)
 
     # 2. find Hot distribution branching ratios:
+    # frames of each hotspecies, by (P, T)
+    bf_dct = {hotspecies: {} for hotspecies in hotspecies_lst}
     for i, hot_i in enumerate(hot_i_array):
 
-        # extract block, PT, and species for which BF is assigned
-        lines_block = lines[hot_i+2:end_hot_i_array[i]]
-        _press, _temp = [
-            float(var)
-            for var in lines[pt_i_array[i]].strip().split()[2:7:4]]
+        _press, _temp = pt_list[i]
 
         # options for different outputs:
         if 'WellE' in lines[hot_i+1]:
             species_bf_i_messout = lines[hot_i+1].strip().split()[2:-1]
-            outtype = 2
         elif 'kcal ' in lines[hot_i+1]:
             species_bf_i_messout = lines[hot_i+1].strip().split()[3:]
-            outtype = 1
         else:
             print('*Error in reading hoten blocks - Yuri changed output again. exiting')
             sys.exit()
+        nspc = len(species_bf_i_messout)
+
+        if sp_labels == 'inp':
+            species_bf_i = [lbl_dct[sp_i] for sp_i in species_bf_i_messout]
+        else:
+            species_bf_i = species_bf_i_messout
+
+        # split the block once: the species name of each line, and an
+        # array of its energy and branching fractions (without the total)
+        rows = [line.split() for line in lines[hot_i+2:end_hot_i_array[i]]]
+        rows = [row for row in rows if len(row) >= nspc + 2]
+        names = np.array([row[0] for row in rows])
+        block_arr = np.array([row[1:nspc+2] for row in rows],
+                             dtype=float).reshape(len(rows), nspc+1)
 
         # for each hotspecies: read BFs
         # rescale energy by the hotspecies energy on the PES!!
         # ref 0 energy is the ref for the PES, even for the hotspecies
-
         for hotspecies in hotspecies_lst:
-            hot_e_lvl, branch_ratio = [], []
-            ref_en = hotspecies_en[hotspecies]
-
             if sp_labels == 'inp':
                 hotspecies_messout = inv_lbl_dct[hotspecies]
-                species_bf_i = [lbl_dct[sp_i] for sp_i in species_bf_i_messout]
-            elif sp_labels == 'out':
-                hotspecies_messout = hotspecies
-                species_bf_i = species_bf_i_messout
             else:
-                print('*Error: sp_labels must be "inp" (as in mess input) \
-                    or "out" (as in mess output)')
-                sys.exit()
+                hotspecies_messout = hotspecies
+
+            sp_arr = block_arr[names == hotspecies_messout]
+            hot_e = sp_arr[:, 0] - hotspecies_en[hotspecies]
+            branch_ratio = sp_arr[:, 1:]
 
+            # pick only energies above 0
+            valid = hot_e > 0
+            # check that value of reactant branching is between 0 and 1
+            # if any bf > 1: skip the line
             sp_i = apf.where_is(hotspecies_messout, species_bf_i_messout)
+            if sp_i.size > 0:
+                valid &= ~np.any(branch_ratio > 1, axis=1)
+                valid &= branch_ratio[:, sp_i[0]] > 1e-10
 
-            for line in lines_block:
-                line = line.strip()
-                if line.startswith(hotspecies_messout):
-                    hot_e = float(line.split()[1]) - ref_en
-                    # pick only values above 0
-                    if hot_e not in hot_e_lvl and hot_e > 0:
-                        if outtype == 1:
-                            branch_ratio_arr = np.array(
-                                list(line.split()[2:]), dtype=float)
-                        elif outtype == 2:
-                            branch_ratio_arr = np.array(
-                                list(line.split()[2:-1]), dtype=float)         
-
-                        # check that value of reactant branching is between 0 and 1
-                        # if any bf > 1: skip the line
-                        if sp_i.size > 0:
-                            if any(branch_ratio_arr > 1):
-                                continue
-                            elif branch_ratio_arr[sp_i] <= 1e-10:
-                                continue
-
-                        # remove negative values or values >1
-                        _arr = [abs(x*int(1e-8 < x <= 1))
-                                for x in branch_ratio_arr]
-                        br_filter = np.array(_arr, dtype=float)
-
-                        # if all invalid: do not save
-                        if all(br_filter == 0):
-                            continue
-                        br_renorm = br_filter/np.sum(br_filter)
-                        # append values
-                        branch_ratio.append(br_renorm)
-                        hot_e_lvl.append(hot_e)
-
-            hot_e_lvl = np.array(hot_e_lvl)
-            branch_ratio = np.array(branch_ratio)
+            # remove negative values or values >1
+            br_filter = np.where(
+                (branch_ratio > 1e-8) & (branch_ratio <= 1), branch_ratio, 0.)
+            # if all invalid: do not save
+            valid &= np.any(br_filter > 0, axis=1)
 
-            # 3. allocate in the dataframe
+            # keep the first valid line for each energy
+            valid_idxs = np.flatnonzero(valid)
+            _, first_idxs = np.unique(hot_e[valid_idxs], return_index=True)
+            valid_idxs = valid_idxs[np.sort(first_idxs)]
+
+            br_filter = br_filter[valid_idxs]
+            br_renorm = br_filter / np.sum(br_filter, axis=1, keepdims=True)
 
+            # 3. allocate in the dataframe
             bf_hotspecies = pd.DataFrame(
-                0, index=hot_e_lvl, columns=species_lst)
-            bf_hotspecies[species_bf_i] = branch_ratio
-            hoten_dct[hotspecies][_press][_temp] = bf_hotspecies
+                0., index=hot_e[valid_idxs], columns=species_lst)
+            bf_hotspecies[species_bf_i] = br_renorm
+            bf_dct[hotspecies][(_press, _temp)] = bf_hotspecies
+
+    # 4. build the output frames for each hotspecies at once
+    hoten_dct = {}
+    for hotspecies, pt_bf_dct in bf_dct.items():
+        if multiindex:
+            hoten_dct[hotspecies] = _multiindex_frame(pt_bf_dct, species_lst)
+        else:
+            bf_arr = np.full((len(temps), len(pressures)), np.nan,
+                             dtype=object)
+            for (_press, _temp), bf_hotspecies in pt_bf_dct.items():
+                bf_arr[temps.index(_temp), pressures.index(_press)] = (
+                    bf_hotspecies)
+            hoten_dct[hotspecies] = pd.DataFrame(
+                bf_arr, index=temps, columns=pressures)
 
     return hoten_dct
 
 
+def _multiindex_frame(pt_bf_dct, species_lst):
+    """ Stack the branching fraction frames of a hotspecies at each (P, T)
+        into one frame indexed by (P, T, energy)
+    """
+    idx_arrs = ([], [], [])
+    bf_arrs = [np.zeros((0, len(species_lst)))]
+    for (_press, _temp), bf_hotspecies in sorted(pt_bf_dct.items()):
+        nene = len(bf_hotspecies.index)
+        idx_arrs[0].append(np.full(nene, _press))
+        idx_arrs[1].append(np.full(nene, _temp))
+        idx_arrs[2].append(bf_hotspecies.index.to_numpy(dtype=float))
+        bf_arrs.append(bf_hotspecies[list(species_lst)].to_numpy(dtype=float))
+
+    index = pd.MultiIndex.from_arrays(
+        [np.concatenate(arrs) if arrs else np.zeros(0) for arrs in idx_arrs],
+        names=['pressure', 'temperature', 'energy'])
+
+    return pd.DataFrame(np.vstack(bf_arrs), index=index, columns=species_lst)
+
+
 def extract_fne(log_str, sp_labels='auto'):
     """ Extract fne from log file
         :param log_str: string of mess log file
@@ -11,6 +11,9 @@ from ioformat import remove_comment_lines
 from mess_io.reader._label import name_label_dct
 from automol.util.dict_ import invert
 
+# np.trapz is renamed np.trapezoid in numpy 2
+_trapezoid = getattr(np, 'trapezoid', None) or np.trapz
+
 
 def ped_names(input_str):
     """ Reads the ped_species and ped_output from the MESS input file string
@@ -86,10 +89,10 @@ def get_ped(pedoutput_str, ped_spc, energy_dct, sp_labels='auto'):
             # if there are negative values of the probability: remove them
             prob_en = prob_en[prob_en[prob_en < 0].index[-1]+1:]
         # integrate with trapz
-        prob_en /= np.trapz(prob_en.values, x=prob_en.index)
+        prob_en /= _trapezoid(prob_en.values, x=prob_en.index)
         # if issues : keep only max value like dirac delta
         if any(np.isnan(prob_en.values)) or any(np.isinf(prob_en.values)):
-            prob_en = np.NaN
+            prob_en = np.nan
             
         try:
             if max(prob_en) > 1:
@@ -101,7 +104,7 @@ def get_ped(pedoutput_str, ped_spc, energy_dct, sp_labels='auto'):
 
             prob_en = pd.Series(probability[prob_1], index=energy[prob_1])
             if prob_en.empty or energy[prob_1] < 0:
-                prob_en = np.NaN
+                prob_en = np.nan
                 
         except TypeError:
             pass
@@ -140,54 +143,12 @@ def get_ped(pedoutput_str, ped_spc, energy_dct, sp_labels='auto'):
         if sp_labels == 'inp':
             hotwells = [lbl_dct[well] for well in hotwells]
 
-    ped_df_dct = {}
-    # ped_df_dct = dict.fromkeys(energy_dct.keys())
-    # find the energy for the scaling: everything refers to the products
-    for spc in ped_spc:
-        # allocate empty dataframe
-        ped_df = pd.DataFrame(index=list(set(temperature_lst)),
-                              columns=list(set(pressure_lst)), dtype=object)
-        reacs, prods = spc
-        label = ((reacs,), (prods,), (None,))  # rxn name
-        # relabel if necessary
-        if sp_labels == 'inp':
-            label_messout = '->'.join([inv_lbl_dct[reacs], inv_lbl_dct[prods]])
-        elif sp_labels == 'out':
-            label_messout = '->'.join(spc)
-        else:
-            print('*Error: sp_labels must be "inp" (as in mess input) \
-                or "out" (as in mess output)')
-            sys.exit()
-
-        # 0th of the energy: products energy
-        ene0 = -energy_dct[prods]
-
-        species_i, final_i = indexes(label_messout, ped_lines)
-        # column label
-        column_i = apf.where_is(
-            label_messout, ped_lines[species_i[0]-1].strip().split()[1:])[0]
-        # reset species_i and final_i based on correspondence with label
-
-        # check that length of pressure list is the same as new species_i
-        # extract the data
-        for i in np.arange(0, len(species_i)):
-            # if labels don't match: go to next loop
-            if label_messout not in ped_lines[species_i[i]-1]:
-                continue
+    # distributions of the bimolecular reactions, for all (P, T) at once
+    ped_arr_dct = _ped_arrays(
+        ped_lines, ped_spc, energy_dct, lbl_dct, sp_labels)
+    ped_df_dct = {label: _ped_frame(*ped_arrs)
+                  for label, ped_arrs in ped_arr_dct.items()}
 
-            pressure, temp = pressure_lst[i], temperature_lst[i]
-            i_in, i_fin = species_i[i], final_i[i]
-
-            en_prob_all = np.array(
-                [line.strip().split() for line in ped_lines[i_in:i_fin]],
-                dtype=float).T
-            energy = en_prob_all[:][0] + ene0
-            probability = en_prob_all[:][column_i]
-
-            ped_df[pressure][temp] = prob_en_single(probability, energy)
-
-        ped_df_dct[label] = ped_df
-        
     for hotwell in hotwells:
 
         # relabel if necessary
@@ -210,13 +171,8 @@ def get_ped(pedoutput_str, ped_spc, energy_dct, sp_labels='auto'):
             prods_outinp = pd.Series(prods_list, index=prods_list)
         ene0_all = pd.Series(-np.array([energy_dct[prods_outinp[prods]]
                                         for prods in prods_list]), index=prods_list)
-        # allocate dataframes and labels
-        for prods in prods_outinp.values:
-            label = ((hotwell,), (prods,), (None,))
-            ped_df_dct[label] = pd.DataFrame(index=list(set(temperature_lst)),
-                                             columns=list(set(pressure_lst)), dtype=object)
-
-        # extract the data
+        # extract the data: distributions by (P, T) and initial energy
+        hot_ped_dct = {prods: {} for prods in prods_outinp.values}
         for i in np.arange(0, len(species_i)):
             i_in, i_fin = species_i[i]+1, final_i[i]
             pressure, temp = pressure_lst[pressure_i <
@@ -229,21 +185,213 @@ def get_ped(pedoutput_str, ped_spc, energy_dct, sp_labels='auto'):
                 dtype=float).T
 
             for pi, prods in enumerate(prods_list):
+                energy = en_prob_all[:][0] + ene0_all[prods]
+                probability = en_prob_all[:][pi+1]
+                prob_en = prob_en_single(probability, energy)
+                pt_dct = hot_ped_dct[prods_outinp[prods]].setdefault(
+                    (pressure, temp), {})
+                if isinstance(prob_en, pd.Series):
+                    pt_dct[init_energy] = prob_en
+                else:
+                    pt_dct.pop(init_energy, None)
 
-                label = ((hotwell,), (prods_outinp[prods],), (None,))
-                try:
-                    ped_df_dct[label][pressure][temp][init_energy]
-                except TypeError:
-                    ped_df_dct[label][pressure][temp] = pd.Series(dtype=object)
-                except KeyError:
-                    pass
-                finally:
-                    energy = en_prob_all[:][0] + ene0_all[prods]
-                    probability = en_prob_all[:][pi+1]
-                    # print(probability)
-                    ped_df_dct[label][pressure][temp][init_energy] = prob_en_single(
-                        probability, energy)
-                    # print(label, prods , pressure, temp , ped_df_dct[label][pressure][temp][init_energy])
-                    ped_df_dct[label][pressure][temp] = ped_df_dct[label][pressure][temp].dropna()
+        # allocate dataframes and labels
+        temps = sorted(set(temperature_lst))
+        pressures = sorted(set(pressure_lst))
+        for prods, pt_dct in hot_ped_dct.items():
+            label = ((hotwell,), (prods,), (None,))
+            ped_arr = np.full((len(temps), len(pressures)), np.nan,
+                              dtype=object)
+            for (pressure, temp), ene_dct in pt_dct.items():
+                ped_ser = pd.Series(dtype=object)
+                for init_energy, prob_en in ene_dct.items():
+                    ped_ser[init_energy] = prob_en
+                ped_arr[temps.index(temp), pressures.index(pressure)] = (
+                    ped_ser)
+            ped_df_dct[label] = pd.DataFrame(
+                ped_arr, index=temps, columns=pressures)
 
     return ped_df_dct
+
+
+def ped_arrays(pedoutput_str, ped_spc, energy_dct, sp_labels='auto'):
+    """ Read `PEDOutput` file and extract the product energy distributions
+        of the bimolecular-to-bimolecular reactions at all (P, T) at once.
+        Energy in output set with respect to the ground energy of the products
+
+        For each reaction, the distributions are returned as an array with
+        one row for each (P, T) and one column for each energy, with NaN
+        for the energies outside of the distribution. Rows that are all NaN
+        are conditions with no valid distribution.
+
+        :param pedoutput_str: string of lines of ped_output file
+        :type pedoutput_str: str
+        :param ped_spc: species of interest in pedoutput
+        :type ped_spc: list(list(str))
+        :param energy_dct: energies of ped PES
+        :type energy_dct: {label: energy} (str)
+        :param sp_labels: type of pedspecies labels: 'inp' is how you find them
+                in mess input, 'out' is how they are labeled in the output,
+                'auto' sets inp if it finds the labels
+        :type sp_labels: str
+        :return ped_arr_dct: (P, T) conditions, energies, and distributions
+        :rtype ped_arr_dct: {((reacs,),(prods,),(None,)):
+            (tuple((float, float)), numpy.ndarray, numpy.ndarray)}
+    """
+    lbl_dct = name_label_dct(pedoutput_str)
+    if sp_labels == 'auto':
+        sp_labels = 'out'*(not lbl_dct) + 'inp'*(not not lbl_dct)
+
+    return _ped_arrays(pedoutput_str.splitlines(), ped_spc, energy_dct,
+                       lbl_dct, sp_labels)
+
+
+def _ped_arrays(ped_lines, ped_spc, energy_dct, lbl_dct, sp_labels):
+    """ Read the bimolecular-to-bimolecular distributions from the lines of
+        the `PEDOutput` file, as in ped_arrays
+    """
+    if sp_labels == 'inp':
+        inv_lbl_dct = invert(lbl_dct)
+    elif sp_labels != 'out':
+        print('*Error: sp_labels must be "inp" (as in mess input) \
+            or "out" (as in mess output)')
+        sys.exit()
+
+    # read each block once, with its conditions and column labels
+    blocks = []
+    for pressure, temp, headers, i_in, i_fin in _ped_blocks(ped_lines):
+        en_prob_all = np.array(
+            [line.split() for line in ped_lines[i_in:i_fin]],
+            dtype=float).reshape(i_fin-i_in, len(headers)+1)
+        blocks.append(((pressure, temp), headers, en_prob_all))
+
+    ped_arr_dct = {}
+    for spc in ped_spc:
+        reacs, prods = spc
+        label = ((reacs,), (prods,), (None,))  # rxn name
+        # relabel if necessary
+        if sp_labels == 'inp':
+            label_messout = '->'.join([inv_lbl_dct[reacs], inv_lbl_dct[prods]])
+        else:
+            label_messout = '->'.join(spc)
+
+        # energies of all blocks for the reaction, on one grid
+        spc_blocks = [(cond, en_prob_all[:, 0],
+                       en_prob_all[:, headers.index(label_messout)+1])
+                      for cond, headers, en_prob_all in blocks
+                      if label_messout in headers]
+        conds = tuple(cond for cond, _, _ in spc_blocks)
+        energy = np.unique(np.concatenate(
+            [np.zeros(0)] + [ene for _, ene, _ in spc_blocks]))
+        prob_arr = np.full((len(conds), len(energy)), np.nan)
+        for i, (_, ene, prob) in enumerate(spc_blocks):
+            prob_arr[i, np.searchsorted(energy, ene)] = prob
+
+        # 0th of the energy: products energy
+        energy = energy - energy_dct[prods]
+        ped_arr_dct[label] = (conds, energy,
+                              _normalized_peds(energy, prob_arr))
+
+    return ped_arr_dct
+
+
+def _ped_blocks(ped_lines):
+    """ Find the bimolecular-to-bimolecular distribution blocks in one pass
+
+        :return: pressure, temperature, column labels, and the first and
+            last+1 line indices of the rows of each block
+        :rtype: tuple((float, float, list(str), int, int))
+    """
+    blocks = []
+    pressure, temp, block = None, None, None
+    for i, line in enumerate(ped_lines):
+        if block is not None and not line.strip():
+            blocks.append(block + (i,))
+            block = None
+        elif line.startswith('pressure'):
+            pressure = float(line.split('=')[1])
+        elif line.startswith('temperature'):
+            temp = float(line.split('=')[1])
+        elif 'E, kcal/mol' in line and '->' in line:
+            headers = line.strip().split()[2:]
+            block = (pressure, temp, headers, i+1)
+    if block is not None:
+        blocks.append(block + (len(ped_lines),))
+
+    return tuple(blocks)
+
+
+def _normalized_peds(energy, prob_arr):
+    """ Normalize a set of energy distributions on a common grid, one per
+        row, with NaN for missing values. As for each distribution in
+        get_ped, the values at non-positive energies and those up to
+        1 kcal/mol above the highest energy with a negative probability are
+        removed, and the rest are normalized with the trapezoidal rule and
+        rescaled if above 1. Distributions that cannot be normalized are
+        replaced by the first point with probability 1, if any.
+
+        :param energy: energies, in increasing order
+        :type energy: numpy.ndarray
+        :param prob_arr: probabilities, one distribution per row
+        :type prob_arr: numpy.ndarray
+        :rtype: numpy.ndarray
+    """
+    nrows, nene = prob_arr.shape
+    defined = ~np.isnan(prob_arr)
+
+    # remove negative energies and negative values of the probability
+    keep = defined & (energy > 0)
+    neg_ene = np.where(keep & (prob_arr < 0), energy, -np.inf)
+    keep &= energy >= (np.max(neg_ene, axis=1, initial=-np.inf) + 1)[:, None]
+    prob = np.where(keep, prob_arr, 0.)
+
+    # integrate with the trapezoidal rule between consecutive kept values
+    ene_idxs = np.arange(nene)
+    prev_idxs = np.maximum.accumulate(
+        np.where(keep, ene_idxs, -1), axis=1)[:, :-1]
+    prev_idxs = np.concatenate(
+        [np.full((nrows, 1), -1), prev_idxs], axis=1)
+    pair = keep & (prev_idxs >= 0)
+    prev_idxs = np.maximum(prev_idxs, 0)
+    area = np.sum(np.where(
+        pair,
+        (energy - energy[prev_idxs]) *
+        (prob + np.take_along_axis(prob, prev_idxs, axis=1)) / 2.,
+        0.), axis=1)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        prob = np.where(keep, prob / area[:, None], np.nan)
+        # if issues : keep only max value like dirac delta
+        bad = np.any(keep & ~np.isfinite(prob), axis=1)
+        prob_max = np.max(np.where(keep, prob, -np.inf), axis=1,
+                          initial=-np.inf)
+        prob = np.where((prob_max > 1)[:, None], prob / prob_max[:, None],
+                        prob)
+    prob[bad] = np.nan
+
+    # if nothing is left, use the first value of 1 in the output
+    # (energies in the output are decreasing)
+    empty = ~np.any(keep, axis=1)
+    ones = defined & (prob_arr == 1)
+    one_idxs = nene - 1 - np.argmax(ones[:, ::-1], axis=1)
+    for i in np.flatnonzero(empty & np.any(ones, axis=1)):
+        if energy[one_idxs[i]] >= 0:
+            prob[i, one_idxs[i]] = 1.
+
+    return prob
+
+
+def _ped_frame(conds, energy, prob_arr):
+    """ Dataframe (columns:P, rows:T) with the Series of energy distrib
+        from the arrays of ped_arrays
+    """
+    pressures = sorted(set(cond[0] for cond in conds))
+    temps = sorted(set(cond[1] for cond in conds))
+    ped_arr = np.full((len(temps), len(pressures)), np.nan, dtype=object)
+    for (pressure, temp), prob in zip(conds, prob_arr):
+        valid = ~np.isnan(prob)
+        if np.any(valid):
+            ped_arr[temps.index(temp), pressures.index(pressure)] = (
+                pd.Series(prob[valid], index=energy[valid], dtype=float))
+
+    return pd.DataFrame(ped_arr, index=temps, columns=pressures)
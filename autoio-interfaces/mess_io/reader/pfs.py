@@ -4,13 +4,84 @@
   corresponding to one species.
 """
 
+from collections import OrderedDict
+import numpy
 
-def partition_function(output_str):
+
+PF_TABLE_FIELDS = ('T', 'logQ', 'dlogQ_dT', 'd2logQ_dT2', 'S', 'Cp')
+PF_TABLE_CACHE_MAXSIZE = 256
+_PF_TABLE_CACHE = OrderedDict()
+
+
+def read_pf_table(output_str, cache=False):
+    """ Parses the MESSPF output file string into a table of the partition
+        function, its derivatives, the entropy and the heat capacity of a
+        single species at each temperature.
+
+        Columns missing from the output (e.g., S and Cp in files that only
+        give the partition function) are set to NaN.
+
+        With cache=True, tables are stored by the hash of the string, so
+        reading the same output again (e.g., through each of
+        partition_function, entropy, and heat_capacity) does not reparse
+        it; the returned table is then read-only.
+
+        :param output_str: string of lines for MESSPF output file
+        :type output_str: str
+        :param cache: look up and store the table in the module cache
+        :type cache: bool
+        :return: table with fields T, logQ, dlogQ_dT, d2logQ_dT2, S, Cp
+        :rtype: numpy.ndarray
+    """
+
+    if cache:
+        key = hash(output_str)
+        stored = _PF_TABLE_CACHE.get(key)
+        if stored is not None and (
+                stored[0] is output_str or stored[0] == output_str):
+            _PF_TABLE_CACHE.move_to_end(key)
+            return stored[1]
+
+    # Skip the three header lines; when every row has the same number of
+    # columns, the values are converted together from one split
+    lines = [line for line in output_str.splitlines()[3:] if line.strip()]
+    ncols = len(lines[0].split()) if lines else 0
+    vals = numpy.array(' '.join(lines).split(), dtype=float)
+    if vals.size != len(lines) * ncols:
+        rows = [line.split() for line in lines]
+        ncols = min(len(row) for row in rows)
+        vals = numpy.array([row[:ncols] for row in rows], dtype=float)
+    vals = vals.reshape(len(lines), ncols)
+    ncols = min(ncols, len(PF_TABLE_FIELDS))
+
+    table = numpy.full(len(lines), numpy.nan,
+                       dtype=[(field, float) for field in PF_TABLE_FIELDS])
+    for idx, field in enumerate(PF_TABLE_FIELDS[:ncols]):
+        table[field] = vals[:, idx]
+
+    if cache:
+        table.flags.writeable = False
+        _PF_TABLE_CACHE[key] = (output_str, table)
+        while len(_PF_TABLE_CACHE) > PF_TABLE_CACHE_MAXSIZE:
+            _PF_TABLE_CACHE.popitem(last=False)
+
+    return table
+
+
+def clear_pf_table_cache():
+    """ Empty the cache of tables stored by read_pf_table
+    """
+    _PF_TABLE_CACHE.clear()
+
+
+def partition_function(output_str, cache=False):
     """ Parses the MESSPF output file string for the parition function
         and related information for a single species.
 
         :param output_str: string of lines for MESSPF output file
         :type output_str: str
+        :param cache: use the read_pf_table cache
+        :type cache: bool
         :return [temps: logq, dq_dt, dq2_dt2]:
             List of temperatures
             loq(Q) where Q is partition function
@@ -19,63 +90,47 @@ def partition_function(output_str):
         :rtype: dict[float: tuple(float)]
     """
 
-    temps, logq, dq_dt, dq2_dt2 = tuple(), tuple(), tuple(), tuple()
-    for i, line in enumerate(output_str.splitlines()):
-        if i not in (0, 1, 2):
-            tmp = line.strip().split()
-            temps += (float(tmp[0]),)
-            logq += (float(tmp[1]),)
-            dq_dt += (float(tmp[2]),)
-            dq2_dt2 += (float(tmp[3]),)
+    table = read_pf_table(output_str, cache=cache)
 
-    # pf_dct = dict(zip(temps, zip(logq, dq_dt, dq2_dt2)))
-    # return pf_dct
-    return temps, logq, dq_dt, dq2_dt2
+    return tuple(tuple(table[field].tolist())
+                 for field in PF_TABLE_FIELDS[:4])
 
 
-def entropy(output_str):
+def entropy(output_str, cache=False):
     """ Parses the MESSPF output file string for the entropy
         for a single species.
 
         :param output_str: string of lines for MESSPF output file
         :type output_str: str
+        :param cache: use the read_pf_table cache
+        :type cache: bool
         :return [temps: s_t]:
             List of temperatures
             Entropy
         :rtype: dict[float: tuple(float)]
     """
 
-    temps, s_t = tuple(), tuple()
-    for i, line in enumerate(output_str.splitlines()):
-        if i not in (0, 1, 2):
-            tmp = line.strip().split()
-            temps += (float(tmp[0]),)
-            s_t += (float(tmp[4]),)
-
-    s_dct = dict(zip(temps, s_t))
+    table = read_pf_table(output_str, cache=cache)
+    s_dct = dict(zip(table['T'].tolist(), table['S'].tolist()))
 
     return s_dct
 
 
-def heat_capacity(output_str):
+def heat_capacity(output_str, cache=False):
     """ Parses the MESSPF output file string for the heat capacity
         for a single species.
 
         :param output_str: string of lines for MESSPF output file
         :type output_str: str
+        :param cache: use the read_pf_table cache
+        :type cache: bool
         :return [temps: cp_t]:
             List of temperatures
             Entropy
         :rtype: dict[float: tuple(float)]
     """
 
-    temps, cp_t = tuple(), tuple()
-    for i, line in enumerate(output_str.splitlines()):
-        if i not in (0, 1, 2):
-            tmp = line.strip().split()
-            temps += (float(tmp[0]),)
-            cp_t += (float(tmp[5]),)
-
-    cp_dct = dict(zip(temps, cp_t))
+    table = read_pf_table(output_str, cache=cache)
+    cp_dct = dict(zip(table['T'].tolist(), table['Cp'].tolist()))
 
     return cp_dct
@@ -5,6 +5,7 @@
 """
 
 import sys
+import itertools
 import numpy
 import pandas as pd
 import copy
@@ -15,6 +16,11 @@ from mess_io.reader._label import name_label_dct
 
 # Global lists
 UNWANTED_RXN_TYPS = ('fake', 'self', 'loss', 'capture', 'reverse')
+HIGHP_BLOCK_STR = ('High Pressure Rate Coefficients ' +
+                   '(Temperature-Species Rate Tables):')
+KE_CHUNK_SIZE = 4096
+# Columns of the rate tables that are not products
+NON_PRODUCT_HEADERS = ('T(K)', 'Loss', 'Capture')
 
 
 # Functions for getting k(T,P) values from main MESS `RateOut` file
@@ -54,12 +60,13 @@ def get_rxn_ktp_dct(out_str,
 
     # Get the MESS rxn in the tuple format ((rct,), (prd,), third_body))
     # For each rxn pair, get rate constants, with filtering as indicated
+    rate_out = MessRateOutput(out_str)
     rxn_ktp_dct = {}
     for rxn in rxns:
-        rxn_ktp_dct[rxn] = ktp_dct(out_str, rxn[0][0], rxn[1][0],
-                                   filter_kts=filter_kts, tmin=tmin,
-                                   tmax=tmax, pmin=pmin, pmax=pmax,
-                                   convert=convert)
+        rxn_ktp_dct[rxn] = rate_out.ktp(rxn[0][0], rxn[1][0],
+                                        filter_kts=filter_kts, tmin=tmin,
+                                        tmax=tmax, pmin=pmin, pmax=pmax,
+                                        convert=convert)
 
     # Reformat the dictionary keys to follow the tuple of tuples format
     # print('dct 1', rxn_ktp_dct.keys())
@@ -87,6 +94,9 @@ def ktp_dct(output_str, reactant, product, filter_kts=True, tmin=None,
         Pressures in atm.
         K(T)s in cm3/mol.s [bimol] or 1/s [unimol]
 
+        To read several reactions from the same output, build a
+        MessRateOutput object once and call its ktp method instead.
+
         :param output_str: string of lines of MESS output file
         :type output_str: str
         :param reactant: label for the reactant used in the MESS output
@@ -95,166 +105,266 @@ def ktp_dct(output_str, reactant, product, filter_kts=True, tmin=None,
         :type product: str
         :rtype dict[float: (float, float)]
     """
+    return MessRateOutput(output_str).ktp(
+        reactant, product, filter_kts=filter_kts, tmin=tmin, tmax=tmax,
+        pmin=pmin, pmax=pmax, convert=convert)
 
-    # Get the MESS output lines
-    out_lines = output_str.splitlines()
-
-    # Initialize dictionary with high-pressure rate constants
-    _highp = _highp_kts(out_lines, reactant, product)
-    if _highp is not None:
-        _ktp_dct = {'high': _highp_kts(out_lines, reactant, product)}
-    else:
-        _ktp_dct = {}
-
-    # Read the pressures and convert them to atm if needed
-    _pressures, _ = pressures(output_str, mess_file='out')
 
-    # Update the dictionary with the pressure-dependent rate constants
-    for pressure in (_press for _press in _pressures if _press != 'high'):
-        _ktp_dct.update(_pdep_kts(out_lines, reactant, product, pressure))
+class MessRateOutput():
+    """ Index of the rate-constant tables in a MESS output file string.
 
-    bimol = (reactant[0] == 'P') or ('+' in reactant)
-
-    # Note: filtering is before unit conversion, so bimolthresh is in cm^3.s^-1
-    if filter_kts:
-        _ktp_dct = filter_ktp_dct(_ktp_dct, bimol, tmin=tmin, tmax=tmax,
-                                  pmin=pmin, pmax=pmax)
-    if convert:
-        _ktp_dct = convert_units(_ktp_dct, bimol)
+        The lines are scanned once to find the line where each
+        (reactant, pressure) table starts and the column of each product
+        in it. The rows of a table are split the first time one of its
+        reactions is requested and are kept for the other products, so
+        reading every reaction in the file no longer rescans it for each
+        reaction and pressure.
+    """
 
-    return _ktp_dct
+    def __init__(self, output_str):
+        """
+        :param output_str: string of lines of MESS output file
+        :type output_str: str
+        """
+        self.lines = output_str.splitlines()
+        self.pressures = ()
+        self.pressure_unit = None
+
+        # (reactant, pressure) -> (header line idx, pressure unit, col_dct)
+        self._tables = {}
+        # header line idx -> rows of the table, split into columns
+        self._rows = {}
+
+        self._index()
+
+    def _index(self):
+        """ Read the pressures and locate every table in one pass
+        """
+
+        block = None
+        read_pressures = False
+        pdep_tables = []
+        _pressures = []
+        for i, line in enumerate(self.lines):
+            if '_________________________________' in line:
+                block = None
+            elif HIGHP_BLOCK_STR in line:
+                block = 'high'
+            elif 'Pressure-Species Rate Tables:' in line:
+                block = 'pressure'
+            elif 'Temperature-Species Rate Tables:' in line:
+                block = 'temperature'
+            elif read_pressures:
+                if 'O-O' in line:
+                    read_pressures = False
+                else:
+                    _pressures.append(float(line.strip().split()[0]))
+            elif block == 'pressure':
+                if self.pressure_unit is None and 'P(' in line:
+                    self.pressure_unit = (
+                        line.strip().split('(')[1].split(')')[0])
+                    read_pressures = True
+            elif 'Reactant =' in line:
+                tmp = line.strip().split()
+                if block == 'high':
+                    self._add_table((tmp[2], 'high'), i+1, None)
+                elif block == 'temperature':
+                    pdep_tables.append(
+                        ((tmp[2], float(tmp[5])), i+2, tmp[6]))
+
+        # Key the tables on the pressures as listed in the output
+        self.pressures = tuple(_pressures) + ('high',)
+        for (reactant, mess_press), header_idx, mess_punit in pdep_tables:
+            pressure = next((press for press in _pressures
+                             if numpy.isclose(mess_press, press)), None)
+            if pressure is not None:
+                self._add_table((reactant, pressure), header_idx, mess_punit)
+
+    def _add_table(self, key, header_idx, punit):
+        """ Store the location and product columns of a table, keeping the
+            first table found for each reactant and pressure
+        """
+        if key not in self._tables:
+            col_dct = {}
+            for col, header in enumerate(self.lines[header_idx].split()):
+                col_dct.setdefault(header, col)
+            self._tables[key] = (header_idx, punit, col_dct)
+
+    def reactants(self):
+        """ The reactants with at least one table in the output
+
+            :rtype: tuple(str)
+        """
+        return tuple(dict.fromkeys(key[0] for key in self._tables))
+
+    def products(self, reactant, pressure='high'):
+        """ The products in the table for a reactant at a pressure, in the
+            order of its columns; the temperature, Loss, and Capture
+            columns are left out
+
+            :param reactant: label for the reactant used in the MESS output
+            :type reactant: str
+            :param pressure: pressure, in the output units, or 'high'
+            :type pressure: float or str
+            :rtype: tuple(str)
+        """
+        table = self._tables.get((reactant, pressure))
+        return (tuple(header for header in table[2]
+                      if header not in NON_PRODUCT_HEADERS)
+                if table is not None else ())
+
+    def ktp(self, reactant, product, filter_kts=True, tmin=None,
+            tmax=None, pmin=None, pmax=None, convert=True):
+        """ Rate constants [k(T)]s for a single reaction at all computed
+            pressures, including the high-pressure limit; returns the
+            same dictionary as ktp_dct.
 
+            Pressures in atm.
+            K(T)s in cm3/mol.s [bimol] or 1/s [unimol]
 
-def _highp_kts(out_lines, reactant, product):
-    """ Parses the MESS output file string for the rate constants [k(T)]s
-        for a single reaction at the high-pressure limit.
+            :param reactant: label for the reactant used in the MESS output
+            :type reactant: str
+            :param product: label for the product used in the MESS output
+            :type product: str
+            :rtype dict[float: (float, float)]
+        """
 
-        :param out_lines: all of the lines of MESS output
-        :type out_lines: list(str)
-        :param reactant: label for the reactant used in the MESS output
-        :type reactant: str
-        :param product: label for the product used in the MESS output
-        :type product: str
-        :return rate_constants: all high-P rate constants for the reaction
-        :rtype list(float)
-    """
-
-    # Find where the block of text where the high-pressure rates exist
-    block_str = ('High Pressure Rate Coefficients ' +
-                 '(Temperature-Species Rate Tables):')
-    for i, line in enumerate(out_lines):
-        if block_str in line:
-            block_start = i
-            for j in range(i, len(out_lines)):
-                if '_________________________________' in out_lines[j]:
-                    block_end = j
+        _ktp_dct = {}
+        for pressure in self.pressures[-1:] + self.pressures[:-1]:
+            table = self._tables.get((reactant, pressure))
+            if table is not None:
+                header_idx, mess_punit, col_dct = table
+                # Use the first column if the product is not in the table
+                kts = self._column(header_idx, col_dct.get(product, 0))
+                _ktp_dct[_convert_pressure(pressure, mess_punit)] = kts
+
+        bimol = _is_bimol(reactant)
+
+        # Note: filtering is before unit conversion, so bimolthresh is in
+        # cm^3.s^-1
+        if filter_kts:
+            _ktp_dct = filter_ktp_dct(_ktp_dct, bimol, tmin=tmin, tmax=tmax,
+                                      pmin=pmin, pmax=pmax)
+        if convert:
+            _ktp_dct = convert_units(_ktp_dct, bimol)
+
+        return _ktp_dct
+
+    def ktp_array(self, rxns=None, filter_kts=False, tmin=None, tmax=None,
+                  pmin=None, pmax=None, convert=False):
+        """ Rate constants for many reactions at once, as one dense array
+            with the pressures along the second axis and the temperatures
+            along the third; undefined rate constants ('***') and those
+            missing from the output are NaN.
+
+            Pressures in atm, with the high-pressure limit last.
+            K(T)s in cm3/mol.s [bimol] or 1/s [unimol] if converted.
+
+            :param rxns: reactions to read, as given by `reactions`;
+                all of the reactions in the output by default
+            :type rxns: tuple(((str,), (str,), (str,)))
+            :return: reactions, pressures, temperatures, rate constants
+            :rtype: (tuple, tuple(float, str), numpy.ndarray, numpy.ndarray)
+        """
+
+        if rxns is None:
+            rxns = tuple(dict.fromkeys(
+                ((rct,), (prd,), (None,))
+                for (rct, pressure), (_, _, col_dct) in self._tables.items()
+                if pressure != 'high'
+                for prd in tuple(col_dct)[1:]))
+        _pressures = self.pressures[:-1] + self.pressures[-1:]
+
+        # Gather the reactions read from each table
+        table_dct = {}
+        for rxn_idx, rxn in enumerate(rxns):
+            for press_idx, pressure in enumerate(_pressures):
+                table = self._tables.get((rxn[0][0], pressure))
+                if table is not None and rxn[1][0] in table[2]:
+                    idxs, cols = table_dct.setdefault(
+                        (table[0], press_idx), ([], []))
+                    idxs.append(rxn_idx)
+                    cols.append(table[2][rxn[1][0]])
+
+        arrs = {header_idx: self._table_array(header_idx)
+                for header_idx, _ in table_dct}
+        temps = numpy.unique(numpy.concatenate(
+            [arr[:, 0] for arr in arrs.values()] + [numpy.empty(0)]))
+
+        kts = numpy.full((len(rxns), len(_pressures), len(temps)), numpy.nan)
+        for (header_idx, press_idx), (idxs, cols) in table_dct.items():
+            arr = arrs[header_idx]
+            temp_idxs = numpy.searchsorted(temps, arr[:, 0])
+            kts[numpy.ix_(idxs, [press_idx], temp_idxs)] = (
+                arr[:, cols].T[:, None, :])
+
+        _pressures = tuple(_convert_pressure(pressure, self.pressure_unit)
+                           for pressure in _pressures)
+        bimol = tuple(_is_bimol(rxn[0][0]) for rxn in rxns)
+        if filter_kts:
+            kts = filter_ktp_array(kts, temps, _pressures, bimol,
+                                   tmin=tmin, tmax=tmax, pmin=pmin, pmax=pmax)
+        if convert:
+            kts = convert_units_array(kts, bimol)
+
+        return rxns, _pressures, temps, kts
+
+    def _table_array(self, header_idx):
+        """ The rows of a table as a float array, with NaN for the rate
+            constants that are undefined ('***')
+        """
+        rows = self._table_rows(header_idx)
+        arr = numpy.array(rows, dtype=str).reshape(len(rows), -1)
+        arr[arr == '***'] = 'nan'
+        return arr.astype(numpy.float64)
+
+    def _table_rows(self, header_idx):
+        """ The rows of a table, split into columns
+        """
+
+        rows = self._rows.get(header_idx)
+        if rows is None:
+            rows = []
+            for line in itertools.islice(self.lines, header_idx+1, None):
+                tmp = line.split()
+                if not tmp:
                     break
-            break
-    block_lines = out_lines[block_start: block_end]
+                rows.append(tmp)
+            self._rows[header_idx] = rows
 
-    # Get the high-pressure rate constants
-    rate_constants = None
-    for i, line in enumerate(block_lines):
-        # Find line with reactant name
-        # If they match desired reactant, read rates
-        # Rates start one line later in output
-        if 'Reactant =' in line:
-            mess_reac = line.strip().split()[2]
-            if mess_reac == reactant:
-                rate_constants = _parse_reactant_rate_constants(
-                    block_lines, i+1, product)
-                break
+        return rows
 
-    return rate_constants
+    def _column(self, header_idx, col):
+        """ Temperatures and the rate constants in one column of a table,
+            with None for the rate constants that are undefined ('***')
+        """
 
+        rows = self._table_rows(header_idx)
+        fin_temps = tuple(float(row[0]) for row in rows)
+        fin_kts = tuple(float(row[col]) if row[col] != '***' else None
+                        for row in rows)
 
-def _pdep_kts(out_lines, reactant, product, pressure):
-    """ Parses the MESS output file string for the rate constants [k(T,P)]s
-        for a single reaction at a given numerical pressure, P.
+        return (fin_temps, fin_kts)
 
-        :param out_lines: all of the lines of MESS output
-        :type out_lines: list(str)
-        :param reactant: reactant name in MESS output
-        :type reactant: str
-        :param product: product name in MESS output
-        :type product: str
-        :param pressure: pressure that k(T,P)s will be read for
-        :type pressure: float
-        :return rate_constants: k(T,P)s for the reaction at given pressure
-        :rtype list(float)
-    """
 
-    for i, line in enumerate(out_lines):
-        if 'Temperature-Species Rate Tables:' in line:
-            block_start = i
-            for j in range(i, len(out_lines)):
-                if '_________________________________' in out_lines[j]:
-                    block_end = j
-                    break
-            break
-    block_lines = out_lines[block_start: block_end]
-
-    # Find where the block of text where the pressure-dependent rates exist
-    pdep_dct = {}
-    for i, line in enumerate(block_lines):
-        # Find line with reactant name and pressure
-        # If they match desired reactant and pressure, read rates
-        # Rates start two lines later in output
-        if 'Reactant =' in line:
-            tmp = line.strip().split()
-            mess_reac = tmp[2]
-            mess_press, mess_punit = float(tmp[5]), tmp[6]
-            if (
-                mess_reac == reactant and
-                numpy.isclose(mess_press, pressure)
-            ):
-                atm_pressure = _convert_pressure(pressure, mess_punit)
-                pdep_dct[atm_pressure] = _parse_reactant_rate_constants(
-                    block_lines, i+2, product)
-                break
-
-    return pdep_dct
-
-
-def _parse_reactant_rate_constants(out_lines, block_start, product):
-    """ Parses specific rate constants from the correct column
-        in the MESS output file string.
+def ktp_array(output_str, rxns=None, filter_kts=False, tmin=None, tmax=None,
+              pmin=None, pmax=None, convert=False):
+    """ Parses the MESS output file string for the rate constants of many
+        reactions at once, returned as one dense array shaped
+        (reactions, pressures, temperatures), with the high-pressure limit
+        as the last pressure and NaN for undefined rate constants.
 
-        :param out_lines: all of the lines of MESS output
-        :type out_lines: list(str)
-        :param block_start: line num corresponding to reaction and pressure
-        :type block_start: int
-        :param product: label for the product used in the MESS output
-        :type product: str
-        :return rate_constants: all rate constants for the reaction
-        :rtype: list(str, float)
+        :param output_str: string of lines of MESS output file
+        :type output_str: str
+        :param rxns: reactions to read, as given by `reactions`;
+            all of the reactions in the output by default
+        :type rxns: tuple(((str,), (str,), (str,)))
+        :return: reactions, pressures, temperatures, rate constants
+        :rtype: (tuple, tuple(float, str), numpy.ndarray, numpy.ndarray)
     """
-
-    # Find the column corresponding to the reaction
-    product_col = 0
-    product_headers = out_lines[block_start].strip().split()
-    for i, product_header in enumerate(product_headers):
-        if product == product_header:
-            product_col = i
-            break
-
-    # Parse the following lines and store the constants in a list
-    temps, kts = [], []
-    for i in range(block_start+1, len(out_lines)):
-        if out_lines[i].strip() == '':
-            break
-        temps.append(out_lines[i].strip().split()[0])
-        kts.append(out_lines[i].strip().split()[product_col])
-
-    # Convert temps and rate constants to floats and combine values
-    # only do so if the rate constant is defined (i.e., not '***')
-    fin_temps = tuple(float(temp) for temp in temps)
-    fin_kts = ()
-    for kt_i in kts:
-        new_kt = float(kt_i) if kt_i != '***' else None
-        fin_kts += (new_kt,)
-
-    return (fin_temps, fin_kts)
+    return MessRateOutput(output_str).ktp_array(
+        rxns=rxns, filter_kts=filter_kts, tmin=tmin, tmax=tmax,
+        pmin=pmin, pmax=pmax, convert=convert)
 
 
 # Functions for getting k(E)s and density-of-states from
@@ -263,6 +373,8 @@ def ke_dct(output_str, reactant, product):
     """ Parses the MESS output file string for the microcanonical
         rate constants [k(E)]s for a single reaction.
 
+        To read several reactions, read all of them at once with ke_table.
+
         :param output_str: string of lines of MESS output file
         :type output_str: str
         :param reactant: label for the reactant used in the MESS output
@@ -276,24 +388,66 @@ def ke_dct(output_str, reactant, product):
     # Form string for reaction header using reactant and product name
     reaction = _reaction_header(reactant, product)
 
-    # Break up the file into lines
-    out_lines = output_str.split('\n')
-
-    # Determine col idx where reaction is
-    head = out_lines[0].replace('E, kcal/mol', 'E').replace('D, mol/kcal', 'D')
-    headers = head.split()
-    col_idx = headers.index(reaction)
-
+    # Read the table; the first energy is replaced by 0.0: 0.0
+    ke_arr = ke_table(output_str)
     _ke_dct = {0.0: 0.0}
-    for i, line in enumerate(out_lines):
-        if i not in (0, 1):
-            tmp = line.strip().split()
-            if tmp:
-                _ke_dct[float(tmp[0])] = float(tmp[col_idx])
+    _ke_dct.update(zip(ke_arr['E'][1:].tolist(),
+                       ke_arr[reaction][1:].tolist()))
 
     return _ke_dct
 
 
+def ke_table(output_str, emin=None, emax=None, chunk_size=KE_CHUNK_SIZE):
+    """ Parses the MESS output file string for the microcanonical
+        rate constants [k(E)]s of all reactions at once.
+
+        The table is returned as a structured array with a float field for
+        each column, named by its header: 'E' (kcal/mol), 'D' (mol/kcal),
+        and the reactions, e.g., 'W1->P1'. Undefined rate constants ('***')
+        are NaN.
+
+        If an energy window is given, reading stops at the first energy
+        above emax, so the rest of the table is not read.
+
+        :param output_str: string of lines of MESS output file, or the
+            bytes of the file, e.g., from ioformat.pathtools.map_file
+        :type output_str: str, bytes, or mmap.mmap
+        :param emin: lowest energy to read (kcal/mol)
+        :type emin: float
+        :param emax: highest energy to read (kcal/mol)
+        :type emax: float
+        :param chunk_size: number of lines converted to floats at a time
+        :type chunk_size: int
+        :rtype: numpy.ndarray
+    """
+    return _energy_table(output_str, title=None, emin=emin, emax=emax,
+                         chunk_size=chunk_size)
+
+
+def dos_table(ke_ped_out, emin=None, emax=None, chunk_size=KE_CHUNK_SIZE):
+    """ Parses the microcanonical pedoutput file string for the
+        rovibrational density of states of all bimolecular fragments.
+
+        The table is returned as a structured array with a float field for
+        each column, named by its header: 'E' (kcal/mol) and the fragments
+        as labeled in the output, e.g., 'P1_0'.
+
+        :param ke_ped_out: string of lines of microcanonical rates output
+            file, or the bytes of the file
+        :type ke_ped_out: str, bytes, or mmap.mmap
+        :param emin: lowest energy to read (kcal/mol)
+        :type emin: float
+        :param emax: highest energy to read (kcal/mol)
+        :type emax: float
+        :param chunk_size: number of lines converted to floats at a time
+        :type chunk_size: int
+        :rtype: numpy.ndarray
+    """
+    return _energy_table(
+        ke_ped_out, title='Bimolecular fragments density of states',
+        emin=emin, emax=emax, chunk_size=chunk_size)
+
+
 def dos_rovib(ke_ped_out, sp_labels='auto'):
     """ Read the microcanonical pedoutput file and extracts rovibrational density
         of states of each fragment as a function of the energy
@@ -315,15 +469,10 @@ def dos_rovib(ke_ped_out, sp_labels='auto'):
     if sp_labels == 'auto':
         sp_labels = 'out'*(not lbl_dct) + 'inp'*(not not lbl_dct)
 
-    ke_lines = ke_ped_out.splitlines()
-
-    i_in = apf.where_in(
-        'Bimolecular fragments density of states, mol/kcal', ke_lines)[0]+2
-    mess_labels = ke_lines[i_in-1].strip().split()[2:]
-    en_dos_all = numpy.array(
-        [line.strip().split() for line in ke_lines[i_in:]], dtype=float).T
-    energy = en_dos_all[:][0]
-    dos_all = en_dos_all[:][1:].T
+    dos_arr = dos_table(ke_ped_out)
+    mess_labels = dos_arr.dtype.names[1:]
+    energy = dos_arr['E']
+    dos_all = numpy.column_stack([dos_arr[lbl] for lbl in mess_labels])
 
     # relabel if necessary
     _labels = []
@@ -352,6 +501,81 @@ def dos_rovib(ke_ped_out, sp_labels='auto'):
     return dos_rovib_df
 
 
+def _energy_table(file_str, title=None, emin=None, emax=None,
+                  chunk_size=KE_CHUNK_SIZE):
+    """ Read a table of values as a function of energy, with a header line
+        starting with 'E, kcal/mol', into a structured array, converting
+        the lines to floats a chunk at a time.
+
+        :param title: text before the table; the first table in the file
+            is read if not given
+        :type title: str
+        :rtype: numpy.ndarray
+    """
+
+    def _enc(string):
+        return string if isinstance(file_str, str) else string.encode()
+
+    # Find the header line
+    start = 0
+    if title is not None:
+        start = file_str.find(_enc(title))
+    head_idx = file_str.find(_enc('E, kcal/mol'), max(start, 0))
+    if start < 0 or head_idx < 0:
+        return None
+    head_start = file_str.rfind(_enc('\n'), 0, head_idx) + 1
+    head_end = file_str.find(_enc('\n'), head_idx)
+    head_end = len(file_str) if head_end < 0 else head_end
+    head = file_str[head_start:head_end]
+    if not isinstance(head, str):
+        head = head.decode()
+    headers = (head.replace('E, kcal/mol', 'E')
+               .replace('D, mol/kcal', 'D').split())
+
+    # Read the lines of the table, up to a blank or non-numeric line
+    chunks, rows = [], []
+    pos = head_end + 1
+    while pos < len(file_str):
+        end = file_str.find(_enc('\n'), pos)
+        end = len(file_str) if end < 0 else end
+        tmp = file_str[pos:end].split()
+        pos = end + 1
+
+        try:
+            ene = float(tmp[0])
+        except (IndexError, ValueError):
+            break
+        if emax is not None and ene > emax:
+            break
+        if emin is None or ene >= emin:
+            rows.append(tmp)
+        if len(rows) == chunk_size:
+            chunks.append(_table_chunk(rows, len(headers)))
+            rows = []
+    chunks.append(_table_chunk(rows, len(headers)))
+    data = numpy.concatenate(chunks)
+
+    table = numpy.empty(
+        len(data), dtype=[(header, numpy.float64) for header in headers])
+    for col, header in enumerate(headers):
+        table[header] = data[:, col]
+
+    return table
+
+
+def _table_chunk(rows, ncols):
+    """ Convert split lines of a table to floats, with NaN for '***'
+    """
+    if not rows:
+        return numpy.empty((0, ncols))
+    arr = numpy.array(rows).reshape(len(rows), ncols)
+    if isinstance(rows[0][0], bytes):
+        arr[arr == b'***'] = b'nan'
+    else:
+        arr[arr == '***'] = 'nan'
+    return arr.astype(numpy.float64)
+
+
 # Functions for getting barrier heights and corresponding reactants, products
 # not tested because currently unused
 def energies(output_str):
@@ -668,43 +892,58 @@ def reactions(out_str, third_body=(None,)):
         and have the user pass it.
 
         Returns the reactions in tuple list (reacs, prods, third_body)
-        where reacs and prods are tuples
-
-        Ignores 'Capture' reactions
+        where reacs and prods are tuples, in the order they first
+        appear in the output
     """
 
-    # Split into lines
-    out_lines = out_str.splitlines()
-
-    # Grab reactions from T-dep
-    for i, line in enumerate(out_lines):
-        if 'Temperature-Species Rate Tables:' in line:
-            block_start = i
-            for j in range(i, len(out_lines)):
-                if 'Temperature-Pressure Rate Tables' in out_lines[j]:
-                    block_end = j
-            break
-    reac_lines = out_lines[block_start:block_end+1]
-
-    # Read all of the reactions out of the file
     # Reactant = <reactant>
     #
     # T(K) <prod1> <prod2> ... Loss Capture
-    rxns = ()
-    for i, line in enumerate(reac_lines):
-        if 'Reactant = ' in line and 'Pressure =' in line:
-            _reac = line.strip().split()[2]
-            _prods = reac_lines[i+2].strip().split()[1:]
-            for _prod in _prods:
-                rxns += (
-                    ((_reac,), (_prod,), third_body),
-                )
+    # Duplicates are removed by the dict, which keeps the order
+    rxns = {}
+    for _reac, headers in _reactant_headers(out_str.splitlines()):
+        for _prod in headers[1:]:
+            rxns[((_reac,), (_prod,), third_body)] = None
+
+    return tuple(rxns)
+
+
+def reactions_by_reactant(out_str, third_body=(None,)):
+    """ Read the reactions from the output file, grouped by reactant,
+        along with the column of each product in the Temperature-Species
+        rate tables of the reactant.
 
-    # Remove duplcates while preserving order
-    rxns = tuple(n for i, n in enumerate(rxns)
-                 if n not in rxns[:i])
+        The columns are those of the first table of each reactant; products
+        appearing only in a later table are added with their column there.
 
-    return rxns
+        :param out_str: string of lines of MESS output file
+        :type out_str: str
+        :rtype: dict[str: dict[((str,), (str,), (str,)): int]]
+    """
+
+    rxn_dct = {}
+    for _reac, headers in _reactant_headers(out_str.splitlines()):
+        col_dct = rxn_dct.setdefault(_reac, {})
+        for col, _prod in enumerate(headers[1:], start=1):
+            col_dct.setdefault(((_reac,), (_prod,), third_body), col)
+
+    return rxn_dct
+
+
+def _reactant_headers(out_lines):
+    """ Reactant and column headers of each table in the
+        Temperature-Species Rate Tables block, read in one pass
+
+        :param out_lines: all of the lines of MESS output
+        :type out_lines: list(str)
+        :rtype: iterator((str, list(str)))
+    """
+    in_block = False
+    for i, line in enumerate(out_lines):
+        if 'Temperature-Species Rate Tables:' in line:
+            in_block = True
+        elif in_block and 'Reactant = ' in line and 'Pressure =' in line:
+            yield line.strip().split()[2], out_lines[i+2].strip().split()
 
 
 def filter_reactions(rxns,
@@ -716,7 +955,7 @@ def filter_reactions(rxns,
     """ Filter the reactions from a ktp dictionary
     """
 
-    filt_rxns = ()
+    filt_rxns, filt_rxn_set = [], set()
     for rxn in rxns:
 
         # Move on from reaction if find any indication it should be filtered
@@ -743,13 +982,14 @@ def filter_reactions(rxns,
                 continue
 
         if filter_reverse:
-            if (prd, rct, tbody) in filt_rxns:
+            if (prd, rct, tbody) in filt_rxn_set:
                 continue
 
         # If continues not hit, reaction good to be added to new dct
-        filt_rxns += (rxn,)
+        filt_rxns.append(rxn)
+        filt_rxn_set.add(rxn)
 
-    return filt_rxns
+    return tuple(filt_rxns)
 
 
 # Helper functions
@@ -757,6 +997,10 @@ def _reaction_header(reactant, product):
     return reactant + '->' + product
 
 
+def _is_bimol(reactant):
+    return (reactant[0] == 'P') or ('+' in reactant)
+
+
 def filter_ktp_dct(_ktp_dct, bimol,
                    tmin=None, tmax=None, pmin=None, pmax=None):
     """ Filters out bad or undesired rate constants from a ktp dictionary
@@ -866,3 +1110,72 @@ def convert_units(_ktp_dct, bimol):
         conv_ktp_dct[pressure] = (temps, kts)
 
     return conv_ktp_dct
+
+
+def filter_ktp_array(kts, temps, pressures, bimol,
+                     tmin=None, tmax=None, pmin=None, pmax=None,
+                     bimolthresh=1.0e-24):
+    """ Filters out bad or undesired rate constants from an array of
+        rate constants shaped (reactions, pressures, temperatures), as read
+        by `ktp_array`, by setting them to NaN.
+
+        Applies the same rules as filter_ktp_dct to every reaction and
+        pressure at once: k(T)s that are undefined, not above zero (or
+        bimolthresh, in cm^3.s^-1, for bimolecular reactions), at or below
+        the highest temperature with a negative k(T), or outside the
+        temperature and pressure (atm) cutoffs are removed.
+
+        :param kts: rate constants
+        :type kts: numpy.ndarray
+        :param temps: temperatures of the last axis, in increasing order
+        :type temps: numpy.ndarray
+        :param pressures: pressures of the second axis
+        :type pressures: tuple(float, str)
+        :param bimol: whether or not each reaction is bimolecular
+        :type bimol: tuple(bool)
+        :rtype: numpy.ndarray
+    """
+
+    kts = numpy.array(kts, dtype=numpy.float64)
+    temps = numpy.asarray(temps, dtype=numpy.float64)
+    ntemps = len(temps)
+
+    # Nothing to filter for an output without any rate constant tables
+    if ntemps == 0:
+        return kts
+
+    # Index of the highest temperature with a negative k(T), or -1
+    neg = kts < 0.0
+    max_neg_idx = numpy.where(
+        neg.any(axis=-1), ntemps - 1 - numpy.argmax(neg[..., ::-1], axis=-1),
+        -1)[..., None]
+
+    # Above a negative k(T) the requested tmin is replaced by the next T
+    in_tmin = (numpy.ones(ntemps, dtype=bool) if tmin is None else
+               temps >= tmin)
+    valid = numpy.where(max_neg_idx >= 0,
+                        numpy.arange(ntemps) > max_neg_idx, in_tmin)
+    if tmax is not None:
+        valid &= temps <= tmax
+
+    kthresh = numpy.where(numpy.asarray(bimol, dtype=bool), bimolthresh, 0.0)
+    valid &= kts > kthresh[:, None, None]
+
+    # Remove undesired pressures (leaves 'high' untouched)
+    for press_idx, pressure in enumerate(pressures):
+        if pressure != 'high' and (
+                (pmin is not None and pressure < pmin) or
+                (pmax is not None and pressure > pmax)):
+            valid[:, press_idx, :] = False
+
+    kts[~valid] = numpy.nan
+
+    return kts
+
+
+def convert_units_array(kts, bimol):
+    """ Convert units from cm^3.s^-1 to cm^3.mol^-1.s^-1 for the bimolecular
+        reactions in an array shaped (reactions, pressures, temperatures)
+    """
+    conv = numpy.where(numpy.asarray(bimol, dtype=bool), phycon.NAVO, 1.0)
+    return numpy.asarray(kts, dtype=numpy.float64) * conv[:, None, None]
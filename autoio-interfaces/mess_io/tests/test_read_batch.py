@@ -0,0 +1,33 @@
+""" test mess_io.reader.batch_read
+"""
+
+import os
+import mess_io.reader
+
+
+PATH = os.path.dirname(os.path.realpath(__file__))
+INP_PATH = os.path.join(PATH, 'data', 'inp')
+RATE_PATH = os.path.join(INP_PATH, 'rate.out')
+MISSING_PATH = os.path.join(INP_PATH, 'missing.out')
+
+
+def test__batch_read():
+    """ test mess_io.reader.batch_read
+    """
+
+    with open(RATE_PATH, mode='r', encoding='utf-8') as fobj:
+        ref_rxns = mess_io.reader.rates.reactions(fobj.read())
+
+    file_paths = (RATE_PATH, MISSING_PATH, RATE_PATH)
+    for nprocs in (1, 2):
+        results, errors = mess_io.reader.batch_read(
+            file_paths, mess_io.reader.rates.reactions, nprocs=nprocs,
+            chunksize=1, third_body=(None,))
+
+        assert results == (ref_rxns, None, ref_rxns)
+        assert tuple(errors.keys()) == (MISSING_PATH,)
+        assert errors[MISSING_PATH].startswith('FileNotFoundError')
+
+
+if __name__ == '__main__':
+    test__batch_read()
@@ -58,6 +58,25 @@ def test_extract_hot_branching():
                        np.array([0.002120,  0.441947,  0.011999,    0.543935]),
                        atol=1e-5)
 
+def test_extract_hot_branching_multiindex():
+    """ test mess_io.read.extract_hot_branching with multiindex output
+    """
+    hotspecies_en = {'CH3CH2CH2': 3.19, 'CH3CHCH3': 0.0}
+    species_lst = ('CH3CH2CH2', 'CH3CHCH3', 'C2H4+CH3', 'CH3CHCH2+H')
+    hoten_branch_dct = mess_io.reader.hoten.extract_hot_branching(
+        HOT_LOG_DBL, hotspecies_en, species_lst)
+    hoten_mi_dct = mess_io.reader.hoten.extract_hot_branching(
+        HOT_LOG_DBL, hotspecies_en, species_lst, multiindex=True)
+    hoten = hoten_mi_dct['CH3CHCH3']
+
+    assert list(hoten.index.names) == ['pressure', 'temperature', 'energy']
+    assert list(hoten.columns) == list(species_lst)
+    assert np.allclose(hoten.loc[(100, 1800)].values,
+                       hoten_branch_dct['CH3CHCH3'][100][1800].values)
+    assert np.allclose(hoten.loc[(100, 1800, 91.4)].values,
+                       np.array([0.002120,  0.441947,  0.011999,    0.543935]),
+                       atol=1e-5)
+
 def test_extract_fne():
 
     dct_bf_tp_df = mess_io.reader.hoten.extract_fne(HOT_LOG_SGL)
@@ -75,4 +94,5 @@ def test_extract_fne():
 if __name__ == '__main__':
     test_get_hot_species()
     test_extract_hot_branching()
+    test_extract_hot_branching_multiindex()
     test_extract_fne()
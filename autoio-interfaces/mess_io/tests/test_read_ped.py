@@ -79,6 +79,34 @@ def test_ped_get_ped():
         atol=1e-3, rtol=1e-3)
 
 
+def test_ped_arrays():
+    """ test mess_io.reader.ped.ped_arrays
+    """
+    pedspecies2 = (('C3H8+H', 'CH3CH2CH2+H2'), ('C3H8+H', 'CH3CHCH3+H2'))
+    energy_dct2 = {'W0': 0.0, 'C3H8+H': 0.0, 'CH3CH2CH2+H2': -3.53, 'CH3CHCH3+H2': -6.58,
+                   'B0': 0.0, 'B1': 10.19, 'B2': 7.67}
+    ped_arr_dct = mess_io.reader.ped.ped_arrays(
+        PED_OUT_DBL, pedspecies2, energy_dct2)
+    ped_dct2 = mess_io.reader.ped.get_ped(
+        PED_OUT_DBL, pedspecies2, energy_dct2)
+
+    label = (('C3H8+H',), ('CH3CH2CH2+H2',), (None,))
+    conds, energy, prob_arr = ped_arr_dct[label]
+    assert prob_arr.shape == (len(conds), len(energy))
+    assert np.all(np.diff(energy) > 0)
+
+    # each row is the distribution in the dataframe of get_ped
+    row = prob_arr[conds.index((1., 500.))]
+    valid = ~np.isnan(row)
+    assert np.isclose(energy[valid][1], 3.685142, atol=1e-3, rtol=1e-3)
+    assert np.allclose(energy[valid], ped_dct2[label][1][500].index)
+    assert np.allclose(row[valid], ped_dct2[label][1][500].values)
+    assert np.isclose(
+        np.sum(np.diff(energy[valid]) * (row[valid][1:] + row[valid][:-1]))/2,
+        1.)
+
+
 if __name__ == '__main__':
     test_ped_names()
     test_ped_get_ped()
+    test_ped_arrays()
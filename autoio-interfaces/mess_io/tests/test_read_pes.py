@@ -14,11 +14,18 @@ INP_PATH = os.path.join(PATH, 'data', 'inp')
 INP_STR = pathtools.read_file(INP_PATH, 'mess.inp')
 
 PROMPT_INP_PATH = os.path.join(PATH, 'data', 'inp')
-PED_INP_STR = pathtools.read_file(PROMPT_INP_PATH, 'me_ktp_ped.inp')
-PED_INP_STR = remove_comment_lines(
-    PED_INP_STR, delim_pattern=app.escape('!'))
-PED_INP_STR = remove_comment_lines(
-    PED_INP_STR, delim_pattern=app.escape('#'))
+
+
+def _ped_inp_str():
+    """ PED input string, with comments removed; read when a test needs it
+        so that the other tests do not depend on the file
+    """
+    ped_inp_str = pathtools.read_file(PROMPT_INP_PATH, 'me_ktp_ped.inp')
+    ped_inp_str = remove_comment_lines(
+        ped_inp_str, delim_pattern=app.escape('!'))
+    ped_inp_str = remove_comment_lines(
+        ped_inp_str, delim_pattern=app.escape('#'))
+    return ped_inp_str
 
 
 def test_pes():
@@ -77,11 +84,70 @@ def test_pes():
     assert conn_lst2 == ref_conn_lst2
 
 
+def test_pes_graph():
+    """ test mess_io.reader.pes_graph
+    """
+
+    pes_gra = mess_io.reader.pes_graph(INP_STR, read_fake=True)
+
+    ref_energy_dct = {
+        'F1': -1.0,
+        'F2': 2.22,
+        'P1': 0.0,
+        'P2': 3.22,
+        'FRB1': 0.0,
+        'FPB1': 3.22,
+        'B1': 13.23
+    }
+    ref_conn_lst = (
+        ('P1', 'FRB1'),
+        ('FRB1', 'F1'),
+        ('P2', 'FPB1'),
+        ('FPB1', 'F2'),
+        ('F1', 'B1'),
+        ('B1', 'F2')
+    )
+    ref_conn_lst_dct = {
+        'FRB1': ('P1', 'F1'),
+        'FPB1': ('P2', 'F2'),
+        'B1': ('F1', 'F2')
+    }
+    ref_pes_label_dct = {
+        'F1': 'F1',
+        'F2': 'F2',
+        'C + [H]': 'P1',
+        '[CH3] + [HH]': 'P2'
+    }
+
+    assert set(pes_gra.energy_dct.keys()) == set(ref_energy_dct.keys())
+    for key, ref_ene in ref_energy_dct.items():
+        assert numpy.isclose(pes_gra.energy_dct[key], ref_ene)
+    assert pes_gra.conn_lst == ref_conn_lst
+    assert pes_gra.conn_lst_dct == ref_conn_lst_dct
+    assert pes_gra.pes_label_dct == ref_pes_label_dct
+
+    # Without the fake wells, only the real barrier is kept
+    pes_gra2 = mess_io.reader.pes_graph(INP_STR, read_fake=False)
+    assert pes_gra2.conn_lst_dct == {'B1': ('P1', 'P2')}
+    assert pes_gra2.pes_label_dct == {'C + [H]': 'P1', '[CH3] + [HH]': 'P2'}
+    assert pes_gra2.find_barrier('P1', 'P2') == 'B1'
+
+    assert pes_gra.find_barrier('F1', 'F2') == 'B1'
+    assert pes_gra.find_barrier('F2', 'F1') == 'B1'
+    assert pes_gra.find_barrier('P1', 'P2') is None
+    assert mess_io.reader.find_barrier(pes_gra, 'F2', 'P2') == 'FPB1'
+
+    assert set(pes_gra.neighbors('F1')) == {'P1', 'F2'}
+    assert pes_gra.neighbors('B1') == ()
+    assert pes_gra.connected('P2', 'F2')
+    assert not pes_gra.connected('P1', 'F2')
+
+
 def test_get_species():
     """ test mess_io.reader.get_species
     """
 
-    species_blocks_ped = mess_io.reader.get_species(PED_INP_STR)
+    species_blocks_ped = mess_io.reader.get_species(_ped_inp_str())
     assert list(species_blocks_ped.keys()) == ['W0', 'RH', 'NC3H7', 'IC3H7']
     assert [len(i) for i in species_blocks_ped.values()] == [1, 2, 2, 2]
 
@@ -108,13 +174,15 @@ def test_dct_species_fragments():
     """ test mess_io.reader.dct_species_fragments
     """
 
-    species_blocks_ped = mess_io.reader.get_species(PED_INP_STR)
+    species_blocks_ped = mess_io.reader.get_species(_ped_inp_str())
     dct_sp_fr = mess_io.reader.dct_species_fragments(species_blocks_ped)
     assert dct_sp_fr == {'W0': ('W0',), 'RH': ('C3H8', 'H',), 'NC3H7': (
         'CH3CH2CH2', 'H2'), 'IC3H7': ('CH3CHCH3', 'H2')}
 
 
 if __name__ == '__main__':
+    test_pes()
+    test_pes_graph()
     test_get_species()
     test_dct_species_fragments()
     test_find_barrier()
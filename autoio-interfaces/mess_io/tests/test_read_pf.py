@@ -177,3 +177,31 @@ def test__thermo():
     for temp in sorted(list(s_dct.keys())):
         assert numpy.allclose(s_dct[temp], ref_s_dct[temp])
         assert numpy.allclose(cp_dct[temp], ref_cp_dct[temp])
+
+
+def test__pf_table():
+    """ test mess_io.reader.pfs.read_pf_table
+    """
+
+    pf_table = mess_io.reader.pfs.read_pf_table(OUT_STR)
+    assert pf_table.dtype.names == (
+        'T', 'logQ', 'dlogQ_dT', 'd2logQ_dT2', 'S', 'Cp')
+    assert pf_table.shape == (31,)
+    assert numpy.allclose(
+        tuple(pf_table[-1]),
+        (298.2, 63.7335, 0.0123569, -2.32761e-05, 133.973, 10.5319))
+
+    # Tables of outputs without the thermo columns
+    pf_table2 = mess_io.reader.pfs.read_pf_table(
+        pathtools.read_file(OUT_PATH, 'pf.dat2'))
+    assert numpy.allclose(pf_table2['logQ'], pf_table['logQ'])
+    assert numpy.all(numpy.isnan(pf_table2['S']))
+
+    # Cached tables are reused and cannot be modified
+    mess_io.reader.pfs.clear_pf_table_cache()
+    pf_table3 = mess_io.reader.pfs.read_pf_table(OUT_STR, cache=True)
+    assert mess_io.reader.pfs.read_pf_table(OUT_STR, cache=True) is pf_table3
+    assert not pf_table3.flags.writeable
+    assert (mess_io.reader.pfs.entropy(OUT_STR, cache=True) ==
+            mess_io.reader.pfs.entropy(OUT_STR))
+    mess_io.reader.pfs.clear_pf_table_cache()
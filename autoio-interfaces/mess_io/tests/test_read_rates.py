@@ -15,6 +15,7 @@ INP_PATH_DBL = os.path.join(PATH, 'data', 'prompt', 'C3H8_H')
 
 KTP_INP_STR = pathtools.read_file(INP_PATH, 'example.inp')
 KTP_OUT_STR = pathtools.read_file(OUT_PATH, 'rate.out')
+KTP_OUT_RCT_STR = pathtools.read_file(INP_PATH, 'rate.out')
 KTP_OUT_BAR_STR = pathtools.read_file(OUT_PATH, 'rate.out_bar')
 KTP_OUT_TORR_STR = pathtools.read_file(OUT_PATH, 'rate.out_torr')
 KE_OUT_STR = pathtools.read_file(OUT_PATH, 'ke.out')
@@ -121,6 +122,119 @@ def test__ktp_dct():
     assert numpy.allclose(ref_ktp_dct[1.0], tktorr)
 
 
+def test__rate_output():
+    """ test mess_io.reader.rates.MessRateOutput
+    """
+
+    ref_ktp_dct = {
+        'high': (
+            (500.0, 800.0, 1000.0, 1300.0, 1500.0, 1800.0, 2000.0, 2300.0),
+            (4.15e-05, 184.0, 3.38e+04, 4.46e+06,
+             4.02e+07, 4.46e+08, 1.5e+09, 6.34e+09)),
+        1.0: (
+            (500.0, 800.0, 1000.0, 1300.0, 1500.0, 1800.0, 2000.0, 2300.0),
+            (4.12e-05, 154.0, 1.74e+04, 4.38e+05,
+             1.01e+06, 3.44e+06, 1.08e+07, 4.67e+07))
+    }
+
+    rate_out = mess_io.reader.rates.MessRateOutput(KTP_OUT_RCT_STR)
+    assert rate_out.pressures == (1.0, 'high')
+    assert rate_out.pressure_unit == 'atm'
+    assert rate_out.reactants() == (
+        'C5H4CH3', 'C5H5CH2-1', 'C5H5CH2', 'C5H5CH2-2', 'W5', 'W6',
+        'FULVENE+H', 'C6H6+H')
+    assert rate_out.products('W5', 1.0) == (
+        'C5H4CH3', 'C5H5CH2-1', 'C5H5CH2', 'C5H5CH2-2', 'W6',
+        'FULVENE+H', 'C6H6+H')
+    assert rate_out.products('W5', 0.5) == ()
+
+    ktp_dct = rate_out.ktp('C5H4CH3', 'C5H5CH2-1')
+    assert tuple(ktp_dct.keys()) == ('high', 1.0)
+    for pressure, tk_arr in ktp_dct.items():
+        assert numpy.allclose(tk_arr, ref_ktp_dct[pressure])
+
+    # Reference rate constants for other reactions, read before the
+    # output was indexed
+    temps = (500.0, 800.0, 1000.0, 1300.0, 1500.0, 1800.0, 2000.0, 2300.0)
+    ref_rxn_ktp_dct = {
+        ('W5', 'W6'): {
+            'high': (3.49e+05, 3.59e+08, 3.68e+09, 3.17e+10,
+                     8.28e+10, 2.35e+11, 3.95e+11, 7.29e+11),
+            1.0: (1.68e+05, 2.74e+06, 7.45e+06, 3.66e+07,
+                  1.13e+08, 5.47e+08, 1.10e+09, 2.22e+09)},
+        ('C5H5CH2', 'W5'): {
+            'high': (1.29e+09, 1.72e+10, 4.23e+10, 1.00e+11,
+                     1.50e+11, 2.34e+11, 2.94e+11, 3.89e+11),
+            1.0: (1.14e+08, 2.50e+08, 5.36e+08, 1.30e+09,
+                  1.96e+09, 2.72e+09, 3.49e+09, 4.08e+09)},
+        ('FULVENE+H', 'C6H6+H'): {
+            1.0: (2.8604975e+11, 6.323205e+12, 2.4449726e+13, 6.564089e+13,
+                  8.129835e+13, 8.491161e+13, 8.069614e+13, 7.166299e+13)},
+        ('W6', 'FULVENE+H'): {
+            1.0: (8.23e-14, 5.15e-05, 0.0275, 2.34,
+                  10.5, 64.1, 313.0, 2020.0)},
+    }
+    for (rct, prd), ref_kts_dct in ref_rxn_ktp_dct.items():
+        ktp_dct = rate_out.ktp(rct, prd)
+        assert tuple(ktp_dct.keys()) == tuple(ref_kts_dct.keys())
+        for pressure, (tk_temps, tk_kts) in ktp_dct.items():
+            assert numpy.allclose(tk_temps, temps)
+            assert numpy.allclose(tk_kts, ref_kts_dct[pressure])
+
+
+def test__ktp_array():
+    """ test mess_io.reader.rates.ktp_array
+        test mess_io.reader.rates.filter_ktp_array
+    """
+
+    rxns, pressures, temps, kts = mess_io.reader.rates.ktp_array(
+        KTP_OUT_RCT_STR)
+    assert kts.shape == (len(rxns), 2, 8)
+    assert pressures == (1.0, 'high')
+    assert numpy.allclose(
+        temps, (500.0, 800.0, 1000.0, 1300.0, 1500.0, 1800.0, 2000.0, 2300.0))
+
+    rxn_idx = rxns.index((('C5H4CH3',), ('C5H5CH2-1',), (None,)))
+    ktp_dct = mess_io.reader.rates.ktp_dct(
+        KTP_OUT_RCT_STR, 'C5H4CH3', 'C5H5CH2-1')
+    assert numpy.allclose(kts[rxn_idx, 0], ktp_dct[1.0][1])
+    assert numpy.allclose(kts[rxn_idx, 1], ktp_dct['high'][1])
+
+    # Undefined rate constants are NaN
+    rxn_idx = rxns.index((('C5H4CH3',), ('W5',), (None,)))
+    assert numpy.isnan(kts[rxn_idx, 1]).all()
+
+    # Outputs without rate constant tables give empty arrays
+    for out_str in (KTP_OUT_BAR_STR, KTP_OUT_TORR_STR):
+        _, _, temps, kts = mess_io.reader.rates.ktp_array(
+            out_str, filter_kts=True)
+        assert temps.shape == (0,)
+        assert kts.shape[-1] == 0
+
+    # Filter an array built from the test dictionary as filter_ktp_dct does
+    temps = numpy.array(KTP_DCT1[0.01][0])
+    pressures = tuple(KTP_DCT1.keys())
+    kts = numpy.array(
+        [[[numpy.nan if k is None else k for k in kts_]
+          for _, kts_ in KTP_DCT1.values()]], dtype=float)
+
+    for kwargs in ({}, {'tmin': 400.0, 'tmax': 800.0},
+                   {'pmin': 0.1, 'pmax': 10}):
+        filt_kts = mess_io.reader.rates.filter_ktp_array(
+            kts, temps, pressures, (False,), **kwargs)
+        filt_ktp_dct = mess_io.reader.rates.filter_ktp_dct(
+            KTP_DCT1, bimol=False, **kwargs)
+        for press_idx, pressure in enumerate(pressures):
+            valid = ~numpy.isnan(filt_kts[0, press_idx])
+            if pressure in filt_ktp_dct:
+                assert numpy.allclose(
+                    temps[valid], filt_ktp_dct[pressure][0])
+                assert numpy.allclose(
+                    filt_kts[0, press_idx, valid], filt_ktp_dct[pressure][1])
+            else:
+                assert not valid.any()
+
+
 def test__ke_dct():
     """ test mess_io.reader.rates.ke_dct
     """
@@ -156,6 +270,33 @@ def test__ke_dct():
         assert numpy.isclose(ratek, ref_ke_dct[ene])
 
 
+def test__ke_table():
+    """ test mess_io.reader.rates.ke_table
+        test mess_io.reader.rates.dos_table
+    """
+
+    ke_arr = mess_io.reader.rates.ke_table(KE_OUT_STR)
+    assert ke_arr.dtype.names == ('E', 'D', 'W1->W3', 'W1->P1')
+    assert ke_arr.shape == (61,)
+    assert numpy.isnan(ke_arr['W1->W3'][0])
+    assert numpy.isclose(ke_arr['W1->W3'][-1], 50.4699)
+
+    # Read only an energy window
+    ke_arr = mess_io.reader.rates.ke_table(
+        KE_OUT_STR, emin=1.0, emax=2.0, chunk_size=2)
+    assert numpy.allclose(ke_arr['E'], (1.0, 1.2, 1.4, 1.6, 1.8, 2.0))
+    assert numpy.allclose(ke_arr['W1->W3'][0], 4.53e-12)
+
+    # The table is after the names translation in this file
+    ke_arr = mess_io.reader.rates.ke_table(KE_PED_OUT_DBL)
+    assert ke_arr.dtype.names == ('E', 'D', 'W0->P0', 'W0->P1', 'W0->P2')
+
+    dos_arr = mess_io.reader.rates.dos_table(KE_PED_OUT_DBL, emax=0.4)
+    assert dos_arr.dtype.names == ('E', 'P1_0', 'P1_1', 'P2_0', 'P2_1')
+    assert numpy.allclose(dos_arr['E'], (0.0, 0.2, 0.4))
+    assert numpy.isclose(dos_arr['P2_0'][-1], 7.682720e+04)
+
+
 def test__tp():
     """ test mess_io.reader.rates.pressures
         test mess_io.reader.rates.temperatures
@@ -290,6 +431,28 @@ def test__rxns_labels():
         KTP_OUT_STR, read_rev=True)
 
 
+def test__rxns_by_reactant():
+    """ test mess_io.reader.rates.reactions_by_reactant
+    """
+
+    rxns = mess_io.reader.rates.reactions(KTP_OUT_RCT_STR)
+    rxn_dct = mess_io.reader.rates.reactions_by_reactant(KTP_OUT_RCT_STR)
+
+    assert tuple(rxn_dct.keys()) == (
+        'C5H4CH3', 'C5H5CH2-1', 'C5H5CH2', 'C5H5CH2-2', 'W5', 'W6',
+        'FULVENE+H', 'C6H6+H')
+    assert tuple(rxn for col_dct in rxn_dct.values()
+                 for rxn in col_dct) == rxns
+    assert rxn_dct['W5'][(('W5',), ('C5H4CH3',), (None,))] == 1
+    assert rxn_dct['W5'][(('W5',), ('W6',), (None,))] == 5
+    assert rxn_dct['W5'][(('W5',), ('Capture',), (None,))] == 9
+
+    filt_rxns = mess_io.reader.rates.filter_reactions(rxns)
+    assert len(filt_rxns) == len(set(filt_rxns)) == 28
+    assert filt_rxns[0] == (('C5H4CH3',), ('C5H5CH2-1',), (None,))
+    assert (('C5H5CH2-1',), ('C5H4CH3',), (None,)) not in filt_rxns
+
+
 def test__filter_ktp():
     """ test mess_io.reader.rates.filter_ktp_dct
     """
@@ -397,7 +560,11 @@ def test__dos_rovib():
 
 if __name__ == '__main__':
     test__ktp_dct()
+    test__rate_output()
+    test__ktp_array()
+    test__rxns_by_reactant()
     test__ke_dct()
+    test__ke_table()
     test__tp()
     test__rxns_labels()
     test__filter_ktp()
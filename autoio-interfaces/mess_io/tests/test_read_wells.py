@@ -31,6 +31,29 @@ def test__merge():
         ('W1', 'W2', 'W4', 'W5', 'W3'),)
 
 
+def test__merged_well_table():
+    """ test mess_io.reader._wells.MergedWellTable
+    """
+
+    well_table = mess_io.reader.MergedWellTable(AUX_STR)
+
+    conds = well_table.conditions()
+    assert len(conds) == 65
+    assert conds[:3] == ((0.01, 600.0), (0.1, 600.0), (1.0, 600.0))
+
+    # The pressures in bar in the file are found from those in atm
+    assert well_table.merged_wells(0.01, 600.0) == (
+        ('W1', 'W3', 'W5', 'W6'),)
+    assert well_table.merged_wells(10.0, 600) == (('W1', 'W5'),)
+    assert well_table.merged_wells(100.0, 3000.0) == (
+        ('W1', 'W2', 'W5', 'W4', 'W3'),)
+    assert well_table.merged_wells(PRESSURE, TEMP2) == (
+        ('W1', 'W3', 'W5', 'W6'),)
+    assert well_table.merged_wells(3.0, TEMP2) is None
+    assert well_table.merged_wells(0.9, 650.0, nearest=True) == (
+        ('W1', 'W5'), ('W2', 'W6'))
+
+
 def test__energies():
     """ test mess_io.reader._wells.well_average_energy
     """
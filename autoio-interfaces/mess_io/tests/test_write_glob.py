@@ -2,6 +2,7 @@
 """
 
 import os
+import io
 import numpy
 import pandas
 from ioformat import pathtools
@@ -182,6 +183,33 @@ def test__full_str():
     assert rates_str == pathtools.read_file(INP_PATH, 'full_rates.inp')
     assert pf_str == pathtools.read_file(INP_PATH, 'full_pf.inp')
 
+    # Stream the inputs, with the channels and species given as blocks
+    rates_chunks = []
+    mess_io.writer.messrates_inp_str(
+        glob_keys_str, glob_etrans_str, rxn_chan_str, out=rates_chunks)
+    assert ''.join(rates_chunks) == rates_str
+
+    rxn_chan_strs = ('<FAKE SPECIES STR>  ', '<FAKE BARRIER STR>\n')
+    rates2_str = mess_io.writer.messrates_inp_str(
+        glob_keys_str, rxn_chan_strs, energy_trans_str=glob_etrans_str)
+    rates2_io = io.StringIO()
+    mess_io.writer.messrates_inp_str(
+        glob_keys_str, iter(rxn_chan_strs), energy_trans_str=glob_etrans_str,
+        out=rates2_io)
+    assert rates2_io.getvalue() == rates2_str
+    assert '<FAKE SPECIES STR>\n<FAKE BARRIER STR>\nEnd' in rates2_str
+
+    pf_chunks = []
+    mess_io.writer.messpf_inp_str(
+        glob_keys_str, '<FAKE PF CHANNEL STR>', out=pf_chunks)
+    assert ''.join(pf_chunks) == pf_str
+
+    pf2_chunks = []
+    mess_io.writer.messpf_inp_str(
+        glob_keys_str, ('<FAKE PF CHANNEL STR>',) * 2, out=pf2_chunks)
+    assert ''.join(pf2_chunks) == mess_io.writer.messpf_inp_str(
+        glob_keys_str, '<FAKE PF CHANNEL STR>\n<FAKE PF CHANNEL STR>')
+
 
 def test__pf_output():
     """ test mess_io.writer.pf_output
@@ -210,6 +210,11 @@ def test__core_multirotor_writer():
     assert mdhr_dat_4dfr_str == pathtools.read_file(
         INP_PATH, 'mdhr_dat_4dfr.inp')
 
+    mdhr_dat_chunks = []
+    mess_io.writer.mdhr_data(
+        FOURDPOT, freqs=FOURDFREQ, nrot=3, out=mdhr_dat_chunks)
+    assert ''.join(mdhr_dat_chunks) == mdhr_dat_4dfr_str
+
     # MultiRotor Core Sections
     core_multirot1_str = mess_io.writer.core_multirotor(
         GEO1, SYM_FACTOR1, POT_SURF_FILE, rotor_int1_str)
@@ -107,3 +107,8 @@ def test__dat():
 
     assert mc_dat1_str == pathtools.read_file(INP_PATH, 'mc_dat1.inp')
     assert mc_dat2_str == pathtools.read_file(INP_PATH, 'mc_dat2.inp')
+
+    # Stream the points to a list of chunks
+    mc_dat_chunks = []
+    mess_io.writer.monte_carlo_data(GEOS, ENES, out=mc_dat_chunks)
+    assert ''.join(mc_dat_chunks) == mc_dat1_str
@@ -4,6 +4,7 @@ Writes the full sections of a MESS input file
 
 import os
 from ioformat import build_mako_str
+from ioformat import ChunkWriter
 from ioformat import indent
 from ioformat import remove_trail_whitespace
 from phydat import phycon
@@ -22,31 +23,88 @@ SECTION_PATH = os.path.join(TEMPLATE_PATH, 'sections')
 # Write the full input file strings
 def messrates_inp_str(globkey_str, rxn_chan_str,
                       energy_trans_str=None, well_lump_str=None,
-                      use_short_names=False):
+                      use_short_names=False, out=None):
     """ Combine various MESS strings together to combined MESS rates
+
+        The reaction channels can be given as one string or as a sequence
+        of strings for the species, wells, and barriers, which are written
+        on separate lines; a generator of them is only run as the input
+        is written.
+
+        If an output is given, the input is written to it as the template
+        is filled, and nothing is returned. The full input is then never
+        built as one string, but each section string is written as given.
+
+        :param globkey_str: global keywords section
+        :type globkey_str: str
+        :param rxn_chan_str: reaction channels section
+        :type rxn_chan_str: str or iterable(str)
+        :param energy_trans_str: energy transfer section
+        :type energy_trans_str: str
+        :param well_lump_str: well lumping section
+        :type well_lump_str: str
+        :param use_short_names: add the UseShortNames keyword
+        :type use_short_names: bool
+        :param out: file handle or list of chunks to write the string to
+        :type out: file object or list(str)
+        :rtype: str
     """
 
+    if isinstance(rxn_chan_str, str):
+        rxn_chan_str = (rxn_chan_str,)
+
     # Create dictionary to fill template
     full_rxn_inp_keys = {
         'globkey_str': globkey_str,
         'energy_trans_str': energy_trans_str,
         'well_lump_str': well_lump_str,
-        'rxn_chan_str': rxn_chan_str,
+        'rxn_chan_strs': rxn_chan_str,
         'use_short_names': use_short_names
     }
 
     mess_inp_str = build_mako_str(
         template_file_name='full_rates_inp.mako',
         template_src_path=SECTION_PATH,
-        template_keys=full_rxn_inp_keys)
+        template_keys=full_rxn_inp_keys,
+        out=out)
 
-    return remove_trail_whitespace(mess_inp_str)
+    if mess_inp_str is not None:
+        mess_inp_str = remove_trail_whitespace(mess_inp_str)
 
+    return mess_inp_str
 
-def messpf_inp_str(globkey_str, spc_str):
+
+def messpf_inp_str(globkey_str, spc_str, out=None):
     """ Combine various MESS strings together to combined MESSPF
+
+        The species can be given as one string or as a sequence of strings,
+        one for each species, which are written on separate lines.
+
+        If an output is given, the input is written to it one section at a
+        time and nothing is returned.
+
+        :param globkey_str: global keywords section
+        :type globkey_str: str
+        :param spc_str: species section
+        :type spc_str: str or iterable(str)
+        :param out: file handle or list of chunks to write the string to
+        :type out: file object or list(str)
+        :rtype: str
     """
-    return '\n'.join([globkey_str, spc_str]) + '\n'
+
+    if isinstance(spc_str, str):
+        spc_str = (spc_str,)
+
+    if out is None:
+        return '\n'.join([globkey_str, *spc_str]) + '\n'
+
+    wrt = ChunkWriter(out)
+    wrt.write(globkey_str)
+    for spc_blk_str in spc_str:
+        wrt.write('\n' + spc_blk_str)
+    wrt.write('\n')
+
+    return None
 
 
 def messhr_inp_str(geo, hind_rot_str,
@@ -5,6 +5,7 @@ Writes MESS input for a molecule
 import os
 import automol.pot
 from ioformat import build_mako_str
+from ioformat import ChunkWriter
 from ioformat import indent
 from mess_io.writer import _format as messformat
 
@@ -314,20 +315,30 @@ def rotor_internal(group, axis, symmetry, grid_size, mass_exp_size,
         template_keys=rotor_keys)
 
 
-def mdhr_data(pots, freqs=None, nrot=0):
+def mdhr_data(pots, freqs=None, nrot=0, out=None):
     """ Writes the string for an auxiliary data file for MESS containing
         potentials and vibrational frequencies of a
         multidimensional hindered rotor, up to four dimensions.
 
+        If an output is given, each line of the grid is written to it as
+        it is formatted, and nothing is returned.
+
         :param pots: potential values along torsional modes of rotor
         :type pots: list(list(float))
         :param freqs: vibrational frequenciess along torsional modes of rotor
         :type freqs: list(list(float))
+        :param out: file handle or list of chunks to write the string to
+        :type out: file object or list(str)
         :rtype: str
     """
 
     assert pots, 'Potential has no values'
 
+    if out is None:
+        dat_chunks = []
+        mdhr_data(pots, freqs=freqs, nrot=nrot, out=dat_chunks)
+        return ''.join(dat_chunks)
+
     # Remap potential so that keys are indices, not vcoord valyes
     pots_byidx = automol.pot.by_index(pots)
     pot_idxs = tuple(pots_byidx.keys())
@@ -376,27 +387,26 @@ def mdhr_data(pots, freqs=None, nrot=0):
         head_str += '\n'
 
     # Build the lines for each point on the potential
-    dat_str = num_str + freq_str + head_str
+    wrt = ChunkWriter(out)
+    wrt.write(num_str + freq_str + head_str)
     for idxs, val in pots_byidx.items():
 
         if val is not None:
 
             # Add the idxs for the rotors
-            for idx in idxs:
-                dat_str += f'{idx+1:>6d}'
+            line = ''.join(f'{idx+1:>6d}' for idx in idxs)
 
             # Add the potential value
-            dat_str += f'{val:>15f}'
+            line += f'{val:>15f}'
 
             # Add any frequencies if necessary
             if freqs is not None:
                 if idxs in freqs:
-                    for freq in freqs[idxs]:
-                        dat_str += f'{freq:>8.1f}'
+                    line += ''.join(f'{freq:>8.1f}' for freq in freqs[idxs])
 
-            dat_str += '\n'
+            wrt.write(line + '\n')
 
-    return dat_str
+    return None
 
 
 def umbrella_mode(group, plane, ref_atom, potential,
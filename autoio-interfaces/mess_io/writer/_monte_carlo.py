@@ -7,7 +7,7 @@ from phydat import phycon
 import automol.geom
 import automol.util.mat
 from ioformat import build_mako_str
-from ioformat import remove_trail_whitespace
+from ioformat import ChunkWriter
 from ioformat import indent
 from mess_io.writer import _format as messformat
 
@@ -96,12 +96,15 @@ def monte_carlo_species(geo, sym_factor, elec_levels,
         template_keys=monte_carlo_keys)
 
 
-def monte_carlo_data(geos, enes, grads=(), hessians=()):
+def monte_carlo_data(geos, enes, grads=(), hessians=(), out=None):
     """ Writes the string for an auxliary data file required for
         Monte Carlo calculations in MESS that contains the
         geoetries, energies, gradients, and Hessians obtained
         from Monte Carlo sampling of the fluxional modes.
 
+        If an output is given, each sampling point is written to it as
+        it is formatted, and nothing is returned.
+
         :param geos: geometries from sampling
         :type geos: list
         :param enes: energies from energies
@@ -110,6 +113,8 @@ def monte_carlo_data(geos, enes, grads=(), hessians=()):
         :type grads: list
         :param hessians: Hessians from sampling
         :type hessians: list
+        :param out: file handle or list of chunks to write the string to
+        :type out: file object or list(str)
         :rtype: str
     """
 
@@ -119,32 +124,37 @@ def monte_carlo_data(geos, enes, grads=(), hessians=()):
         assert grads and hessians
         assert len(geos) == len(enes) == len(grads) == len(hessians)
 
-    dat_str = ''
-    for idx, _ in enumerate(geos):
-        dat_str += 'Sampling point' + str(idx+1) + '\n'
-        dat_str += 'Energy' + '\n'
-        dat_str += f'{enes[idx]:.8f}\n'
-        dat_str += 'Geometry' + '\n'
-        dat_str += messformat.mc_geometry_format(geos[idx]) + '\n'
-        if grads:
-            grad_str = automol.util.mat.string(
-                grads[idx], val_format='{0:>16.12f}')
-            dat_str += 'Gradient'+'\n'
-            dat_str += grad_str + '\n'
-        if hessians:
-            hess_str = automol.util.mat.string(
-                hessians[idx], val_format='{0:>16.12f}')
-            dat_str += 'Hessian'+'\n'
-            dat_str += hess_str+'\n'
-
-        dat_str += '\n'
+    if out is None:
+        dat_chunks = []
+        monte_carlo_data(geos, enes, grads=grads, hessians=hessians,
+                         out=dat_chunks)
+        return ''.join(dat_chunks)
 
     # Format string as needed
-    if not grads and not hessians:
-        dat_str = remove_trail_whitespace(dat_str)
-    dat_str = '\n' + dat_str
-
-    return dat_str
+    ChunkWriter(out).write('\n')
+    with ChunkWriter(out, remove_whitespace=not grads and not hessians) as wrt:
+        for idx, _ in enumerate(geos):
+            pt_str = (
+                'Sampling point' + str(idx+1) + '\n' +
+                'Energy' + '\n' +
+                f'{enes[idx]:.8f}\n' +
+                'Geometry' + '\n' +
+                messformat.mc_geometry_format(geos[idx]) + '\n'
+            )
+            if grads:
+                grad_str = automol.util.mat.string(
+                    grads[idx], val_format='{0:>16.12f}')
+                pt_str += 'Gradient'+'\n'
+                pt_str += grad_str + '\n'
+            if hessians:
+                hess_str = automol.util.mat.string(
+                    hessians[idx], val_format='{0:>16.12f}')
+                pt_str += 'Hessian'+'\n'
+                pt_str += hess_str+'\n'
+
+            wrt.write(pt_str + '\n')
+
+    return None
 
 
 def fluxional_mode(atom_indices, span=6.28319):
@@ -26,7 +26,9 @@ ${well_lump_str}
 !---------------------------------------------------
 !  REACTION CHANNELS SECTION
 !---------------------------------------------------
+% for rxn_chan_str in rxn_chan_strs:
 ${rxn_chan_str}
+% endfor
 End  ! Model
 !
 !===================================================
@@ -5,11 +5,28 @@
 """
 
 from distutils.core import setup
+from distutils.command.build_py import build_py
+
+
+class BuildPyWithTemplates(build_py):
+    """ Also precompile the packaged Mako templates into Python modules,
+        so that new processes import them rather than compiling them
+    """
+
+    def run(self):
+        build_py.run(self)
+        try:
+            import ioformat
+        except ImportError:
+            print('ioformat not found: templates will be compiled on use')
+        else:
+            ioformat.precompile_templates(self.build_lib)
 
 
 setup(
     name="autoio-interfaces",
     version="0.10.2",
+    cmdclass={'build_py': BuildPyWithTemplates},
     packages=[
         'autorun',
         'elstruct',